@@ -0,0 +1,107 @@
+"""
+Tool Signature Manifest
+=======================
+
+Records the parameter signatures of every ADK tool exposed by the agent tree
+as data, so signature drift shows up as a diff of tool_manifest.json.
+
+Regenerate the manifest after changing a tool:
+
+    python -m src.adk_agents.tool_manifest
+"""
+
+import hashlib
+import inspect
+import json
+from pathlib import Path
+from typing import Any, Dict, get_type_hints
+
+MANIFEST_PATH = Path(__file__).with_name('tool_manifest.json')
+
+
+def _tool_signature(tool) -> Dict[str, Any]:
+    """
+    Describe a tool's parameters.
+    
+    Args:
+        tool: Tool function
+    
+    Returns:
+        Dictionary with a 'params' list of
+        [name, annotation, default_is_none] entries
+    """
+    hints = get_type_hints(tool)
+    params = []
+    for name, param in inspect.signature(tool).parameters.items():
+        annotation = inspect.formatannotation(hints[name]) if name in hints else ''
+        params.append([name, annotation, param.default is None])
+    return {'params': params}
+
+
+def build_tool_manifest(agent) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the signature manifest of an agent and all its sub-agents.
+    
+    Args:
+        agent: Root ADK agent
+    
+    Returns:
+        Dictionary mapping tool names to their signatures
+    """
+    manifest = {}
+    pending = [agent]
+    while pending:
+        current = pending.pop()
+        for tool in getattr(current, 'tools', None) or ():
+            manifest[tool.__name__] = _tool_signature(tool)
+        pending.extend(getattr(current, 'sub_agents', None) or ())
+    return dict(sorted(manifest.items()))
+
+
+def manifest_digest(manifest: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Hash a manifest independently of key order.
+    
+    Args:
+        manifest: Manifest as returned by build_tool_manifest
+    
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(manifest, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_tool_manifest() -> Dict[str, Dict[str, Any]]:
+    """
+    Load the committed manifest.
+    
+    Returns:
+        Dictionary mapping tool names to their signatures
+    """
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def write_tool_manifest(agent) -> Dict[str, Dict[str, Any]]:
+    """
+    Regenerate the committed manifest from an agent.
+    
+    Args:
+        agent: Root ADK agent
+    
+    Returns:
+        The manifest that was written
+    """
+    manifest = build_tool_manifest(agent)
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    return manifest
+
+
+if __name__ == "__main__":
+    from src.agent import root_agent
+    
+    manifest = write_tool_manifest(root_agent)
+    print(f"Wrote {len(manifest)} tool signatures to {MANIFEST_PATH}")
@@ -8,6 +8,7 @@ capabilities for intelligent trading strategy execution and analysis.
 
 import os
 import asyncio
+from functools import cached_property
 from typing import Dict, Any, Optional, Type, List, Union
 from datetime import datetime, date
 import json
@@ -138,9 +139,8 @@ class TradingAgent:
         self.name = name
         self.model = model
         self.initial_cash = initial_cash
-        self.session_service = None
-        self.runner = None
         self.agent = None
+        self.current_session_id = None
         self.data_provider = DataProvider()
         self.backtest_engine = BacktestEngine(initial_cash=initial_cash)
         self.current_results = None
@@ -148,6 +148,20 @@ class TradingAgent:
         # Initialize ADK agent
         self._setup_agent()
         
+    @cached_property
+    def session_service(self) -> InMemorySessionService:
+        """In-memory session store, created on first use and shared by all sessions."""
+        return InMemorySessionService()
+    
+    @cached_property
+    def runner(self) -> Runner:
+        """ADK runner for the agent, created on first use."""
+        return Runner(
+            agent=self.agent,
+            session_service=self.session_service,
+            app_name="trading_agent_app"  # Add the required app_name parameter
+        )
+        
     def _setup_agent(self):
         """Set up the ADK agent with trading tools."""
         self.agent = Agent(
@@ -187,21 +201,14 @@ You can execute the following actions:
     async def setup_session(self, user_id: str = "trader_1", session_id: str = None):
         """Set up session for conversation with the agent."""
         if session_id is None:
-            session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
             
-        self.session_service = InMemorySessionService()
         session = await self.session_service.create_session(
             app_name="trading_agent_app",
             session_id=session_id,
             user_id=user_id  # Add the required user_id parameter
         )
         
-        self.runner = Runner(
-            agent=self.agent,
-            session_service=self.session_service,
-            app_name="trading_agent_app"  # Add the required app_name parameter
-        )
-        
         # Store session_id for later use
         self.current_session_id = session_id
         
@@ -235,11 +242,7 @@ You can execute the following actions:
                 
             # Use provided data feed or generate synthetic data
             if data_feed is None:
-                data_feed = self.data_provider.generate_synthetic(
-                    start_date=start_date,
-                    end_date=end_date,
-                    initial_price=100
-                )
+                data_feed = self._load_data(start_date, end_date)
             
             
             # Map strategy names to classes
@@ -292,6 +295,66 @@ You can execute the following actions:
                 'success': False
             }
             
+    def _load_data(self, start_date: str, end_date: str) -> DataFeed:
+        """
+        Load the market data used for agent backtests.
+        
+        Args:
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+            
+        Returns:
+            Synthetic data feed for the date range
+        """
+        return self.data_provider.generate_synthetic(
+            start_date=start_date,
+            end_date=end_date,
+            initial_price=100
+        )
+    
+    def run_backtests(self,
+                      strategies: List[str],
+                      start_date: str,
+                      end_date: str,
+                      strategy_params: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several strategies against the same market data.
+        
+        The data is loaded once and shared by every backtest, so the results
+        are directly comparable.
+        
+        Args:
+            strategies: Strategy names (e.g., ['sma', 'rsi', 'bollinger'])
+            start_date: Start date for backtest (YYYY-MM-DD format)
+            end_date: End date for backtest (YYYY-MM-DD format)
+            strategy_params: Optional parameters per strategy name
+            
+        Returns:
+            Dictionary of backtest results keyed by strategy name
+        """
+        if not start_date:
+            start_date = "2022-01-01"
+        if not end_date:
+            end_date = "2023-12-31"
+        strategy_params = strategy_params or {}
+        
+        try:
+            data_feed = self._load_data(start_date, end_date)
+        except Exception as e:
+            error = {'error': f"Backtest failed: {str(e)}", 'success': False}
+            return {name: dict(error) for name in strategies}
+        
+        return {
+            name: self.run_backtest(
+                strategy_name=name,
+                start_date=start_date,
+                end_date=end_date,
+                strategy_params=strategy_params.get(name),
+                data_feed=data_feed
+            )
+            for name in strategies
+        }
+    
     def analyze_strategy_performance(self, results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Analyze the performance of a strategy backtest.
@@ -494,7 +557,7 @@ You can execute the following actions:
         Returns:
             Agent's response
         """
-        if not self.runner:
+        if self.current_session_id is None:
             if session_id is None:
                 session_id = await self.setup_session(user_id)
             else:
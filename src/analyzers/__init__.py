@@ -3,12 +3,31 @@ Analyzers Module
 ===============
 
 This module contains various analyzers for performance analysis.
+
+Exports are resolved on first access (PEP 562) so importing the package
+does not pull in backtrader until an analyzer is actually used.
 """
 
-from .performance import PerformanceAnalyzer
-from .trades import TradeAnalyzer
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    'PerformanceAnalyzer': '.performance',
+    'TradeAnalyzer': '.trades'
+}
 
 __all__ = [
     'PerformanceAnalyzer',
     'TradeAnalyzer'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,30 @@
 """
 Backtesting module for trading strategy testing.
+
+Exports are resolved on first access (PEP 562) so importing the package
+does not pull in backtrader until the engine is actually used.
 """
 
-from .engine import BacktestEngine, print_performance_summary
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    'BacktestEngine': '.engine',
+    'print_performance_summary': '.engine'
+}
 
 __all__ = [
     'BacktestEngine',
     'print_performance_summary'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -285,8 +285,8 @@ class BacktestEngine:
         results_dict = {
             'strategy_name': strategy_class.__name__,
             'data_feed_name': data_feed.name,
-            'start_date': data_stats['data_info']['start_date'],
-            'end_date': data_stats['data_info']['end_date'],
+            'start_date': data_stats.data_info.start_date,
+            'end_date': data_stats.data_info.end_date,
             'initial_cash': self.initial_cash,
             'final_cash': final_value,
             'total_return': total_return,
@@ -300,7 +300,7 @@ class BacktestEngine:
             'win_rate': win_rate,
             'avg_trade_return': avg_trade_return,
             'strategy_params': strategy_params or {},
-            'data_info': data_stats['data_info'],
+            'data_info': data_stats.data_info.to_dict(),
             'data_metadata': data_feed.metadata,
             'trades': trade_list,
             'commission': self.commission
@@ -324,7 +324,8 @@ class BacktestEngine:
             Database ID of saved results
         """
         if db_manager is None:
-            db_manager = DatabaseManager()
+            with DatabaseManager() as db_manager:
+                return db_manager.save_backtest_result(results)
         
         return db_manager.save_backtest_result(results)
     
@@ -0,0 +1,321 @@
+"""
+Vectorized Backtests
+===================
+
+Array-based versions of the threshold strategies for fast parameter sweeps.
+
+These skip backtrader's event loop: indicators are computed once with NumPy
+and a compiled loop walks the closes. Orders fill at the close of the signal
+bar and a position still open at the end is not counted, so results are an
+approximation of the backtrader strategies, meant for ranking parameters
+before running the full engine on the best candidates.
+"""
+
+import numpy as np
+from functools import lru_cache
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import prange
+except ImportError:
+    prange = range
+
+
+# One record per closed trade; pnl is the fractional return per unit
+TRADE_DTYPE = np.dtype([('entry_i', 'i8'), ('exit_i', 'i8'), ('pnl', 'f8')])
+
+
+def _simulate(close, entry, exit_, stop_loss, take_profit, entry_idx, exit_idx, pnl) -> int:
+    """
+    Walk the closes, entering on entry signals and exiting on stop-loss,
+    take-profit or exit signals (checked in that order).
+    
+    Returns:
+        Number of closed trades written to the output buffers
+    """
+    n_trades = 0
+    in_position = False
+    buy_price = 0.0
+    sl_price = 0.0
+    tp_price = 0.0
+    entry_i = 0
+    
+    for i in range(close.shape[0]):
+        price = close[i]
+        if not in_position:
+            if entry[i]:
+                in_position = True
+                buy_price = price
+                sl_price = price * (1 - stop_loss)
+                tp_price = price * (1 + take_profit)
+                entry_i = i
+        elif price <= sl_price or price >= tp_price or exit_[i]:
+            entry_idx[n_trades] = entry_i
+            exit_idx[n_trades] = i
+            pnl[n_trades] = price / buy_price - 1.0
+            n_trades += 1
+            in_position = False
+    
+    return n_trades
+
+
+def _sweep_mean_reversion(close, periods, thresholds, stop_loss, take_profit, out):
+    """
+    Total fractional return of the mean-reversion rules for every
+    (period, threshold) pair, parallelized over the parameter grid.
+    """
+    n = close.shape[0]
+    n_thresholds = thresholds.shape[0]
+    
+    csum = np.zeros(n + 1)
+    for i in range(n):
+        csum[i + 1] = csum[i] + close[i]
+    
+    for k in prange(periods.shape[0] * n_thresholds):
+        period = periods[k // n_thresholds]
+        threshold = thresholds[k % n_thresholds]
+        
+        total = 0.0
+        in_position = False
+        buy_price = 0.0
+        sl_price = 0.0
+        tp_price = 0.0
+        for i in range(period - 1, n):
+            sma = (csum[i + 1] - csum[i + 1 - period]) / period
+            price = close[i]
+            if not in_position:
+                if (sma - price) / sma >= threshold:
+                    in_position = True
+                    buy_price = price
+                    sl_price = price * (1 - stop_loss)
+                    tp_price = price * (1 + take_profit)
+            elif price <= sl_price or price >= tp_price or price >= sma:
+                total += price / buy_price - 1.0
+                in_position = False
+        
+        out[k // n_thresholds, k % n_thresholds] = total
+
+
+@lru_cache(maxsize=1)
+def _get_kernels():
+    """
+    Compile the simulation kernels with Numba on first use.
+    
+    Returns:
+        (simulate, sweep_mean_reversion) callables; the pure Python versions
+        if numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _simulate, _sweep_mean_reversion
+    return (
+        njit(cache=True)(_simulate),
+        njit(cache=True, parallel=True)(_sweep_mean_reversion)
+    )
+
+
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average, NaN until the first full window.
+    
+    Args:
+        values: Input series
+        period: Window length
+    
+    Returns:
+        Array of the same length as values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape[0], np.nan)
+    if 0 < period <= values.shape[0]:
+        csum = np.cumsum(np.concatenate(([0.0], values)))
+        out[period - 1:] = (csum[period:] - csum[:-period]) / period
+    return out
+
+
+def rolling_std(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Population standard deviation over a moving window (as backtrader's StdDev).
+    
+    Args:
+        values: Input series
+        period: Window length
+    
+    Returns:
+        Array of the same length as values, NaN until the first full window
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape[0], np.nan)
+    if 0 < period <= values.shape[0]:
+        out[period - 1:] = sliding_window_view(values, period).std(axis=1)
+    return out
+
+
+def run_signals(
+    close: np.ndarray,
+    entry: np.ndarray,
+    exit_: np.ndarray,
+    stop_loss: float,
+    take_profit: float
+) -> np.ndarray:
+    """
+    Simulate long-only trades from precomputed entry/exit signals.
+    
+    Args:
+        close: Close prices
+        entry: Boolean entry signal per bar
+        exit_: Boolean exit signal per bar
+        stop_loss: Stop-loss as a fraction of the entry price
+        take_profit: Take-profit as a fraction of the entry price
+    
+    Returns:
+        Structured array of closed trades with TRADE_DTYPE
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    simulate, _ = _get_kernels()
+    
+    capacity = close.shape[0] // 2 + 1
+    trades = np.empty(capacity, dtype=TRADE_DTYPE)
+    entry_idx = np.empty(capacity, dtype=np.int64)
+    exit_idx = np.empty(capacity, dtype=np.int64)
+    pnl = np.empty(capacity, dtype=np.float64)
+    
+    n_trades = simulate(
+        close,
+        np.ascontiguousarray(entry, dtype=np.bool_),
+        np.ascontiguousarray(exit_, dtype=np.bool_),
+        float(stop_loss),
+        float(take_profit),
+        entry_idx,
+        exit_idx,
+        pnl
+    )
+    
+    trades['entry_i'] = entry_idx
+    trades['exit_i'] = exit_idx
+    trades['pnl'] = pnl
+    return trades[:n_trades]
+
+
+def run_mean_reversion(
+    close: np.ndarray,
+    period: int = 20,
+    threshold: float = 0.02,
+    stop_loss: float = 0.05,
+    take_profit: float = 0.08
+) -> np.ndarray:
+    """
+    Vectorized MeanReversionStrategy: buy when price is below its SMA by
+    threshold, sell when it returns to the SMA.
+    
+    Args:
+        close: Close prices
+        period: SMA period
+        threshold: Minimum fractional deviation below the SMA to enter
+        stop_loss: Stop-loss as a fraction of the entry price
+        take_profit: Take-profit as a fraction of the entry price
+    
+    Returns:
+        Structured array of closed trades with TRADE_DTYPE
+    """
+    close = np.asarray(close, dtype=np.float64)
+    sma = rolling_mean(close, period)
+    with np.errstate(invalid='ignore'):
+        entry = (sma - close) / sma >= threshold
+        exit_ = close >= sma
+    return run_signals(close, entry, exit_, stop_loss, take_profit)
+
+
+def run_momentum(
+    close: np.ndarray,
+    period: int = 10,
+    momentum_threshold: float = 0.02,
+    stop_loss: float = 0.05,
+    take_profit: float = 0.12
+) -> np.ndarray:
+    """
+    Vectorized MomentumStrategy: buy when the return over period bars
+    exceeds the threshold, sell when it turns negative.
+    
+    Args:
+        close: Close prices
+        period: Lookback in bars
+        momentum_threshold: Minimum momentum to enter
+        stop_loss: Stop-loss as a fraction of the entry price
+        take_profit: Take-profit as a fraction of the entry price
+    
+    Returns:
+        Structured array of closed trades with TRADE_DTYPE
+    """
+    close = np.asarray(close, dtype=np.float64)
+    momentum = np.full(close.shape[0], np.nan)
+    momentum[period:] = close[period:] / close[:-period] - 1.0
+    with np.errstate(invalid='ignore'):
+        entry = momentum > momentum_threshold
+        exit_ = momentum < 0
+    return run_signals(close, entry, exit_, stop_loss, take_profit)
+
+
+def run_bollinger(
+    close: np.ndarray,
+    period: int = 20,
+    devfactor: float = 2.0,
+    stop_loss: float = 0.05,
+    take_profit: float = 0.10
+) -> np.ndarray:
+    """
+    Vectorized BollingerBandsStrategy: buy at the lower band, sell at the
+    upper band.
+    
+    Args:
+        close: Close prices
+        period: Band period
+        devfactor: Band width in standard deviations
+        stop_loss: Stop-loss as a fraction of the entry price
+        take_profit: Take-profit as a fraction of the entry price
+    
+    Returns:
+        Structured array of closed trades with TRADE_DTYPE
+    """
+    close = np.asarray(close, dtype=np.float64)
+    mid = rolling_mean(close, period)
+    width = devfactor * rolling_std(close, period)
+    with np.errstate(invalid='ignore'):
+        entry = close <= mid - width
+        exit_ = close >= mid + width
+    return run_signals(close, entry, exit_, stop_loss, take_profit)
+
+
+def sweep_mean_reversion(
+    close: np.ndarray,
+    periods,
+    thresholds,
+    stop_loss: float = 0.05,
+    take_profit: float = 0.08
+) -> np.ndarray:
+    """
+    Total fractional return of run_mean_reversion over a parameter grid.
+    
+    The grid is evaluated in parallel when numba is installed.
+    
+    Args:
+        close: Close prices
+        periods: SMA periods to try
+        thresholds: Entry thresholds to try
+        stop_loss: Stop-loss as a fraction of the entry price
+        take_profit: Take-profit as a fraction of the entry price
+    
+    Returns:
+        Array of shape (len(periods), len(thresholds))
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    periods = np.ascontiguousarray(periods, dtype=np.int64)
+    thresholds = np.ascontiguousarray(thresholds, dtype=np.float64)
+    if periods.size and (periods.min() < 1 or periods.max() > close.shape[0]):
+        raise ValueError(f"Periods must be between 1 and {close.shape[0]}")
+    
+    _, sweep = _get_kernels()
+    out = np.empty((periods.shape[0], thresholds.shape[0]))
+    sweep(close, periods, thresholds, float(stop_loss), float(take_profit), out)
+    return out
@@ -7,10 +7,85 @@ Generates synthetic trading data for testing and research purposes.
 
 import pandas as pd
 import numpy as np
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, List, Dict, Any
 from .validators import DataValidator
 
 
+def _mean_reverting_path(initial_price, mean_reversion_speed, shocks):
+    """
+    Ornstein-Uhlenbeck price path around the initial price.
+    
+    Args:
+        initial_price: Starting price, also the long-term mean
+        mean_reversion_speed: Speed of mean reversion
+        shocks: volatility * N(0, 1) draw for every step after the first bar
+    
+    Returns:
+        Prices, one more than the number of shocks
+    """
+    prices = np.empty(shocks.shape[0] + 1)
+    prices[0] = initial_price
+    long_term_mean = initial_price
+    dt = 1.0  # Daily timestep
+    
+    for i in range(shocks.shape[0]):
+        current_price = prices[i]
+        drift_component = mean_reversion_speed * (long_term_mean - current_price) * dt
+        new_price = current_price + drift_component + current_price * shocks[i]
+        prices[i + 1] = max(new_price, 0.01)  # Prevent negative prices
+    
+    return prices
+
+
+def _regime_switching_path(initial_price, durations, drifts, volatilities, normals):
+    """
+    Compounded price path cycling through (duration, drift, volatility) regimes.
+    
+    Args:
+        initial_price: Starting price
+        durations: Days spent in each regime before switching to the next
+        drifts: Daily drift of each regime
+        volatilities: Daily volatility of each regime
+        normals: N(0, 1) draw for every step after the first bar
+    
+    Returns:
+        Prices, one more than the number of draws
+    """
+    prices = np.empty(normals.shape[0] + 1)
+    prices[0] = initial_price
+    current_regime = 0
+    days_in_regime = 0
+    
+    for i in range(normals.shape[0]):
+        # Check if we need to switch regimes
+        if days_in_regime >= durations[current_regime]:
+            current_regime = (current_regime + 1) % durations.shape[0]
+            days_in_regime = 0
+        
+        ret = drifts[current_regime] + volatilities[current_regime] * normals[i]
+        prices[i + 1] = max(prices[i] * (1 + ret), 0.01)
+        days_in_regime += 1
+    
+    return prices
+
+
+@lru_cache(maxsize=1)
+def _get_kernels():
+    """
+    Compile the path-dependent price recursions with Numba on first use.
+    
+    Returns:
+        (mean_reverting_path, regime_switching_path) callables; the pure
+        Python versions if numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _mean_reverting_path, _regime_switching_path
+    return njit(cache=True)(_mean_reverting_path), njit(cache=True)(_regime_switching_path)
+
+
 class SyntheticDataGenerator:
     """Generates synthetic OHLCV trading data."""
     
@@ -37,62 +112,77 @@ class SyntheticDataGenerator:
         Returns:
             DataFrame with synthetic OHLCV data
         """
-        if seed is not None:
-            np.random.seed(seed)
+        # Same model as generate_many, drawn from a local Generator so the
+        # global NumPy random state is left untouched
+        return self.generate_many(
+            [{'initial_price': initial_price, 'volatility': volatility, 'drift': drift}],
+            start_date=start_date,
+            end_date=end_date,
+            seed=seed
+        )[0]
+    
+    def generate_many(
+        self,
+        specs: List[Dict[str, Any]],
+        start_date: str = '2020-01-01',
+        end_date: str = '2023-12-31',
+        seed: Optional[int] = None
+    ) -> List[pd.DataFrame]:
+        """
+        Generate several synthetic OHLCV series in one vectorized batch.
+        
+        All series share one date range and are drawn together as
+        (n_series, n_days) matrices, so the cost per extra series is a few
+        NumPy rows rather than a full Python loop over bars.
         
-        # Generate date range
+        Args:
+            specs: Per-series parameters; each dict may set 'initial_price',
+                'volatility' and 'drift' (defaults match generate())
+            start_date: Start date in 'YYYY-MM-DD' format
+            end_date: End date in 'YYYY-MM-DD' format
+            seed: Random seed for reproducibility
+            
+        Returns:
+            List of DataFrames with synthetic OHLCV data, in the order of specs
+        """
+        rng = np.random.default_rng(seed)
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
+        shape = (len(specs), len(dates))
         
-        # Generate price series using geometric Brownian motion
-        returns = np.random.normal(drift, volatility, len(dates))
-        prices = [initial_price]
+        initial_price = np.array([spec.get('initial_price', 100.0) for spec in specs], dtype=np.float64)[:, None]
+        volatility = np.array([spec.get('volatility', 0.02) for spec in specs], dtype=np.float64)[:, None]
+        drift = np.array([spec.get('drift', 0.0005) for spec in specs], dtype=np.float64)[:, None]
         
-        for ret in returns[1:]:
-            new_price = prices[-1] * (1 + ret)
-            prices.append(max(new_price, 0.01))  # Prevent negative prices
+        # Geometric Brownian motion; the first bar is the initial price
+        returns = rng.normal(drift, volatility, shape)
+        returns[:, 0] = 0.0
+        close = np.maximum(initial_price * np.cumprod(1 + returns, axis=1), 0.01)  # Prevent negative prices
         
-        # Generate OHLCV data
-        data = []
-        for i, (date, close_price) in enumerate(zip(dates, prices)):
-            # Generate intraday volatility
-            intraday_vol = volatility * 0.3
-            
-            # Generate open price (based on previous close + gap)
-            if i == 0:
-                open_price = close_price
-            else:
-                gap = np.random.normal(0, intraday_vol * 0.5)
-                open_price = max(prices[i-1] * (1 + gap), 0.01)
-            
-            # Generate high and low
-            high_factor = 1 + abs(np.random.normal(0, intraday_vol))
-            low_factor = 1 - abs(np.random.normal(0, intraday_vol))
-            
-            high_price = max(open_price, close_price) * high_factor
-            low_price = min(open_price, close_price) * low_factor
-            
-            # Ensure OHLC relationships are valid
-            high_price = max(high_price, open_price, close_price)
-            low_price = min(low_price, open_price, close_price)
-            
-            # Generate volume (log-normal distribution)
-            volume = int(np.random.lognormal(mean=11, sigma=0.5))  # Around 100k average
-            
-            data.append({
-                'date': date,
-                'open': round(open_price, 2),
-                'high': round(high_price, 2),
-                'low': round(low_price, 2),
-                'close': round(close_price, 2),
-                'volume': volume
-            })
+        # Open from previous close plus a gap, high/low around the open-close range
+        intraday_vol = volatility * 0.3
+        gap = rng.normal(0.0, intraday_vol * 0.5, shape)
+        open_ = np.empty(shape)
+        open_[:, 0] = close[:, 0]
+        open_[:, 1:] = np.maximum(close[:, :-1] * (1 + gap[:, 1:]), 0.01)
         
-        df = pd.DataFrame(data)
+        high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0.0, intraday_vol, shape)))
+        low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0.0, intraday_vol, shape)))
+        volume = rng.lognormal(mean=11, sigma=0.5, size=shape).astype(np.int64)  # Around 100k average
         
-        # Validate the generated data
-        DataValidator.validate_ohlcv_data(df)
+        frames = []
+        for i in range(len(specs)):
+            df = pd.DataFrame({
+                'date': dates,
+                'open': np.round(open_[i], 2),
+                'high': np.round(high[i], 2),
+                'low': np.round(low[i], 2),
+                'close': np.round(close[i], 2),
+                'volume': volume[i]
+            })
+            DataValidator.validate_ohlcv_data(df)
+            frames.append(df)
         
-        return df
+        return frames
     
     def generate_trending_data(
         self,
@@ -184,26 +274,11 @@ class SyntheticDataGenerator:
         
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        # Generate mean-reverting price series
-        prices = [initial_price]
-        long_term_mean = initial_price
-        
-        for i in range(1, len(dates)):
-            # Ornstein-Uhlenbeck process
-            dt = 1.0  # Daily timestep
-            current_price = prices[-1]
-            
-            # Mean reversion component
-            drift_component = mean_reversion_speed * (long_term_mean - current_price) * dt
-            
-            # Random component
-            random_component = volatility * np.sqrt(dt) * np.random.normal()
-            
-            # Calculate new price
-            new_price = current_price + drift_component + current_price * random_component
-            new_price = max(new_price, 0.01)  # Prevent negative prices
-            
-            prices.append(new_price)
+        # Generate mean-reverting price series; the shocks are drawn up front
+        # in the same order the step-by-step loop used to draw them
+        shocks = volatility * np.sqrt(1.0) * np.random.standard_normal(max(len(dates) - 1, 0))
+        mean_reverting_path, _ = _get_kernels()
+        prices = mean_reverting_path(float(initial_price), float(mean_reversion_speed), shocks)
         
         # Generate OHLCV data using the same logic as the main generator
         return self._generate_ohlcv_from_closes(dates, prices, volatility)
@@ -241,27 +316,11 @@ class SyntheticDataGenerator:
             ]
         
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
-        prices = [initial_price]
+        durations, drifts, volatilities = (np.array(column, dtype=np.float64) for column in zip(*regimes))
         
-        current_regime = 0
-        days_in_regime = 0
-        
-        for i in range(1, len(dates)):
-            # Check if we need to switch regimes
-            if days_in_regime >= regimes[current_regime][0]:
-                current_regime = (current_regime + 1) % len(regimes)
-                days_in_regime = 0
-            
-            # Get current regime parameters
-            _, drift, volatility = regimes[current_regime]
-            
-            # Generate return for current regime
-            ret = np.random.normal(drift, volatility)
-            new_price = prices[-1] * (1 + ret)
-            new_price = max(new_price, 0.01)
-            
-            prices.append(new_price)
-            days_in_regime += 1
+        normals = np.random.standard_normal(max(len(dates) - 1, 0))
+        _, regime_switching_path = _get_kernels()
+        prices = regime_switching_path(float(initial_price), durations, drifts, volatilities, normals)
         
         return self._generate_ohlcv_from_closes(dates, prices, 0.02)
     
@@ -276,48 +335,47 @@ class SyntheticDataGenerator:
         
         Args:
             dates: Date index
-            close_prices: List of close prices
+            close_prices: Close prices (list or array)
             base_volatility: Base volatility for intraday movements
             
         Returns:
             DataFrame with OHLCV data
         """
-        data = []
+        n = len(dates)
+        close = np.asarray(close_prices, dtype=np.float64)[:n]
+        intraday_vol = base_volatility * 0.3
         
-        for i, (date, close_price) in enumerate(zip(dates, close_prices)):
-            intraday_vol = base_volatility * 0.3
-            
-            # Generate open price
-            if i == 0:
-                open_price = close_price
-            else:
-                gap = np.random.normal(0, intraday_vol * 0.5)
-                open_price = max(close_prices[i-1] * (1 + gap), 0.01)
-            
-            # Generate high and low
-            high_factor = 1 + abs(np.random.normal(0, intraday_vol))
-            low_factor = 1 - abs(np.random.normal(0, intraday_vol))
-            
-            high_price = max(open_price, close_price) * high_factor
-            low_price = min(open_price, close_price) * low_factor
-            
-            # Ensure OHLC relationships
-            high_price = max(high_price, open_price, close_price)
-            low_price = min(low_price, open_price, close_price)
-            
-            # Generate volume
-            volume = int(np.random.lognormal(mean=11, sigma=0.5))
-            
-            data.append({
-                'date': date,
-                'open': round(open_price, 2),
-                'high': round(high_price, 2),
-                'low': round(low_price, 2),
-                'close': round(close_price, 2),
-                'volume': volume
-            })
+        # Every bar draws (gap,) high, low and volume normals in that order,
+        # the first bar without a gap; draw them all at once and split
+        draws = np.random.standard_normal(max(4 * n - 1, 0))
+        gap = draws[3::4]
+        high_draw = np.r_[draws[:1], draws[4::4]]
+        low_draw = np.r_[draws[1:2], draws[5::4]]
+        volume_draw = np.r_[draws[2:3], draws[6::4]]
         
-        df = pd.DataFrame(data)
+        # Generate open prices
+        open_ = close.copy()
+        open_[1:] = np.maximum(close[:-1] * (1 + (intraday_vol * 0.5) * gap), 0.01)
+        
+        # Generate high and low
+        high_factor = 1 + np.abs(intraday_vol * high_draw)
+        low_factor = 1 - np.abs(intraday_vol * low_draw)
+        
+        # Ensure OHLC relationships
+        high = np.maximum(np.maximum(open_, close) * high_factor, np.maximum(open_, close))
+        low = np.minimum(np.minimum(open_, close) * low_factor, np.minimum(open_, close))
+        
+        # Generate volume
+        volume = np.exp(11 + 0.5 * volume_draw).astype(np.int64)
+        
+        df = pd.DataFrame({
+            'date': dates,
+            'open': np.round(open_, 2),
+            'high': np.round(high, 2),
+            'low': np.round(low, 2),
+            'close': np.round(close, 2),
+            'volume': volume
+        })
         DataValidator.validate_ohlcv_data(df)
         return df
 
@@ -376,44 +434,32 @@ def generate_random_walk(
     Returns:
         DataFrame with random walk OHLCV data
     """
-    if seed is not None:
-        np.random.seed(seed)
-    
-    # Generate date range
+    rng = np.random.default_rng(seed)
     dates = pd.date_range(start=start_date, end=end_date, freq='D')
+    n = len(dates)
     
-    # Generate random walk prices
-    prices = [initial_price]
-    for _ in range(len(dates) - 1):
-        step = np.random.uniform(-step_size, step_size)
-        new_price = max(prices[-1] + step, 0.01)  # Prevent negative prices
-        prices.append(new_price)
-    
-    # Create OHLCV data
-    data = []
-    for i, (date, price) in enumerate(zip(dates, prices)):
-        # Generate random OHLC around the close price
-        noise = np.random.normal(0, 0.5, 3)
-        high = price + abs(noise[0])
-        low = price - abs(noise[1])
-        open_price = price + noise[2]
-        
-        data.append({
-            'date': date,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': price,
-            'volume': np.random.randint(100000, 1000000)
-        })
-    
-    df = pd.DataFrame(data)
+    # Random walk floored at 0.01: p[i] = max(p[i-1] + step[i], 0.01). With
+    # S the cumulative steps, p - S only ever rises to 0.01 - S, so the whole
+    # path is one running maximum instead of a per-bar loop
+    walk = np.concatenate(([0.0], np.cumsum(rng.uniform(-step_size, step_size, max(n - 1, 0)))))[:n]
+    floor = np.concatenate(([initial_price], 0.01 - walk[1:]))
+    close = np.maximum(walk + np.maximum.accumulate(floor), 0.01)  # Absorb rounding at the floor
     
-    # Validate data
-    validator = DataValidator()
-    if not validator.validate_ohlcv(df):
-        raise ValueError("Generated data failed validation")
+    # Random OHLC around the close price, open kept inside the bar's range
+    noise = rng.normal(0.0, 0.5, (n, 3))
+    high = close + np.abs(noise[:, 0])
+    low = np.maximum(close - np.abs(noise[:, 1]), 0.0)
+    open_ = np.clip(close + noise[:, 2], low, high)
     
+    df = pd.DataFrame({
+        'date': dates,
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': rng.integers(100000, 1000000, n)
+    })
+    DataValidator.validate_ohlcv_data(df)
     return df
 
 
@@ -8,16 +8,41 @@ Provides data loading capabilities from various sources including CSV files and
 import pandas as pd
 import numpy as np
 import os
-from typing import Optional
+import importlib.util
+from pathlib import Path
+from typing import Optional, Union
 from abc import ABC, abstractmethod
 from .validators import DataValidator
 import requests
 import time
 import hmac
 import hashlib
+import json
 from urllib.parse import urlencode
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Kline interval lengths in milliseconds ('1M' rounded up to 31 days)
+_MINUTE_MS = 60_000
+_BINANCE_INTERVAL_MS = {
+    '1m': _MINUTE_MS, '3m': 3 * _MINUTE_MS, '5m': 5 * _MINUTE_MS,
+    '15m': 15 * _MINUTE_MS, '30m': 30 * _MINUTE_MS,
+    '1h': 60 * _MINUTE_MS, '2h': 120 * _MINUTE_MS, '4h': 240 * _MINUTE_MS,
+    '6h': 360 * _MINUTE_MS, '8h': 480 * _MINUTE_MS, '12h': 720 * _MINUTE_MS,
+    '1d': 1440 * _MINUTE_MS, '3d': 3 * 1440 * _MINUTE_MS,
+    '1w': 7 * 1440 * _MINUTE_MS, '1M': 31 * 1440 * _MINUTE_MS
+}
+
+
+def _has_parquet_engine() -> bool:
+    """Check whether pandas can read and write Parquet files."""
+    return any(importlib.util.find_spec(name) is not None for name in ('pyarrow', 'fastparquet'))
+
 
 class BaseDataLoader(ABC):
     """Abstract base class for data loaders."""
@@ -310,18 +335,98 @@ class APILoader(BaseDataLoader):
 class BinanceLoader(BaseDataLoader):
     """Loads cryptocurrency trading data from Binance API."""
     
-    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_ttl: Optional[float] = None
+    ):
         """
         Initialize Binance loader.
         
         Args:
             api_key: Binance API key (optional for public market data)
             api_secret: Binance API secret (optional for public market data)
+            cache_dir: Directory for caching closed historical kline ranges
+                (defaults to the BINANCE_CACHE_DIR environment variable;
+                caching is off when neither is set)
+            cache_ttl: Seconds to reuse raw unsigned API responses from
+                cache_dir (defaults to the BINANCE_CACHE_TTL environment
+                variable; off when neither is set)
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = "https://api.binance.com"
         
+        cache_dir = cache_dir or os.environ.get('BINANCE_CACHE_DIR')
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        
+        if cache_ttl is None and os.environ.get('BINANCE_CACHE_TTL'):
+            cache_ttl = float(os.environ['BINANCE_CACHE_TTL'])
+        self.cache_ttl = cache_ttl
+    
+    def _cache_path(self, params: dict) -> Optional[Path]:
+        """
+        Get the cache file for a kline request, if it may be cached.
+        
+        Only requests with an explicit start and end whose last candle has
+        already closed are cached, since those can no longer change. Setting
+        BINANCE_NO_CACHE bypasses the cache.
+        
+        Args:
+            params: Kline request parameters
+            
+        Returns:
+            Path of the cache file, or None if the request is not cacheable
+        """
+        if self.cache_dir is None or os.environ.get('BINANCE_NO_CACHE'):
+            return None
+        if 'startTime' not in params or 'endTime' not in params:
+            return None
+        
+        now_ms = int(time.time() * 1000)
+        if params['endTime'] + _BINANCE_INTERVAL_MS[params['interval']] > now_ms:
+            return None
+        
+        suffix = '.parquet' if _has_parquet_engine() else '.pkl'
+        key = f"{params['symbol']}_{params['interval']}_{params['startTime']}_{params['endTime']}_{params['limit']}"
+        return self.cache_dir / f"{key}{suffix}"
+    
+    @staticmethod
+    def _read_cache(path: Path) -> pd.DataFrame:
+        """Read a cached kline frame."""
+        if path.suffix == '.parquet':
+            return pd.read_parquet(path)
+        return pd.read_pickle(path)
+    
+    @staticmethod
+    def _write_cache(path: Path, df: pd.DataFrame):
+        """Write a kline frame to the cache, replacing the file atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        if path.suffix == '.parquet':
+            df.to_parquet(tmp_path, compression='snappy', index=False)
+        else:
+            df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    
+    def _response_cache_path(self, url: str, params: dict) -> Optional[Path]:
+        """
+        Get the cache file for a raw API response, if responses are cached.
+        
+        Args:
+            url: Request URL
+            params: Request parameters
+        
+        Returns:
+            Path of the cache file, or None if response caching is off
+        """
+        if self.cache_dir is None or self.cache_ttl is None or os.environ.get('BINANCE_NO_CACHE'):
+            return None
+        key = f"{url}|{urlencode(sorted(params.items()))}"
+        return self.cache_dir / 'responses' / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+    
     def _make_request(self, endpoint: str, params: dict = None, signed: bool = False) -> dict:
         """
         Make a request to Binance API.
@@ -355,13 +460,33 @@ class BinanceLoader(BaseDataLoader):
         headers = {}
         if self.api_key:
             headers['X-MBX-APIKEY'] = self.api_key
+        
+        # Reuse a recent response for identical unsigned requests
+        cache_path = None if signed else self._response_cache_path(url, params)
+        if cache_path is not None:
+            try:
+                if time.time() - cache_path.stat().st_mtime < self.cache_ttl:
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        return json.load(f)
+            except (OSError, ValueError):
+                pass
             
         try:
             response = requests.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            # orjson parses large kline arrays several times faster than json
+            result = orjson.loads(response.content) if orjson is not None else response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise Exception(f"Binance API request failed: {e}")
+        
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, cache_path)
+        
+        return result
     
     def load(
         self, 
@@ -415,6 +540,14 @@ class BinanceLoader(BaseDataLoader):
             else:
                 params['endTime'] = int(end_time)
         
+        # Closed historical ranges are served from the local cache
+        cache_path = self._cache_path(params)
+        if cache_path is not None and cache_path.exists():
+            df = self._read_cache(cache_path)
+            if validate:
+                DataValidator.validate_ohlcv_data(df)
+            return df
+        
         # Make API request
         try:
             data = self._make_request('/api/v3/klines', params)
@@ -424,23 +557,18 @@ class BinanceLoader(BaseDataLoader):
         if not data:
             raise ValueError(f"No data found for symbol {symbol}")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(data, columns=[
-            'open_time', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # Convert timestamps to datetime
-        df['date'] = pd.to_datetime(df['open_time'], unit='ms')
-        
-        # Convert price and volume columns to float
-        price_volume_cols = ['open', 'high', 'low', 'close', 'volume']
-        for col in price_volume_cols:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        # Select and reorder columns to match standard format
-        df = df[['date', 'open', 'high', 'low', 'close', 'volume']].copy()
+        # Slice the kline rows as one object array and cast the timestamp
+        # and OHLCV columns in bulk instead of parsing column by column
+        klines = np.asarray(data, dtype=object)
+        ohlcv = klines[:, 1:6].astype(np.float64)
+        df = pd.DataFrame({
+            'date': pd.to_datetime(klines[:, 0].astype(np.int64), unit='ms'),
+            'open': ohlcv[:, 0],
+            'high': ohlcv[:, 1],
+            'low': ohlcv[:, 2],
+            'close': ohlcv[:, 3],
+            'volume': ohlcv[:, 4]
+        })
         
         # Sort by date
         df = df.sort_values('date').reset_index(drop=True)
@@ -449,6 +577,9 @@ class BinanceLoader(BaseDataLoader):
         if validate:
             DataValidator.validate_ohlcv_data(df)
         
+        if cache_path is not None:
+            self._write_cache(cache_path, df)
+        
         return df
     
     def get_symbol_info(self, symbol: str) -> dict:
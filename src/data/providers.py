@@ -6,15 +6,176 @@ Centralized data provider that abstracts data sources and provides a unified int
 for the backtesting system.
 """
 
+import asyncio
 import pandas as pd
+import numpy as np
 import backtrader as bt
-from typing import Dict, Any, Optional, Union, List
+from backtrader.utils import date2num
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Union, List, Mapping, Tuple, Callable
 from abc import ABC, abstractmethod
-from .validators import DataValidator
+from pandas.tseries.frequencies import to_offset
+from .validators import DataValidator, Statistics, _ensure_datetime
 from .loaders import CSVLoader, YahooFinanceLoader, BinanceLoader
 from .generators import SyntheticDataGenerator
 
 
+_DAY_NS = 86_400_000_000_000
+
+# load_multiple source types fetched over the network
+_REMOTE_SOURCE_TYPES = frozenset({'yahoo', 'binance'})
+
+
+def _fixed_step_ns(timeframe: str) -> Optional[int]:
+    """
+    Get the bucket length of a fixed-length timeframe in nanoseconds.
+    
+    Args:
+        timeframe: Pandas frequency string
+    
+    Returns:
+        Bucket length in nanoseconds, or None for calendar frequencies
+    """
+    try:
+        offset = to_offset(timeframe)
+    except ValueError:
+        return None
+    
+    if isinstance(offset, pd.offsets.Day):
+        return offset.n * _DAY_NS
+    if isinstance(offset, pd.offsets.Tick):
+        return offset.nanos
+    return None
+
+
+def _weekly_anchor_ns(timeframe: str) -> Optional[int]:
+    """
+    Get the bin edge of a single anchored weekly frequency ('1W', 'W-MON', ...).
+    
+    Args:
+        timeframe: Pandas frequency string
+    
+    Returns:
+        A midnight on the anchor weekday in nanoseconds since the epoch, or
+        None for any other frequency
+    """
+    try:
+        offset = to_offset(timeframe)
+    except ValueError:
+        return None
+    
+    if not isinstance(offset, pd.offsets.Week) or offset.n != 1 or offset.weekday is None:
+        return None
+    # The epoch fell on a Thursday (weekday 3)
+    return ((offset.weekday - 3) % 7) * _DAY_NS
+
+
+def _aggregate_buckets(df: pd.DataFrame, bucket: np.ndarray, origin_ns: int, step_ns: int) -> pd.DataFrame:
+    """
+    Aggregate sorted OHLCV rows into consecutive buckets in one pass.
+    
+    Args:
+        df: DataFrame with a sorted, timezone-naive DatetimeIndex
+        bucket: Non-decreasing bucket number of every row
+        origin_ns: Label of bucket 0 in nanoseconds since the epoch
+        step_ns: Bucket length in nanoseconds
+    
+    Returns:
+        Resampled DataFrame indexed by bucket label, skipping empty buckets
+    """
+    # First and last row of every non-empty bucket
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(bucket)] - 1
+    
+    # Labels are only needed for the non-empty buckets, not for every row
+    labels = origin_ns + bucket[starts] * step_ns
+    index = pd.DatetimeIndex(
+        labels.astype('datetime64[ns]').astype(df.index.dtype, copy=False),
+        name=df.index.name
+    )
+    
+    return pd.DataFrame({
+        'open': df['open'].to_numpy()[starts],
+        'high': np.maximum.reduceat(df['high'].to_numpy(), starts),
+        'low': np.minimum.reduceat(df['low'].to_numpy(), starts),
+        'close': df['close'].to_numpy()[ends],
+        'volume': np.add.reduceat(df['volume'].to_numpy(), starts)
+    }, index=index)
+
+
+def _resample_fixed_ohlcv(df: pd.DataFrame, step_ns: int) -> pd.DataFrame:
+    """
+    Resample date-indexed, sorted OHLCV data into fixed-length buckets.
+    
+    Buckets are anchored at midnight of the first day, like pandas' default
+    origin='start_day', and empty buckets are skipped.
+    
+    Args:
+        df: DataFrame with a sorted, timezone-naive DatetimeIndex
+        step_ns: Bucket length in nanoseconds
+    
+    Returns:
+        Resampled DataFrame indexed by bucket start
+    """
+    ts = df.index.values.astype('datetime64[ns]', copy=False).view('i8')
+    origin = ts[0] - ts[0] % _DAY_NS
+    bucket = (ts - origin) // step_ns
+    return _aggregate_buckets(df, bucket, origin, step_ns)
+
+
+def _resample_weekly_ohlcv(df: pd.DataFrame, anchor_ns: int) -> pd.DataFrame:
+    """
+    Resample date-indexed, sorted OHLCV data into anchored weeks.
+    
+    Matches pandas' weekly resampling: each week ends with the whole anchor
+    day, is closed on the right and is labelled with the anchor day's
+    midnight. Empty weeks are skipped.
+    
+    Args:
+        df: DataFrame with a sorted, timezone-naive DatetimeIndex
+        anchor_ns: Any week end (midnight of the anchor day) in nanoseconds
+    
+    Returns:
+        Resampled DataFrame indexed by week end
+    """
+    step_ns = 7 * _DAY_NS
+    ts = df.index.values.astype('datetime64[ns]', copy=False).view('i8')
+    days = ts - ts % _DAY_NS
+    bucket = -((anchor_ns - days) // step_ns)  # ceil division: right-closed bins
+    return _aggregate_buckets(df, bucket, anchor_ns, step_ns)
+
+
+class _ArrayFeed(bt.feed.DataBase):
+    """
+    Backtrader feed over pre-extracted column arrays.
+    
+    PandasData reads every bar with DataFrame.iloc and converts its timestamp
+    on the fly; this feed indexes plain ndarrays prepared once up front.
+    """
+    
+    params = (
+        ('datetimes', None),
+        ('columns', None),
+    )
+    
+    def start(self):
+        super().start()
+        self._idx = -1
+    
+    def _load(self):
+        self._idx += 1
+        if self._idx >= len(self.p.datetimes):
+            return False
+        
+        self.lines.datetime[0] = self.p.datetimes[self._idx]
+        for name, values in self.p.columns.items():
+            getattr(self.lines, name)[0] = values[self._idx]
+        return True
+
+
 class DataFeed:
     """Represents a data feed for backtesting."""
     
@@ -30,43 +191,79 @@ class DataFeed:
         self.data = data
         self.name = name
         self.metadata = metadata or {}
+        self._stats_cache = None
         
         # Validate data
         DataValidator.validate_ohlcv_data(self.data)
+        self._validated_id = id(self.data)
     
-    def to_backtrader_feed(self) -> bt.feeds.PandasData:
+    def _date_indexed(self) -> pd.DataFrame:
+        """
+        Return the data indexed and sorted by date without copying it first.
+        
+        Returns:
+            DataFrame with a DatetimeIndex, leaving self.data untouched
+        """
+        src = self.data
+        
+        # Use the date column as index instead of copying and mutating the frame
+        if 'date' in src.columns:
+            index = pd.DatetimeIndex(_ensure_datetime(src['date']), name='date')
+            df = src.drop(columns='date').set_axis(index, axis=0)
+        else:
+            df = src
+        
+        # Sort by date only when needed
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        
+        return df
+    
+    def to_backtrader_feed(self) -> bt.feed.DataBase:
         """
         Convert to backtrader data feed.
         
+        The OHLCV columns are extracted to arrays and the dates converted to
+        backtrader's float format once, instead of per bar as PandasData does.
+        
         Returns:
-            Backtrader PandasData object
-        """
-        df = self.data.copy()
-        
-        # Ensure date column is datetime and set as index
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-        
-        # Sort by date
-        df.sort_index(inplace=True)
-        
-        # Create backtrader data feed
-        return bt.feeds.PandasData(
-            dataname=df,
-            datetime=None,  # Use index
-            open='open',
-            high='high', 
-            low='low',
-            close='close',
-            volume='volume',
-            openinterest=None
+            Backtrader data feed
+        """
+        df = self._date_indexed()
+        
+        datetimes = np.fromiter(
+            (date2num(ts) for ts in df.index.to_pydatetime()),
+            dtype=np.float64,
+            count=len(df)
         )
+        columns = {
+            col: df[col].to_numpy(dtype=np.float64)
+            for col in ('open', 'high', 'low', 'close', 'volume')
+        }
+        return _ArrayFeed(datetimes=datetimes, columns=columns)
+    
+    def get_statistics(self) -> Statistics:
+        """
+        Get data statistics.
+        
+        Results are cached per data frame. Mutating self.data in place is not
+        detected; call invalidate_stats() afterwards.
+        """
+        key = (id(self.data), len(self.data))
+        if self._stats_cache is not None and self._stats_cache[0] == key:
+            return self._stats_cache[1]
+        
+        # The constructor already validated the frame unless it was replaced since
+        stats = DataValidator.get_data_statistics(
+            self.data,
+            assume_valid=id(self.data) == self._validated_id
+        )
+        self._stats_cache = (key, stats)
+        return stats
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get data statistics."""
-        from .validators import DataValidator
-        return DataValidator.get_data_statistics(self.data)
+    def invalidate_stats(self):
+        """Drop cached statistics so the next get_statistics() call recomputes them."""
+        self._stats_cache = None
     
     def resample(self, timeframe: str) -> 'DataFeed':
         """
@@ -74,27 +271,34 @@ class DataFeed:
         
         Args:
             timeframe: Target timeframe ('1H', '4H', '1D', '1W', '1M')
-            
+        
         Returns:
             New DataFeed with resampled data
         """
-        df = self.data.copy()
-        
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
+        df = self._date_indexed()
+        step_ns = _fixed_step_ns(timeframe)
+        anchor_ns = _weekly_anchor_ns(timeframe) if step_ns is None else None
+        fast_path = len(df) > 0 and df.index.tz is None
         
-        # Resample using appropriate aggregation
-        resampled = df.resample(timeframe).agg({
-            'open': 'first',
-            'high': 'max', 
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum'
-        })
+        if step_ns is not None and fast_path:
+            # Fixed-length buckets: single scan over the sorted timestamps
+            resampled = _resample_fixed_ohlcv(df, step_ns)
+        elif anchor_ns is not None and fast_path:
+            # Anchored weeks are fixed-length too, just offset and right-closed
+            resampled = _resample_weekly_ohlcv(df, anchor_ns)
+        else:
+            # Calendar frequencies (weeks, months) need pandas' resampler
+            resampled = df.resample(timeframe).agg({
+                'open': 'first',
+                'high': 'max', 
+                'low': 'min',
+                'close': 'last',
+                'volume': 'sum'
+            })
+            
+            # Remove rows with NaN values
+            resampled = resampled.dropna()
         
-        # Remove rows with NaN values
-        resampled = resampled.dropna()
         resampled = resampled.reset_index()
         
         return DataFeed(
@@ -104,19 +308,59 @@ class DataFeed:
         )
 
 
+@lru_cache(maxsize=8)
+def _get_binance_loader(api_key: Optional[str], api_secret: Optional[str]) -> BinanceLoader:
+    """Get a BinanceLoader for the given credentials, reusing one per key pair."""
+    return BinanceLoader(api_key, api_secret)
+
+
 class DataProvider:
     """
     Centralized data provider that manages different data sources.
     Provides a unified interface for loading data from various sources.
     """
     
-    def __init__(self, binance_api_key: Optional[str] = None, binance_api_secret: Optional[str] = None):
-        """Initialize data provider."""
-        self.csv_loader = CSVLoader()
-        self.yahoo_loader = YahooFinanceLoader()
-        self.binance_loader = BinanceLoader(binance_api_key, binance_api_secret)
-        self.synthetic_generator = SyntheticDataGenerator()
-        self._cached_feeds = {}
+    def __init__(
+        self,
+        binance_api_key: Optional[str] = None,
+        binance_api_secret: Optional[str] = None,
+        cache_max_bytes: int = 1 << 30
+    ):
+        """
+        Initialize data provider.
+        
+        Args:
+            binance_api_key: Binance API key (optional for public market data)
+            binance_api_secret: Binance API secret (optional for public market data)
+            cache_max_bytes: Memory budget for cached feeds; least recently
+                used feeds are evicted once it is exceeded
+        """
+        self._binance_api_key = binance_api_key
+        self._binance_api_secret = binance_api_secret
+        self.cache_max_bytes = cache_max_bytes
+        self._cached_feeds = OrderedDict()
+        self._cached_sizes = {}
+        self._cached_bytes = 0
+    
+    @cached_property
+    def csv_loader(self) -> CSVLoader:
+        """CSV loader, created on first use."""
+        return CSVLoader()
+    
+    @cached_property
+    def yahoo_loader(self) -> YahooFinanceLoader:
+        """Yahoo Finance loader, created on first use."""
+        return YahooFinanceLoader()
+    
+    @cached_property
+    def binance_loader(self) -> BinanceLoader:
+        """Binance loader, shared between providers using the same credentials."""
+        return _get_binance_loader(self._binance_api_key, self._binance_api_secret)
+    
+    @cached_property
+    def synthetic_generator(self) -> SyntheticDataGenerator:
+        """Synthetic data generator, created on first use."""
+        return SyntheticDataGenerator()
     
     def load_csv(self, file_path: str, name: Optional[str] = None, **kwargs) -> DataFeed:
         """
@@ -126,7 +370,7 @@ class DataProvider:
             file_path: Path to CSV file
             name: Name for the data feed
             **kwargs: Additional arguments for CSV loading
-            
+        
         Returns:
             DataFeed object
         """
@@ -154,7 +398,7 @@ class DataProvider:
             start_date: Start date in 'YYYY-MM-DD' format
             end_date: End date in 'YYYY-MM-DD' format
             name: Name for the data feed
-            
+        
         Returns:
             DataFeed object
         """
@@ -193,7 +437,7 @@ class DataProvider:
             drift: Daily drift
             seed: Random seed
             name: Name for the data feed
-            
+        
         Returns:
             DataFeed object
         """
@@ -241,7 +485,7 @@ class DataProvider:
             end_time: End time in 'YYYY-MM-DD' format
             limit: Number of klines to return (max 1000)
             name: Name for the data feed
-            
+        
         Returns:
             DataFeed object
         """
@@ -274,35 +518,124 @@ class DataProvider:
         Args:
             sources: Dictionary with source configurations
                     Format: {name: {'type': 'csv/yahoo/binance/synthetic', ...params}}
-                    
+        
+        Returns:
+            Dictionary of DataFeed objects
+        """
+        loaders, jobs = self._source_jobs(sources)
+        
+        # Network sources are I/O bound, so fetch them concurrently; local
+        # sources are CPU bound and stay inline
+        remote = [job for job in jobs if job[1] in _REMOTE_SOURCE_TYPES]
+        futures = {}
+        executor = None
+        if len(remote) > 1:
+            executor = ThreadPoolExecutor(max_workers=min(8, len(remote)))
+            futures = {
+                name: executor.submit(loaders[source_type], name=name, **config)
+                for name, source_type, config in remote
+            }
+        
+        try:
+            feeds = {}
+            for name, source_type, config in jobs:
+                if name in futures:
+                    feeds[name] = futures[name].result()
+                else:
+                    feeds[name] = loaders[source_type](name=name, **config)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        
+        return feeds
+    
+    async def load_multiple_async(self, sources: Dict[str, Dict[str, Any]]) -> Dict[str, DataFeed]:
+        """
+        Load multiple data sources from async code.
+        
+        Same as load_multiple, but network sources are awaited with
+        asyncio.gather so the event loop stays free while they run.
+        
+        Args:
+            sources: Dictionary with source configurations
+                    Format: {name: {'type': 'csv/yahoo/binance/synthetic', ...params}}
+        
         Returns:
             Dictionary of DataFeed objects
         """
+        loaders, jobs = self._source_jobs(sources)
+        
+        remote = [job for job in jobs if job[1] in _REMOTE_SOURCE_TYPES]
+        remote_feeds = await asyncio.gather(*(
+            asyncio.to_thread(loaders[source_type], name=name, **config)
+            for name, source_type, config in remote
+        ))
+        fetched = {job[0]: feed for job, feed in zip(remote, remote_feeds)}
+        
         feeds = {}
+        for name, source_type, config in jobs:
+            if name in fetched:
+                feeds[name] = fetched[name]
+            else:
+                feeds[name] = loaders[source_type](name=name, **config)
         
+        return feeds
+    
+    def _source_jobs(
+        self,
+        sources: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Dict[str, Callable[..., DataFeed]], List[Tuple[str, str, Dict[str, Any]]]]:
+        """
+        Validate source configurations and pair each with its loader.
+        
+        Args:
+            sources: Dictionary with source configurations
+        
+        Returns:
+            (loaders keyed by source type, [(name, source_type, config), ...])
+        """
+        loaders = {
+            'csv': self.load_csv,
+            'yahoo': self.load_yahoo_finance,
+            'synthetic': self.generate_synthetic,
+            'binance': self.load_binance
+        }
+        
+        jobs = []
         for name, config in sources.items():
             source_type = config.pop('type')
-            
-            if source_type == 'csv':
-                feeds[name] = self.load_csv(name=name, **config)
-            elif source_type == 'yahoo':
-                feeds[name] = self.load_yahoo_finance(name=name, **config)
-            elif source_type == 'synthetic':
-                feeds[name] = self.generate_synthetic(name=name, **config)
-            elif source_type == 'binance':
-                feeds[name] = self.load_binance(name=name, **config)
-            else:
+            if source_type not in loaders:
                 raise ValueError(f"Unknown source type: {source_type}")
+            jobs.append((name, source_type, config))
         
-        return feeds
+        return loaders, jobs
     
     def cache_feed(self, name: str, feed: DataFeed):
-        """Cache a data feed for reuse."""
+        """
+        Cache a data feed for reuse.
+        
+        Least recently used feeds are evicted while the cache exceeds
+        cache_max_bytes. The feed just added is always kept.
+        """
+        if name in self._cached_feeds:
+            self._cached_bytes -= self._cached_sizes.pop(name)
+            del self._cached_feeds[name]
+        
+        size = int(feed.data.memory_usage(deep=False).sum())
         self._cached_feeds[name] = feed
+        self._cached_sizes[name] = size
+        self._cached_bytes += size
+        
+        while self._cached_bytes > self.cache_max_bytes and len(self._cached_feeds) > 1:
+            evicted, _ = self._cached_feeds.popitem(last=False)
+            self._cached_bytes -= self._cached_sizes.pop(evicted)
     
     def get_cached_feed(self, name: str) -> Optional[DataFeed]:
         """Get a cached data feed."""
-        return self._cached_feeds.get(name)
+        feed = self._cached_feeds.get(name)
+        if feed is not None:
+            self._cached_feeds.move_to_end(name)
+        return feed
     
     def list_cached_feeds(self) -> list:
         """List all cached feed names."""
@@ -311,6 +644,8 @@ class DataProvider:
     def clear_cache(self):
         """Clear all cached feeds."""
         self._cached_feeds.clear()
+        self._cached_sizes.clear()
+        self._cached_bytes = 0
     
     def from_dataframe(self, data: pd.DataFrame, name: str = "dataframe") -> DataFeed:
         """
@@ -319,7 +654,7 @@ class DataProvider:
         Args:
             data: DataFrame with OHLCV data
             name: Name for the data feed
-            
+        
         Returns:
             DataFeed object
         """
@@ -348,58 +683,186 @@ class DataProvider:
             end_time: End time
             limit: Number of klines
             use_synthetic_fallback: Create synthetic data if real data fails
-            
+        
         Returns:
             Dictionary of DataFeed objects keyed by pair name
         """
         if pairs is None:
-            pairs = get_popular_binance_pairs()[:10]  # Use first 10 popular pairs
+            pairs = list(get_popular_binance_pairs()[:10])  # Use first 10 popular pairs
+        
+        def _load_pair(pair: str):
+            return self._try_load_binance(pair, interval, start_time, end_time, limit)
+        
+        # Fetch all pairs concurrently; the requests are I/O bound
+        with ThreadPoolExecutor(max_workers=max(1, min(len(pairs), 16))) as executor:
+            results = list(executor.map(_load_pair, pairs))
+        
+        return self._collect_pair_feeds(pairs, results, start_time, end_time, use_synthetic_fallback)
+    
+    async def load_binance_pairs_async(
+        self,
+        pairs: Optional[List[str]] = None,
+        interval: str = '1d',
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        limit: int = 500,
+        use_synthetic_fallback: bool = True
+    ) -> Dict[str, DataFeed]:
+        """
+        Load data for multiple Binance trading pairs from async code.
+        
+        Same as load_binance_pairs, but the requests are awaited with
+        asyncio.gather so the event loop stays free while they run.
         
+        Args:
+            pairs: List of trading pairs (if None, uses popular pairs)
+            interval: Kline interval
+            start_time: Start time
+            end_time: End time
+            limit: Number of klines
+            use_synthetic_fallback: Create synthetic data if real data fails
+        
+        Returns:
+            Dictionary of DataFeed objects keyed by pair name
+        """
+        if pairs is None:
+            pairs = list(get_popular_binance_pairs()[:10])  # Use first 10 popular pairs
+        
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._try_load_binance, pair, interval, start_time, end_time, limit)
+            for pair in pairs
+        ))
+        
+        return self._collect_pair_feeds(pairs, results, start_time, end_time, use_synthetic_fallback)
+    
+    def _try_load_binance(
+        self,
+        pair: str,
+        interval: str,
+        start_time: Optional[str],
+        end_time: Optional[str],
+        limit: int
+    ) -> Tuple[Optional[DataFeed], Optional[Exception]]:
+        """Load one pair, returning (feed, None) or (None, error)."""
+        try:
+            feed = self.load_binance(
+                symbol=pair,
+                interval=interval,
+                start_time=start_time,
+                end_time=end_time,
+                limit=limit
+            )
+            return feed, None
+        except Exception as e:
+            return None, e
+    
+    def _collect_pair_feeds(
+        self,
+        pairs: List[str],
+        results: List[Tuple[Optional[DataFeed], Optional[Exception]]],
+        start_time: Optional[str],
+        end_time: Optional[str],
+        use_synthetic_fallback: bool
+    ) -> Dict[str, DataFeed]:
+        """
+        Assemble per-pair load results into feeds, in the order of pairs.
+        
+        Args:
+            pairs: Trading pairs that were requested
+            results: (feed, error) for each pair
+            start_time: Start time used for synthetic fallback data
+            end_time: End time used for synthetic fallback data
+            use_synthetic_fallback: Substitute synthetic data for failed pairs
+        
+        Returns:
+            Dictionary of DataFeed objects keyed by pair name
+        """
         feeds = {}
-        pair_info = get_binance_pair_info()
         
-        for i, pair in enumerate(pairs):
-            try:
-                feed = self.load_binance(
-                    symbol=pair,
-                    interval=interval,
-                    start_time=start_time,
-                    end_time=end_time,
-                    limit=limit
-                )
+        # Pairs that failed to load get synthetic data, generated in one batch
+        failed_pairs = [pair for pair, (_, e) in zip(pairs, results) if e is not None]
+        synthetic_feeds = {}
+        if use_synthetic_fallback and failed_pairs:
+            synthetic_feeds = self._generate_fallback_feeds(
+                failed_pairs,
+                start_date=start_time or '2023-01-01',
+                end_date=end_time or '2023-12-31'
+            )
+        
+        for pair, (feed, e) in zip(pairs, results):
+            if e is None:
                 feeds[pair] = feed
-                
-            except Exception as e:
-                if use_synthetic_fallback:
-                    # Generate synthetic data with realistic characteristics
-                    info = pair_info.get(pair, {})
-                    typical_price = info.get('typical_price', 100)
-                    volatility = info.get('volatility', 0.05)
-                    
-                    feed = self.generate_synthetic(
-                        start_date=start_time or '2023-01-01',
-                        end_date=end_time or '2023-12-31',
-                        initial_price=typical_price,
-                        volatility=volatility,
-                        drift=0.001,
-                        seed=42 + i,
-                        name=f"synthetic_{pair}"
-                    )
-                    feeds[pair] = feed
-                else:
-                    print(f"Warning: Failed to load {pair}: {e}")
-                    
+            elif use_synthetic_fallback:
+                feeds[pair] = synthetic_feeds[pair]
+            else:
+                print(f"Warning: Failed to load {pair}: {e}")
+        
         return feeds
+    
+    def _generate_fallback_feeds(
+        self,
+        pairs: List[str],
+        start_date: str,
+        end_date: str,
+        seed: int = 42
+    ) -> Dict[str, DataFeed]:
+        """
+        Generate synthetic stand-in feeds for pairs that could not be loaded.
+        
+        Args:
+            pairs: Trading pairs needing synthetic data
+            start_date: Start date in 'YYYY-MM-DD' format
+            end_date: End date in 'YYYY-MM-DD' format
+            seed: Random seed for the whole batch
+        
+        Returns:
+            Dictionary of DataFeed objects keyed by pair name
+        """
+        pair_info = get_binance_pair_info()
+        specs = []
+        for pair in pairs:
+            # Use realistic characteristics for known pairs
+            info = pair_info.get(pair, {})
+            specs.append({
+                'initial_price': info.get('typical_price', 100),
+                'volatility': info.get('volatility', 0.05),
+                'drift': 0.001
+            })
+        
+        frames = self.synthetic_generator.generate_many(
+            specs,
+            start_date=start_date,
+            end_date=end_date,
+            seed=seed
+        )
+        
+        return {
+            pair: DataFeed(
+                data=data,
+                name=f"synthetic_{pair}",
+                metadata={
+                    'source': 'synthetic',
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    **spec,
+                    'seed': seed
+                }
+            )
+            for pair, spec, data in zip(pairs, specs, frames)
+        }
 
 
-def get_popular_binance_pairs() -> List[str]:
+@lru_cache(maxsize=1)
+def get_popular_binance_pairs() -> Tuple[str, ...]:
     """
     Get a list of popular Binance trading pairs.
     
+    The result is cached, so it is returned as an immutable tuple.
+    
     Returns:
-        List of popular cryptocurrency trading pairs
+        Tuple of popular cryptocurrency trading pairs
     """
-    return [
+    return (
         'BTCUSDT',    # Bitcoin
         'ETHUSDT',    # Ethereum
         'BNBUSDT',    # Binance Coin
@@ -420,17 +883,21 @@ def get_popular_binance_pairs() -> List[str]:
         'SOLUSDT',    # Solana
         'FTMUSDT',    # Fantom
         'AAVEUSDT'    # Aave
-    ]
+    )
 
 
-def get_binance_pair_info() -> Dict[str, Dict[str, Any]]:
+@lru_cache(maxsize=1)
+def get_binance_pair_info() -> Mapping[str, Mapping[str, Any]]:
     """
     Get information about popular Binance trading pairs.
     
+    The result is cached and shared between callers, so it is returned as a
+    read-only mapping.
+    
     Returns:
-        Dictionary with pair information including typical price ranges and characteristics
+        Mapping with pair information including typical price ranges and characteristics
     """
-    return {
+    return MappingProxyType({
         'BTCUSDT': {
             'name': 'Bitcoin',
             'typical_price': 30000,
@@ -551,7 +1018,7 @@ def get_binance_pair_info() -> Dict[str, Dict[str, Any]]:
             'volatility': 0.07,
             'category': 'defi'
         }
-    }
+    })
 
 
 # Example usage
@@ -7,10 +7,185 @@ Provides data validation and statistical analysis for trading data.
 
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Any
 
 
+def _ensure_datetime(series: pd.Series) -> pd.Series:
+    """
+    Convert a series to datetime, skipping the parse if it already is one.
+    
+    Args:
+        series: Series with date values
+        
+    Returns:
+        Series with datetime64 dtype
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, cache=True)
+
+
+def _date_bounds(dates) -> tuple:
+    """
+    Earliest and latest value of a date column or index.
+    
+    Reduces the raw datetime64 array directly, skipping pandas' masked
+    reductions; other dtypes (strings, tz-aware) and columns containing NaT
+    go through pandas.
+    
+    Args:
+        dates: Series or Index with date values
+        
+    Returns:
+        (start, end) tuple
+    """
+    if isinstance(dates.dtype, np.dtype) and dates.dtype.kind == 'M' and len(dates) > 0:
+        # Integer reductions are cheaper than datetime64 ones; NaT is int64 min
+        ticks = dates.to_numpy().view(np.int64)
+        start, end = ticks.min(), ticks.max()
+        if start != np.iinfo(np.int64).min:
+            unit = np.datetime_data(dates.dtype)[0]
+            return pd.Timestamp(np.datetime64(int(start), unit)), pd.Timestamp(np.datetime64(int(end), unit))
+    return dates.min(), dates.max()
+
+
+def _sample_std(values: np.ndarray, mean: np.float64) -> np.float64:
+    """
+    Sample standard deviation (ddof=1) reusing an already computed mean.
+    
+    Args:
+        values: Input values
+        mean: values.mean()
+        
+    Returns:
+        Standard deviation, NaN for fewer than two values
+    """
+    if len(values) < 2:
+        return np.float64(np.nan)
+    deviations = values - mean
+    return np.sqrt(np.dot(deviations, deviations) / (len(values) - 1))
+
+
+class _StatsRecord:
+    """
+    Mixin giving statistics dataclasses read-only dict-style access.
+    
+    Existing callers index results as ``stats['price_stats']['min_price']``;
+    this keeps that working without building the nested dicts up front.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys()
+    
+    def keys(self):
+        return [f.name for f in fields(self)]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.keys() else default
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the plain nested dictionary shape.
+        
+        Returns:
+            Dictionary with the same keys and values
+        """
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            result[f.name] = value.to_dict() if isinstance(value, _StatsRecord) else value
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class DataInfo(_StatsRecord):
+    """Row count and date range of a dataset."""
+    rows: int
+    start_date: str
+    end_date: str
+    duration_days: int
+
+
+@dataclass(frozen=True, slots=True)
+class PriceStats(_StatsRecord):
+    """Price level and change statistics."""
+    start_price: float
+    end_price: float
+    min_price: float
+    max_price: float
+    avg_price: float
+    price_change: float
+    price_change_pct: float
+
+
+@dataclass(frozen=True, slots=True)
+class ReturnStats(_StatsRecord):
+    """Daily and annualized return statistics, in percent."""
+    avg_daily_return: float
+    daily_volatility: float
+    annualized_return: float
+    annualized_volatility: float
+    sharpe_ratio: float
+    max_daily_gain: float
+    max_daily_loss: float
+
+
+@dataclass(frozen=True, slots=True)
+class VolumeStats(_StatsRecord):
+    """Trading volume statistics."""
+    avg_volume: float
+    min_volume: float
+    max_volume: float
+    volume_std: float
+
+
+@dataclass(frozen=True, slots=True)
+class Statistics(_StatsRecord):
+    """Statistics returned by DataValidator.get_data_statistics."""
+    data_info: DataInfo
+    price_stats: PriceStats
+    return_stats: ReturnStats
+    volume_stats: VolumeStats
+
+
+def _first_invalid_ohlc_row(o, h, l, c) -> int:
+    """
+    Return the index of the first row with an invalid OHLC relationship, or -1.
+    
+    Written as a plain loop so it can be compiled with Numba; it exits on the
+    first violation and allocates no intermediate arrays.
+    """
+    for i in range(o.shape[0]):
+        if h[i] < l[i] or h[i] < o[i] or h[i] < c[i] or l[i] > o[i] or l[i] > c[i]:
+            return i
+    return -1
+
+
+@lru_cache(maxsize=1)
+def _get_ohlc_kernel():
+    """
+    Compile the OHLC check with Numba on first use.
+    
+    Returns:
+        Compiled kernel, or None if numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True, boundscheck=False)(_first_invalid_ohlc_row)
+
+
 class DataValidator:
     """Data validation utilities for trading data."""
     
@@ -32,30 +207,49 @@ class DataValidator:
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
         
-        # Check for numeric columns
+        # Check for numeric columns (one dtypes lookup, no per-column dispatch)
         numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_columns:
-            if not pd.api.types.is_numeric_dtype(df[col]):
-                raise ValueError(f"Column '{col}' must be numeric")
-        
-        # Check for NaN values
-        if df[required_columns].isnull().any().any():
+        dtypes = df.dtypes
+        non_numeric = [col for col in numeric_columns if dtypes[col].kind not in 'biufc']
+        if non_numeric:
+            raise ValueError(f"Columns must be numeric: {non_numeric}")
+        
+        # Nothing left to check on an empty frame
+        if df.shape[0] == 0:
+            return True
+        
+        # Check for NaN values, column by column instead of through a
+        # temporary boolean frame
+        if any(df[col].hasnans for col in required_columns):
             raise ValueError("Data contains NaN values")
         
-        # Check OHLC relationships
-        invalid_ohlc = (
-            (df['high'] < df['low']) |
-            (df['high'] < df['open']) |
-            (df['high'] < df['close']) |
-            (df['low'] > df['open']) |
-            (df['low'] > df['close'])
+        # Extract raw float arrays once; the remaining checks reuse them
+        open_, high, low, close, volume = (
+            df[col].to_numpy(dtype=np.float64) for col in numeric_columns
         )
         
-        if invalid_ohlc.any():
-            raise ValueError("Invalid OHLC relationships found (High < Low, etc.)")
+        # Check OHLC relationships
+        kernel = _get_ohlc_kernel()
+        if kernel is not None:
+            bad_row = kernel(open_, high, low, close)
+            if bad_row >= 0:
+                raise ValueError(
+                    f"Invalid OHLC relationships found (High < Low, etc.) at row {bad_row}"
+                )
+        else:
+            invalid_ohlc = (
+                (high < low) |
+                (high < open_) |
+                (high < close) |
+                (low > open_) |
+                (low > close)
+            )
+            
+            if invalid_ohlc.any():
+                raise ValueError("Invalid OHLC relationships found (High < Low, etc.)")
         
         # Check for negative values
-        if (df[['open', 'high', 'low', 'close', 'volume']] < 0).any().any():
+        if min(open_.min(), high.min(), low.min(), close.min(), volume.min()) < 0:
             raise ValueError("Negative values found in price or volume data")
         
         return True
@@ -79,7 +273,7 @@ class DataValidator:
         
         # Convert to datetime
         try:
-            df[date_column] = pd.to_datetime(df[date_column])
+            df[date_column] = _ensure_datetime(df[date_column])
         except Exception as e:
             raise ValueError(f"Cannot convert '{date_column}' to datetime: {e}")
         
@@ -93,60 +287,80 @@ class DataValidator:
         return df
     
     @staticmethod
-    def check_data_completeness(df: pd.DataFrame, date_column: str = 'date') -> Dict[str, Any]:
+    def check_data_completeness(
+        df: pd.DataFrame,
+        date_column: str = 'date',
+        return_missing: bool = True
+    ) -> Dict[str, Any]:
         """
         Check data completeness and identify gaps.
         
         Args:
             df: DataFrame with date column
             date_column: Name of the date column
+            return_missing: Whether to list the missing dates; when False only
+                the counts are computed and 'missing_dates' is None
             
         Returns:
             Dictionary with completeness information
         """
-        df = df.copy()
-        df[date_column] = pd.to_datetime(df[date_column])
-        df = df.sort_values(date_column)
+        dates = _ensure_datetime(df[date_column])
         
-        start_date = df[date_column].min()
-        end_date = df[date_column].max()
+        start_date = dates.min()
+        end_date = dates.max()
         total_days = (end_date - start_date).days + 1
         actual_rows = len(df)
         
-        # Find gaps (assuming daily data)
-        expected_dates = pd.date_range(start=start_date, end=end_date, freq='D')
-        missing_dates = expected_dates.difference(df[date_column])
+        # Find gaps (assuming daily data) over int64 day numbers instead of
+        # materializing a DatetimeIndex of every expected day
+        actual_days = np.unique(dates.values.astype('datetime64[D]').view('i8'))
+        first_day, last_day = actual_days[0], actual_days[-1]
+        
+        if return_missing:
+            expected_days = np.arange(first_day, last_day + 1)
+            missing_days = np.setdiff1d(expected_days, actual_days, assume_unique=True)
+            missing_dates = pd.to_datetime(missing_days, unit='D').tolist()
+            gaps_count = len(missing_dates)
+        else:
+            missing_dates = None
+            gaps_count = int(last_day - first_day + 1 - len(actual_days))
         
         return {
             'start_date': start_date,
             'end_date': end_date,
             'total_expected_days': total_days,
             'actual_rows': actual_rows,
-            'missing_dates': missing_dates.tolist(),
+            'missing_dates': missing_dates,
             'completeness_ratio': actual_rows / total_days,
-            'gaps_count': len(missing_dates)
+            'gaps_count': gaps_count
         }
     
     @staticmethod
-    def get_data_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+    def get_data_statistics(df: pd.DataFrame, assume_valid: bool = False) -> Statistics:
         """
         Get comprehensive statistics about the trading data.
         
         Args:
             df: DataFrame with OHLCV data
+            assume_valid: Skip validation when the caller has already validated df
             
         Returns:
-            Dictionary with data statistics
+            Statistics record; supports dict-style access and to_dict()
         """
-        DataValidator.validate_ohlcv_data(df)
+        if not assume_valid:
+            DataValidator.validate_ohlcv_data(df)
         
-        # Calculate returns
-        df = df.copy()
-        df['returns'] = df['close'].pct_change()
+        # Extract raw arrays once; every statistic below reuses them
+        close = df['close'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        high = df['high'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        
+        # Calculate returns (equivalent to close.pct_change() without the leading NaN)
+        returns = np.diff(close) / close[:-1]
         
         # Date range
-        start_date = df['date'].min() if 'date' in df.columns else df.index.min()
-        end_date = df['date'].max() if 'date' in df.columns else df.index.max()
+        start_date, end_date = _date_bounds(df['date'] if 'date' in df.columns else df.index)
         
         if isinstance(start_date, str):
             start_date = pd.to_datetime(start_date)
@@ -155,50 +369,66 @@ class DataValidator:
             
         duration = (end_date - start_date).days
         
-        # Price statistics
-        price_stats = {
-            'start_price': float(df['close'].iloc[0]),
-            'end_price': float(df['close'].iloc[-1]),
-            'min_price': float(df['low'].min()),
-            'max_price': float(df['high'].max()),
-            'avg_price': float(df['close'].mean()),
-            'price_change': float(df['close'].iloc[-1] - df['close'].iloc[0]),
-            'price_change_pct': float(((df['close'].iloc[-1] / df['close'].iloc[0]) - 1) * 100)
-        }
+        # Price statistics (NumPy scalars; np.float64 is a float subclass)
+        start_price = close[0]
+        end_price = close[-1]
+        price_stats = PriceStats(
+            start_price=start_price,
+            end_price=end_price,
+            min_price=low.min(),
+            max_price=high.max(),
+            avg_price=close.mean(),
+            price_change=end_price - start_price,
+            price_change_pct=((end_price / start_price) - 1) * 100
+        )
         
-        # Return statistics
-        return_stats = {
-            'avg_daily_return': float(df['returns'].mean() * 100),
-            'daily_volatility': float(df['returns'].std() * 100),
-            'annualized_return': float(df['returns'].mean() * 252 * 100),
-            'annualized_volatility': float(df['returns'].std() * np.sqrt(252) * 100),
-            'sharpe_ratio': float((df['returns'].mean() / df['returns'].std()) * np.sqrt(252)) if df['returns'].std() > 0 else 0,
-            'max_daily_gain': float(df['returns'].max() * 100),
-            'max_daily_loss': float(df['returns'].min() * 100)
-        }
+        # Return statistics (sample std, matching pandas' ddof=1 default)
+        if len(returns) > 0:
+            r_mean = returns.mean()
+            r_std = _sample_std(returns, r_mean)
+            r_max = returns.max()
+            r_min = returns.min()
+        else:
+            r_mean = r_std = r_max = r_min = np.float64(np.nan)
+        
+        return_stats = ReturnStats(
+            avg_daily_return=r_mean * 100,
+            daily_volatility=r_std * 100,
+            annualized_return=r_mean * 252 * 100,
+            annualized_volatility=r_std * np.sqrt(252) * 100,
+            sharpe_ratio=(r_mean / r_std) * np.sqrt(252) if r_std > 0 else 0,
+            max_daily_gain=r_max * 100,
+            max_daily_loss=r_min * 100
+        )
         
         # Volume statistics
-        volume_stats = {
-            'avg_volume': float(df['volume'].mean()),
-            'min_volume': float(df['volume'].min()),
-            'max_volume': float(df['volume'].max()),
-            'volume_std': float(df['volume'].std())
-        }
+        avg_volume = volume.mean()
+        volume_stats = VolumeStats(
+            avg_volume=avg_volume,
+            min_volume=volume.min(),
+            max_volume=volume.max(),
+            volume_std=_sample_std(volume, avg_volume)
+        )
         
-        return {
-            'data_info': {
-                'rows': len(df),
-                'start_date': start_date.strftime('%Y-%m-%d'),
-                'end_date': end_date.strftime('%Y-%m-%d'),
-                'duration_days': duration
-            },
-            'price_stats': price_stats,
-            'return_stats': return_stats,
-            'volume_stats': volume_stats
-        }
+        return Statistics(
+            data_info=DataInfo(
+                rows=len(df),
+                start_date=start_date.strftime('%Y-%m-%d'),
+                end_date=end_date.strftime('%Y-%m-%d'),
+                duration_days=duration
+            ),
+            price_stats=price_stats,
+            return_stats=return_stats,
+            volume_stats=volume_stats
+        )
     
     @staticmethod
-    def detect_outliers(df: pd.DataFrame, method: str = 'iqr', threshold: float = 1.5) -> Dict[str, Any]:
+    def detect_outliers(
+        df: pd.DataFrame,
+        method: str = 'iqr',
+        threshold: float = 1.5,
+        include_indices: bool = True
+    ) -> Dict[str, Any]:
         """
         Detect outliers in price and volume data.
         
@@ -206,34 +436,42 @@ class DataValidator:
             df: DataFrame with OHLCV data
             method: Method to use ('iqr', 'zscore')
             threshold: Threshold for outlier detection
+            include_indices: Whether to return the index labels of the outliers
+                as a NumPy array; when False 'indices' is None
             
         Returns:
             Dictionary with outlier information
         """
         outliers = {}
         
-        price_columns = ['open', 'high', 'low', 'close']
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        values = df[columns].to_numpy(dtype=np.float64)
         
-        for col in price_columns + ['volume']:
-            if method == 'iqr':
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - threshold * IQR
-                upper_bound = Q3 + threshold * IQR
-                outlier_mask = (df[col] < lower_bound) | (df[col] > upper_bound)
-            
-            elif method == 'zscore':
-                z_scores = np.abs((df[col] - df[col].mean()) / df[col].std())
-                outlier_mask = z_scores > threshold
-            
-            else:
-                raise ValueError(f"Unknown method: {method}")
-            
+        # Reduce all columns at once; NaN-aware to match pandas' skipna behaviour
+        if method == 'iqr':
+            q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            lower_bound = q1 - threshold * iqr
+            upper_bound = q3 + threshold * iqr
+            outlier_mask = (values < lower_bound) | (values > upper_bound)
+        
+        elif method == 'zscore':
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=1)
+            z_scores = np.abs((values - mean) / std)
+            outlier_mask = z_scores > threshold
+        
+        else:
+            raise ValueError(f"Unknown method: {method}")
+        
+        counts = outlier_mask.sum(axis=0)
+        labels = df.index.to_numpy() if include_indices else None
+        
+        for i, col in enumerate(columns):
             outliers[col] = {
-                'count': outlier_mask.sum(),
-                'percentage': (outlier_mask.sum() / len(df)) * 100,
-                'indices': df.index[outlier_mask].tolist()
+                'count': int(counts[i]),
+                'percentage': (counts[i] / len(df)) * 100,
+                'indices': labels[outlier_mask[:, i]] if include_indices else None
             }
         
         return outliers
@@ -250,21 +488,40 @@ class DataValidator:
         Returns:
             Dictionary with gap analysis
         """
-        df = df.copy()
-        df = df.sort_values('date' if 'date' in df.columns else df.index)
-        
-        # Calculate price gaps
-        df['prev_close'] = df['close'].shift(1)
-        df['gap_pct'] = ((df['open'] - df['prev_close']) / df['prev_close'] * 100).abs()
-        
-        # Find large gaps
-        large_gaps = df[df['gap_pct'] > max_gap_pct]
+        has_date = 'date' in df.columns
+        if has_date and not df['date'].is_monotonic_increasing:
+            df = df.sort_values('date')
+        elif not has_date and not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        
+        # Gap between each open and the previous close, on raw arrays so the
+        # input frame is never mutated
+        close = df['close'].to_numpy(dtype=np.float64)
+        prev_close = close[:-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gap_pct = np.abs((df['open'].to_numpy(dtype=np.float64)[1:] - prev_close) / prev_close * 100)
+        
+        # Find large gaps (row positions are offset by one from gap_pct)
+        mask = gap_pct > max_gap_pct
+        large_gaps = []
+        if mask.any():
+            idx = np.flatnonzero(mask) + 1
+            rows = df.iloc[idx]
+            columns = {}
+            if has_date:
+                columns['date'] = rows['date'].tolist()
+            columns['open'] = rows['open'].tolist()
+            columns['prev_close'] = close[idx - 1].tolist()
+            columns['gap_pct'] = gap_pct[idx - 1].tolist()
+            large_gaps = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        
+        has_gaps = not np.isnan(gap_pct).all()
         
         return {
             'total_gaps': len(large_gaps),
-            'max_gap_pct': float(df['gap_pct'].max()) if not df['gap_pct'].isna().all() else 0,
-            'avg_gap_pct': float(df['gap_pct'].mean()) if not df['gap_pct'].isna().all() else 0,
-            'large_gaps': large_gaps[['date', 'open', 'prev_close', 'gap_pct']].to_dict('records') if 'date' in df.columns else large_gaps[['open', 'prev_close', 'gap_pct']].to_dict('records')
+            'max_gap_pct': float(np.nanmax(gap_pct)) if has_gaps else 0,
+            'avg_gap_pct': float(np.nanmean(gap_pct)) if has_gaps else 0,
+            'large_gaps': large_gaps
         }
 
 
@@ -295,17 +552,18 @@ def is_trading_day(date: datetime) -> bool:
     return DataValidator.is_trading_day(date)
 
 
-def get_data_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+def get_data_statistics(df: pd.DataFrame, assume_valid: bool = False) -> Dict[str, Any]:
     """
     Get comprehensive statistics for trading data (backward compatibility).
     
     Args:
         df: DataFrame with OHLCV data
+        assume_valid: Skip validation when the caller has already validated df
         
     Returns:
         Dictionary with data statistics
     """
-    return DataValidator.get_data_statistics(df)
+    return DataValidator.get_data_statistics(df, assume_valid=assume_valid).to_dict()
 
 
 # Example usage
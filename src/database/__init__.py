@@ -5,8 +5,9 @@ Database Module
 This module handles SQLite database operations for storing backtest results.
 """
 
-from .manager import DatabaseManager
+from .manager import DatabaseManager, BatchWriter
 
 __all__ = [
-    'DatabaseManager'
+    'DatabaseManager',
+    'BatchWriter'
 ]
@@ -5,73 +5,448 @@ Database Manager
 This module handles SQLite database operations for storing backtest results.
 """
 
+import asyncio
+import os
 import sqlite3
 import json
-from typing import Dict, Any
+import threading
+from itertools import chain
+from typing import Dict, Any, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Applied to every connection; journal_mode=WAL is persisted in the file by
+# init_database instead
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',  # WAL makes NORMAL crash-safe
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',  # 64 MB page cache
+    'PRAGMA mmap_size=268435456',  # Read through a 256 MB memory map
+)
+
+# Added by fast_mode: no fsyncs and an in-memory rollback journal instead of
+# WAL. A crash can corrupt the file, so only for throwaway databases
+_FAST_MODE_PRAGMAS = (
+    'PRAGMA synchronous=OFF',
+    'PRAGMA journal_mode=MEMORY',
+)
+
+# SQL is kept in module constants so the connection's statement cache gets
+# hits on the same text every call
+_STATEMENT_CACHE_SIZE = 256
+
+_INSERT_RESULT_SQL = '''
+    INSERT INTO backtest_results 
+    (strategy_name, start_date, end_date, initial_cash, final_cash,
+     total_return, total_return_pct, sharpe_ratio, max_drawdown,
+     max_drawdown_pct, total_trades, winning_trades, losing_trades,
+     win_rate, avg_trade_return, strategy_params, data_info)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SELECT_RECENT_SQL = '''
+    SELECT * FROM backtest_results 
+    ORDER BY created_at DESC 
+    LIMIT ?
+'''
+
+_SELECT_TRADES_SQL = '''
+    SELECT * FROM trades 
+    WHERE backtest_id = ?
+    ORDER BY entry_date
+'''
+
+# Large trade lists are inserted as multi-row VALUES statements, sized to stay
+# under SQLite's historical 999 bound-parameter limit
+_TRADE_COLUMNS = 9
+_TRADES_PER_STATEMENT = 999 // _TRADE_COLUMNS
+_MULTI_ROW_MIN_TRADES = 32
+_TRADE_ROW_PLACEHOLDER = '(' + ', '.join(['?'] * _TRADE_COLUMNS) + ')'
+_INSERT_TRADES_PREFIX = '''
+    INSERT INTO trades 
+    (backtest_id, entry_date, exit_date, entry_price, exit_price,
+     size, pnl, pnl_pct, trade_duration)
+    VALUES '''
+_INSERT_TRADE_SQL = _INSERT_TRADES_PREFIX + _TRADE_ROW_PLACEHOLDER
+_INSERT_TRADES_CHUNK_SQL = _INSERT_TRADES_PREFIX + ', '.join([_TRADE_ROW_PLACEHOLDER] * _TRADES_PER_STATEMENT)
+
+
+def _dumps(value: Any) -> str:
+    """
+    Serialize a value to JSON text, using orjson when it is installed.
+    
+    Args:
+        value: JSON-compatible value (NumPy scalars are accepted by orjson)
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # Types orjson rejects get the stdlib encoder's behaviour
+    return json.dumps(value)
+
+
+def _result_row(results: Dict[str, Any]) -> tuple:
+    """
+    Build the backtest_results parameter tuple for a results dictionary.
+    
+    Args:
+        results: Dictionary containing backtest results
+        
+    Returns:
+        Parameters for _INSERT_RESULT_SQL
+    """
+    return (
+        results['strategy_name'],
+        results['start_date'],
+        results['end_date'],
+        results['initial_cash'],
+        results['final_cash'],
+        results['total_return'],
+        results['total_return_pct'],
+        results.get('sharpe_ratio'),
+        results.get('max_drawdown'),
+        results.get('max_drawdown_pct'),
+        results.get('total_trades', 0),
+        results.get('winning_trades', 0),
+        results.get('losing_trades', 0),
+        results.get('win_rate', 0),
+        results.get('avg_trade_return', 0),
+        _dumps(results.get('strategy_params', {})),
+        _dumps(results.get('data_info', {}))
+    )
+
+
+def _trade_rows(backtest_id: int, trades: List[Dict[str, Any]]) -> List[tuple]:
+    """
+    Build trades parameter tuples for one backtest.
+    
+    Args:
+        backtest_id: ID of the parent backtest row
+        trades: Trade dictionaries
+        
+    Returns:
+        One parameter tuple per trade
+    """
+    return [
+        (
+            backtest_id,
+            trade['entry_date'],
+            trade['exit_date'],
+            trade['entry_price'],
+            trade['exit_price'],
+            trade['size'],
+            trade['pnl'],
+            trade['pnl_pct'],
+            trade['trade_duration']
+        )
+        for trade in trades
+    ]
+
+
+def _batch_ids(last_id: int, count: int) -> List[int]:
+    """
+    IDs of a batch of parent rows inserted with one executemany.
+    
+    The batch is inserted under a write lock into an AUTOINCREMENT table, so
+    its rows get consecutive IDs ending at last_insert_rowid().
+    
+    Args:
+        last_id: last_insert_rowid() after the batch insert
+        count: Number of rows in the batch
+        
+    Returns:
+        Database IDs of the batch, in insert order
+    """
+    return list(range(last_id - count + 1, last_id + 1))
+
+
+def _batch_trade_rows(backtest_ids: List[int], results_list: List[Dict[str, Any]]) -> List[tuple]:
+    """
+    Build trades parameter tuples for a batch of backtests.
+    
+    Args:
+        backtest_ids: IDs of the parent rows, in the order of results_list
+        results_list: Dictionaries containing backtest results
+        
+    Returns:
+        One parameter tuple per trade, for results that have trades
+    """
+    trade_rows = []
+    for backtest_id, results in zip(backtest_ids, results_list):
+        # Collect individual trades if available
+        if 'trades' in results:
+            trade_rows.extend(_trade_rows(backtest_id, results['trades']))
+    return trade_rows
+
+
+def _trade_statements(trade_rows: List[tuple]):
+    """
+    Plan the statements inserting trade rows.
+    
+    Small batches use executemany; large ones are packed into multi-row
+    statements to amortize per-statement overhead.
+    
+    Args:
+        trade_rows: Parameter tuples from _trade_rows
+        
+    Yields:
+        (sql, parameters, many) tuples; many selects executemany over execute
+    """
+    if len(trade_rows) < _MULTI_ROW_MIN_TRADES:
+        if trade_rows:
+            yield _INSERT_TRADE_SQL, trade_rows, True
+        return
+    
+    for start in range(0, len(trade_rows), _TRADES_PER_STATEMENT):
+        chunk = trade_rows[start:start + _TRADES_PER_STATEMENT]
+        if len(chunk) == _TRADES_PER_STATEMENT:
+            sql = _INSERT_TRADES_CHUNK_SQL
+        else:
+            sql = _INSERT_TRADES_PREFIX + ', '.join([_TRADE_ROW_PLACEHOLDER] * len(chunk))
+        yield sql, list(chain.from_iterable(chunk)), False
+
+
+class BatchWriter:
+    """
+    Buffers backtest results and stores them with save_batch in groups.
+    
+    Created by DatabaseManager.batch_writer(). A full buffer is flushed as
+    one transaction; whatever is pending is flushed when the context exits,
+    including on error, since every buffered result is already complete.
+    """
+    
+    def __init__(self, db_manager: 'DatabaseManager', size: int = 10000):
+        """
+        Initialize the writer.
+        
+        Args:
+            db_manager: Database manager the results are saved to
+            size: Number of buffered results that triggers a flush
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.db_manager = db_manager
+        self.size = size
+        self.pending: List[Dict[str, Any]] = []
+        self.backtest_ids: List[int] = []
+    
+    def __enter__(self) -> 'BatchWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+    
+    def append(self, results: Dict[str, Any]):
+        """
+        Buffer one backtest result, flushing if the buffer is full.
+        
+        Args:
+            results: Dictionary containing backtest results
+        """
+        self.pending.append(results)
+        if len(self.pending) >= self.size:
+            self.flush()
+    
+    def flush(self) -> List[int]:
+        """
+        Save the buffered results in one transaction.
+        
+        Returns:
+            Database IDs of the flushed records, in insert order
+        """
+        if not self.pending:
+            return []
+        backtest_ids = self.db_manager.save_batch(self.pending)
+        self.pending = []
+        self.backtest_ids.extend(backtest_ids)
+        return backtest_ids
 
 
 class DatabaseManager:
-    """Handles SQLite database operations for storing backtest results."""
+    """
+    Handles SQLite database operations for storing backtest results.
+    
+    The database runs in WAL journal mode (unless fast_mode is set), so
+    SQLite keeps ``-wal`` and ``-shm`` sidecar files next to ``db_path``;
+    the directory must be writable and the files must stay alongside the
+    database.
+    
+    A single long-lived connection is shared by all methods (and threads,
+    serialized by a lock); call close() or use the manager as a context
+    manager to release it.
+    """
+    
+    # Files whose schema this process already created, keyed by absolute path
+    # and mapped to (schema_version, result columns, trade columns)
+    _initialized_paths: Dict[str, tuple] = {}
     
-    def __init__(self, db_path: str = "backtest_results.db"):
+    def __init__(self, db_path: str = "backtest_results.db", fast_mode: bool = False):
         """
         Initialize database manager.
         
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, ':memory:' for a private
+                in-memory database, or a 'file:' URI (e.g.
+                'file::memory:?cache=shared' to share one in-memory database
+                between managers)
+            fast_mode: Trade durability for speed (synchronous=OFF and an
+                in-memory journal instead of WAL); for scratch databases such
+                as in tests, never for results worth keeping
         """
         self.db_path = db_path
-        self.init_database()
+        self.fast_mode = fast_mode
+        self._pragmas = _CONNECTION_PRAGMAS + (_FAST_MODE_PRAGMAS if fast_mode else ())
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._async_conn = None
+        self._async_lock = None
+        
+        # Skip the schema setup for files already initialized by this process.
+        # The schema version check catches files deleted and recreated since.
+        key = os.path.abspath(db_path) if db_path != ':memory:' else None
+        cached = self._initialized_paths.get(key)
+        if cached is not None and cached[0] == self._schema_version():
+            _, self._result_columns, self._trade_columns = cached
+        else:
+            self.init_database()
+            # A fast_mode file is not in WAL, so later managers must set it up
+            if key is not None and not fast_mode:
+                self._initialized_paths[key] = (
+                    self._schema_version(), self._result_columns, self._trade_columns
+                )
+    
+    @classmethod
+    def clear_init_cache(cls):
+        """Forget which database files were initialized, forcing init_database on next use."""
+        cls._initialized_paths.clear()
+    
+    def _schema_version(self) -> int:
+        """Return the file's schema version counter (0 for an empty database)."""
+        with self._lock:
+            return self._conn.execute('PRAGMA schema_version').fetchone()[0]
+    
+    def __enter__(self) -> 'DatabaseManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    async def close_async(self):
+        """Close the async writer connection (if opened) and the shared connection."""
+        if self._async_conn is not None:
+            await self._async_conn.close()
+            self._async_conn = None
+        self.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the shared connection with the per-connection tuning PRAGMAs applied.
+        
+        Returns:
+            SQLite connection
+        """
+        # Transactions are managed explicitly (BEGIN/COMMIT) by the writers
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            uri=self.db_path.startswith('file:')
+        )
+        cursor = conn.cursor()
+        for pragma in self._pragmas:
+            cursor.execute(pragma)
+        return conn
     
     def init_database(self):
         """Initialize the database and create tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create backtest results table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS backtest_results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                strategy_name TEXT NOT NULL,
-                start_date TEXT NOT NULL,
-                end_date TEXT NOT NULL,
-                initial_cash REAL NOT NULL,
-                final_cash REAL NOT NULL,
-                total_return REAL NOT NULL,
-                total_return_pct REAL NOT NULL,
-                sharpe_ratio REAL,
-                max_drawdown REAL,
-                max_drawdown_pct REAL,
-                total_trades INTEGER,
-                winning_trades INTEGER,
-                losing_trades INTEGER,
-                win_rate REAL,
-                avg_trade_return REAL,
-                strategy_params TEXT,
-                data_info TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            # Larger pages can only be chosen before the file has any content
+            # (and before WAL is enabled), so only brand-new databases get them
+            if cursor.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()[0] == 0:
+                cursor.execute('PRAGMA page_size=8192')
+            
+            # WAL lets readers run alongside a writer; the mode persists in the file
+            if not self.fast_mode:
+                cursor.execute('PRAGMA journal_mode=WAL')
+                cursor.execute('PRAGMA wal_autocheckpoint=1000')
+            
+            # Create backtest results table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS backtest_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    strategy_name TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    initial_cash REAL NOT NULL,
+                    final_cash REAL NOT NULL,
+                    total_return REAL NOT NULL,
+                    total_return_pct REAL NOT NULL,
+                    sharpe_ratio REAL,
+                    max_drawdown REAL,
+                    max_drawdown_pct REAL,
+                    total_trades INTEGER,
+                    winning_trades INTEGER,
+                    losing_trades INTEGER,
+                    win_rate REAL,
+                    avg_trade_return REAL,
+                    strategy_params TEXT,
+                    data_info TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Create trades table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS trades (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    backtest_id INTEGER,
+                    entry_date TEXT,
+                    exit_date TEXT,
+                    entry_price REAL,
+                    exit_price REAL,
+                    size REAL,
+                    pnl REAL,
+                    pnl_pct REAL,
+                    trade_duration INTEGER,
+                    FOREIGN KEY (backtest_id) REFERENCES backtest_results (id)
+                )
+            ''')
+            
+            # Indexes for get_trades (filter + order) and get_backtest_results (recent first)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_trades_backtest_id
+                ON trades (backtest_id, entry_date)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_results_created_at
+                ON backtest_results (created_at DESC)
+            ''')
+            
+            # Column names in SELECT * order, so the getters can zip plain tuples
+            self._result_columns = tuple(
+                row[1] for row in cursor.execute('PRAGMA table_info(backtest_results)')
             )
-        ''')
-        
-        # Create trades table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                backtest_id INTEGER,
-                entry_date TEXT,
-                exit_date TEXT,
-                entry_price REAL,
-                exit_price REAL,
-                size REAL,
-                pnl REAL,
-                pnl_pct REAL,
-                trade_duration INTEGER,
-                FOREIGN KEY (backtest_id) REFERENCES backtest_results (id)
+            self._trade_columns = tuple(
+                row[1] for row in cursor.execute('PRAGMA table_info(trades)')
             )
-        ''')
-        
-        conn.commit()
-        conn.close()
     
     def save_backtest_result(self, results: Dict[str, Any]) -> int:
         """
@@ -83,62 +458,132 @@ class DatabaseManager:
         Returns:
             Database ID of the inserted record
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self.save_batch([results])[0]
+    
+    def save_batch(self, results_list: List[Dict[str, Any]]) -> List[int]:
+        """
+        Save several backtest results in a single transaction.
         
-        cursor.execute('''
-            INSERT INTO backtest_results 
-            (strategy_name, start_date, end_date, initial_cash, final_cash,
-             total_return, total_return_pct, sharpe_ratio, max_drawdown,
-             max_drawdown_pct, total_trades, winning_trades, losing_trades,
-             win_rate, avg_trade_return, strategy_params, data_info)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            results['strategy_name'],
-            results['start_date'],
-            results['end_date'],
-            results['initial_cash'],
-            results['final_cash'],
-            results['total_return'],
-            results['total_return_pct'],
-            results.get('sharpe_ratio'),
-            results.get('max_drawdown'),
-            results.get('max_drawdown_pct'),
-            results.get('total_trades', 0),
-            results.get('winning_trades', 0),
-            results.get('losing_trades', 0),
-            results.get('win_rate', 0),
-            results.get('avg_trade_return', 0),
-            json.dumps(results.get('strategy_params', {})),
-            json.dumps(results.get('data_info', {}))
-        ))
-        
-        backtest_id = cursor.lastrowid
-        
-        # Save individual trades if available
-        if 'trades' in results:
-            for trade in results['trades']:
-                cursor.execute('''
-                    INSERT INTO trades 
-                    (backtest_id, entry_date, exit_date, entry_price, exit_price,
-                     size, pnl, pnl_pct, trade_duration)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    backtest_id,
-                    trade['entry_date'],
-                    trade['exit_date'],
-                    trade['entry_price'],
-                    trade['exit_price'],
-                    trade['size'],
-                    trade['pnl'],
-                    trade['pnl_pct'],
-                    trade['trade_duration']
-                ))
-        
-        conn.commit()
-        conn.close()
-        
-        return backtest_id
+        Either every result and its trades are stored, or (on error) none are.
+        
+        Args:
+            results_list: Dictionaries containing backtest results
+            
+        Returns:
+            Database IDs of the inserted records, in input order
+        """
+        result_rows = [_result_row(results) for results in results_list]
+        
+        # One transaction for all parent rows and trades: a single sync
+        # regardless of how many results and trades there are. The connection
+        # context commits on success and rolls back if anything raises.
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            
+            cursor.executemany(_INSERT_RESULT_SQL, result_rows)
+            last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+            backtest_ids = _batch_ids(last_id, len(result_rows))
+            trade_rows = _batch_trade_rows(backtest_ids, results_list)
+            
+            for sql, params, many in _trade_statements(trade_rows):
+                if many:
+                    cursor.executemany(sql, params)
+                else:
+                    cursor.execute(sql, params)
+        
+        return backtest_ids
+        
+    def batch_writer(self, size: int = 10000) -> BatchWriter:
+        """
+        Buffer results and save them in groups of size.
+        
+        Use as a context manager so the last partial group is flushed:
+        
+            with db.batch_writer() as writer:
+                for results in sweep:
+                    writer.append(results)
+        
+        Args:
+            size: Number of buffered results saved per transaction
+            
+        Returns:
+            BatchWriter bound to this manager
+        """
+        return BatchWriter(self, size)
+    
+    async def save_backtest_result_async(self, results: Dict[str, Any]) -> int:
+        """
+        Save backtest results without blocking the event loop.
+        
+        Args:
+            results: Dictionary containing backtest results
+            
+        Returns:
+            Database ID of the inserted record
+        """
+        return (await self.save_batch_async([results]))[0]
+    
+    async def save_batch_async(self, results_list: List[Dict[str, Any]]) -> List[int]:
+        """
+        Save several backtest results in one transaction without blocking the event loop.
+        
+        Writes go through a single aiosqlite connection, serialized by an
+        asyncio lock, so concurrent tasks queue behind one writer while WAL
+        lets readers proceed. Without aiosqlite the synchronous save_batch
+        runs in a worker thread instead.
+        
+        Args:
+            results_list: Dictionaries containing backtest results
+            
+        Returns:
+            Database IDs of the inserted records, in input order
+        """
+        try:
+            import aiosqlite
+        except ImportError:
+            return await asyncio.to_thread(self.save_batch, results_list)
+        
+        # A second connection to ':memory:' would open a separate database
+        if self.db_path == ':memory:':
+            return await asyncio.to_thread(self.save_batch, results_list)
+        
+        result_rows = [_result_row(results) for results in results_list]
+        
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        
+        async with self._async_lock:
+            if self._async_conn is None:
+                conn = await aiosqlite.connect(
+                    self.db_path, isolation_level=None, uri=self.db_path.startswith('file:')
+                )
+                for pragma in self._pragmas:
+                    await conn.execute(pragma)
+                self._async_conn = conn
+            conn = self._async_conn
+            
+            try:
+                await conn.execute('BEGIN IMMEDIATE')
+                
+                await conn.executemany(_INSERT_RESULT_SQL, result_rows)
+                async with conn.execute('SELECT last_insert_rowid()') as cursor:
+                    last_id = (await cursor.fetchone())[0]
+                backtest_ids = _batch_ids(last_id, len(result_rows))
+                trade_rows = _batch_trade_rows(backtest_ids, results_list)
+                
+                for sql, params, many in _trade_statements(trade_rows):
+                    if many:
+                        await conn.executemany(sql, params)
+                    else:
+                        await conn.execute(sql, params)
+                
+                await conn.execute('COMMIT')
+            except Exception:
+                await conn.execute('ROLLBACK')
+                raise
+        
+        return backtest_ids
         
     def get_backtest_results(self, limit: int = 10) -> list:
         """
@@ -150,19 +595,15 @@ class DatabaseManager:
         Returns:
             List of backtest result dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM backtest_results 
-            ORDER BY created_at DESC 
-            LIMIT ?
-        ''', (limit,))
-        
-        results = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            cursor.execute(_SELECT_RECENT_SQL, (limit,))
+            
+            results = cursor.fetchall()
         
-        return [dict(zip([col[0] for col in cursor.description], row)) for row in results]
+        columns = self._result_columns
+        return [dict(zip(columns, row)) for row in results]
         
     def get_trades(self, backtest_id: int) -> list:
         """
@@ -174,16 +615,12 @@ class DatabaseManager:
         Returns:
             List of trade dictionaries
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM trades 
-            WHERE backtest_id = ?
-            ORDER BY entry_date
-        ''', (backtest_id,))
-        
-        trades = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            cursor.execute(_SELECT_TRADES_SQL, (backtest_id,))
+            
+            trades = cursor.fetchall()
         
-        return [dict(zip([col[0] for col in cursor.description], row)) for row in trades]
+        columns = self._trade_columns
+        return [dict(zip(columns, row)) for row in trades]
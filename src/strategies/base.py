@@ -5,9 +5,39 @@ Base Strategy Class
 This module provides the base strategy class for all trading strategies.
 """
 
+import logging
+from array import array
+from dataclasses import dataclass
+from datetime import date as Date
+
+import numpy as np
 import backtrader as bt
 
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+@dataclass(frozen=True, slots=True)
+class _TradeRecord:
+    """
+    A closed trade as exposed by BaseStrategy.trades.
+    
+    Slotted to keep per-trade memory small; item access (``t['pnl']``)
+    is kept for code written against the previous dict records.
+    """
+    date: Date
+    price: float
+    pnl: float
+    pnlcomm: float
+    size: float
+    
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
 class BaseStrategy(bt.Strategy):
     """
     Base class for all trading strategies.
@@ -18,16 +48,57 @@ class BaseStrategy(bt.Strategy):
     
     params = ()
     
+    # Fraction of portfolio value committed when entering a position
+    _SIZE_FRAC = 0.95
+    
+    # Strategies whose trades follow from signals() alone may set this so
+    # run_backtest uses the vectorized path instead of the event loop
+    __vectorizable__ = False
+    
     def __init__(self):
         """Initialize the strategy."""
         super().__init__()
-        self.trades = []
         self.trade_count = 0
         
+        # Closed trades stored column-wise: one compact buffer per field
+        self._trade_dates = []
+        self._trade_prices = array('d')
+        self._trade_pnl = array('d')
+        self._trade_pnlcomm = array('d')
+        self._trade_size = array('d')
+    
+    @property
+    def trades(self):
+        """
+        Closed trades as a list of records.
+        
+        Built on access from the columnar trade buffers.
+        
+        Returns:
+            list: One record per trade with date, price, pnl, pnlcomm and size
+        """
+        return [
+            _TradeRecord(*fields)
+            for fields in zip(
+                self._trade_dates,
+                self._trade_prices,
+                self._trade_pnl,
+                self._trade_pnlcomm,
+                self._trade_size
+            )
+        ]
+        
     def log(self, txt, dt=None):
-        """Logging function for this strategy."""
+        """
+        Logging function for this strategy.
+        
+        Messages go to this module's logger at INFO level; with no handler
+        configured the call returns after a level check.
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return
         dt = dt or self.datas[0].datetime.date(0)
-        print(f'{dt.isoformat()}: {txt}')
+        logger.info('%s: %s', dt.isoformat(), txt)
         
     def notify_trade(self, trade):
         """
@@ -38,14 +109,27 @@ class BaseStrategy(bt.Strategy):
         """
         if trade.isclosed:
             self.trade_count += 1
-            self.trades.append({
-                'date': self.datas[0].datetime.date(0),
-                'price': trade.price,
-                'pnl': trade.pnl,
-                'pnlcomm': trade.pnlcomm,
-                'size': trade.size
-            })
+            self._trade_dates.append(self.datas[0].datetime.date(0))
+            self._trade_prices.append(trade.price)
+            self._trade_pnl.append(trade.pnl)
+            self._trade_pnlcomm.append(trade.pnlcomm)
+            self._trade_size.append(trade.size)
+            
+    @classmethod
+    def signals(cls, close, **params):
+        """
+        Entry and exit signals for the vectorized backtest.
+        
+        Args:
+            close: Close prices as a NumPy array
+            **params: Strategy parameters
             
+        Returns:
+            Array with one value per bar: positive to buy, negative to sell,
+            zero to hold
+        """
+        raise NotImplementedError(f"{cls.__name__} does not provide vectorized signals")
+        
     def next(self):
         """
         Define the main strategy logic.
@@ -61,14 +145,18 @@ class BaseStrategy(bt.Strategy):
         Returns:
             dict: Trade summary statistics
         """
-        if not self.trades:
+        total_trades = len(self._trade_pnlcomm)
+        if not total_trades:
             return {'total_trades': 0, 'total_pnl': 0, 'avg_pnl': 0}
             
-        total_pnl = sum(trade['pnlcomm'] for trade in self.trades)
+        # Zero-copy view of the P&L buffer for vectorized reductions
+        pnl = np.frombuffer(self._trade_pnlcomm, dtype=np.float64)
+        total_pnl = float(pnl.sum())
+        
         return {
-            'total_trades': len(self.trades),
+            'total_trades': total_trades,
             'total_pnl': total_pnl,
-            'avg_pnl': total_pnl / len(self.trades) if self.trades else 0,
-            'winning_trades': len([t for t in self.trades if t['pnlcomm'] > 0]),
-            'losing_trades': len([t for t in self.trades if t['pnlcomm'] < 0])
+            'avg_pnl': total_pnl / total_trades,
+            'winning_trades': int(np.count_nonzero(pnl > 0)),
+            'losing_trades': int(np.count_nonzero(pnl < 0))
         }
@@ -7,6 +7,7 @@ This module implements a Bollinger Bands strategy.
 
 import backtrader as bt
 from .base import BaseStrategy
+from .signals import PrecomputedLine, bollinger_bands, preloaded_closes
 
 
 class BollingerBandsStrategy(BaseStrategy):
@@ -26,14 +27,28 @@ class BollingerBandsStrategy(BaseStrategy):
     
     def __init__(self):
         super().__init__()
-        self.bbands = bt.indicators.BollingerBands(
-            self.datas[0].close,
-            period=self.params.period,
-            devfactor=self.params.devfactor
-        )
+        close = preloaded_closes(self.datas[0])
+        if close is not None:
+            top, bot = bollinger_bands(close, self.params.period, self.params.devfactor)
+            self._top = PrecomputedLine(values=top)
+            self._bot = PrecomputedLine(values=bot)
+        else:
+            self.bbands = bt.indicators.BollingerBands(
+                self.datas[0].close,
+                period=self.params.period,
+                devfactor=self.params.devfactor
+            )
+            self._top = self.bbands.lines.top
+            self._bot = self.bbands.lines.bot
         self.order = None
         self.buy_price = None
         
+        # Exit thresholds, fixed per entry in notify_order
+        self._stop_loss = self.params.stop_loss
+        self._take_profit = self.params.take_profit
+        self._sl_price = None
+        self._tp_price = None
+        
     def notify_order(self, order):
         """Handle order notifications."""
         if order.status in [order.Submitted, order.Accepted]:
@@ -42,6 +57,8 @@ class BollingerBandsStrategy(BaseStrategy):
         if order.status in [order.Completed]:
             if order.isbuy():
                 self.buy_price = order.executed.price
+                self._sl_price = self.buy_price * (1 - self._stop_loss)
+                self._tp_price = self.buy_price * (1 + self._take_profit)
                 
         self.order = None
         
@@ -50,23 +67,23 @@ class BollingerBandsStrategy(BaseStrategy):
         if self.order:
             return
             
+        current_price = self.data.close[0]
+        
         if not self.position:
             # Buy signal: price touches lower band
-            if self.data.close[0] <= self.bbands.lines.bot[0]:
-                size = int(self.broker.getvalue() * 0.95 / self.data.close[0])
+            if current_price <= self._bot[0]:
+                size = int(self.broker.getvalue() * self._SIZE_FRAC / current_price)
                 self.order = self.buy(size=size)
                 
         else:
-            current_price = self.data.close[0]
-            
             # Stop loss
-            if current_price <= self.buy_price * (1 - self.params.stop_loss):
+            if current_price <= self._sl_price:
                 self.order = self.sell()
                 
             # Take profit
-            elif current_price >= self.buy_price * (1 + self.params.take_profit):
+            elif current_price >= self._tp_price:
                 self.order = self.sell()
                 
             # Exit signal: price touches upper band
-            elif self.data.close[0] >= self.bbands.lines.top[0]:
+            elif current_price >= self._top[0]:
                 self.order = self.sell()
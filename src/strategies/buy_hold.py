@@ -5,6 +5,7 @@ Buy and Hold Strategy
 This module implements a simple buy and hold strategy.
 """
 
+import numpy as np
 import backtrader as bt
 from .base import BaseStrategy
 
@@ -23,6 +24,13 @@ class BuyAndHoldStrategy(BaseStrategy):
         self.order = None
         self.bought = False
         
+    @classmethod
+    def signals(cls, close, **params):
+        """Buy on the first bar and never sell."""
+        signals = np.zeros(len(close))
+        signals[:1] = 1.0
+        return signals
+        
     def notify_order(self, order):
         """Handle order notifications."""
         if order.status in [order.Submitted, order.Accepted]:
@@ -42,5 +50,5 @@ class BuyAndHoldStrategy(BaseStrategy):
         # Buy once at the beginning if we haven't bought yet
         if not self.position and not self.bought:
             # Use 95% of available cash
-            size = int(self.broker.getvalue() * 0.95 / self.data.close[0])
+            size = int(self.broker.getvalue() * self._SIZE_FRAC / self.data.close[0])
             self.order = self.buy(size=size)
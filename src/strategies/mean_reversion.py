@@ -32,6 +32,12 @@ class MeanReversionStrategy(BaseStrategy):
         self.order = None
         self.buy_price = None
         
+        # Exit thresholds, fixed per entry in notify_order
+        self._stop_loss = self.params.stop_loss
+        self._take_profit = self.params.take_profit
+        self._sl_price = None
+        self._tp_price = None
+        
     def notify_order(self, order):
         """Handle order notifications."""
         if order.status in [order.Submitted, order.Accepted]:
@@ -40,6 +46,8 @@ class MeanReversionStrategy(BaseStrategy):
         if order.status in [order.Completed]:
             if order.isbuy():
                 self.buy_price = order.executed.price
+                self._sl_price = self.buy_price * (1 - self._stop_loss)
+                self._tp_price = self.buy_price * (1 + self._take_profit)
                 
         self.order = None
         
@@ -55,16 +63,16 @@ class MeanReversionStrategy(BaseStrategy):
             # Buy signal: price is below SMA by threshold
             deviation = (sma_value - current_price) / sma_value
             if deviation >= self.params.threshold:
-                size = int(self.broker.getvalue() * 0.95 / current_price)
+                size = int(self.broker.getvalue() * self._SIZE_FRAC / current_price)
                 self.order = self.buy(size=size)
                 
         else:
             # Stop loss
-            if current_price <= self.buy_price * (1 - self.params.stop_loss):
+            if current_price <= self._sl_price:
                 self.order = self.sell()
                 
             # Take profit
-            elif current_price >= self.buy_price * (1 + self.params.take_profit):
+            elif current_price >= self._tp_price:
                 self.order = self.sell()
                 
             # Exit signal: price returns to or above SMA
@@ -7,6 +7,7 @@ This module implements a Relative Strength Index (RSI) strategy.
 
 import backtrader as bt
 from .base import BaseStrategy
+from .signals import PrecomputedLine, preloaded_closes, rsi
 
 
 class RSIStrategy(BaseStrategy):
@@ -27,10 +28,22 @@ class RSIStrategy(BaseStrategy):
     
     def __init__(self):
         super().__init__()
-        self.rsi = bt.indicators.RSI(self.datas[0].close, period=self.params.rsi_period)
+        close = preloaded_closes(self.datas[0])
+        if close is not None:
+            self.rsi = PrecomputedLine(values=rsi(close, self.params.rsi_period))
+        else:
+            self.rsi = bt.indicators.RSI(self.datas[0].close, period=self.params.rsi_period)
+        self._oversold = self.params.rsi_oversold
+        self._overbought = self.params.rsi_overbought
         self.order = None
         self.buy_price = None
         
+        # Exit thresholds, fixed per entry in notify_order
+        self._stop_loss = self.params.stop_loss
+        self._take_profit = self.params.take_profit
+        self._sl_price = None
+        self._tp_price = None
+        
     def notify_order(self, order):
         """Handle order notifications."""
         if order.status in [order.Submitted, order.Accepted]:
@@ -39,6 +52,8 @@ class RSIStrategy(BaseStrategy):
         if order.status in [order.Completed]:
             if order.isbuy():
                 self.buy_price = order.executed.price
+                self._sl_price = self.buy_price * (1 - self._stop_loss)
+                self._tp_price = self.buy_price * (1 + self._take_profit)
                 
         self.order = None
         
@@ -47,23 +62,24 @@ class RSIStrategy(BaseStrategy):
         if self.order:
             return
             
+        current_price = self.data.close[0]
+        rsi_value = self.rsi[0]
+        
         if not self.position:
             # Buy signal: RSI < oversold threshold
-            if self.rsi < self.params.rsi_oversold:
-                size = int(self.broker.getvalue() * 0.95 / self.data.close[0])
+            if rsi_value < self._oversold:
+                size = int(self.broker.getvalue() * self._SIZE_FRAC / current_price)
                 self.order = self.buy(size=size)
                 
         else:
-            current_price = self.data.close[0]
-            
             # Stop loss
-            if current_price <= self.buy_price * (1 - self.params.stop_loss):
+            if current_price <= self._sl_price:
                 self.order = self.sell()
                 
             # Take profit
-            elif current_price >= self.buy_price * (1 + self.params.take_profit):
+            elif current_price >= self._tp_price:
                 self.order = self.sell()
                 
             # Exit signal: RSI > overbought threshold
-            elif self.rsi > self.params.rsi_overbought:
+            elif rsi_value > self._overbought:
                 self.order = self.sell()
@@ -0,0 +1,254 @@
+"""
+Strategy Signal Kernels
+======================
+
+Array versions of the indicators behind the SMA, RSI and Bollinger Bands
+strategies. When the data is preloaded a strategy computes its signal once
+over all closes with these compiled loops and replays it bar by bar through
+PrecomputedLine, instead of running backtrader's per-bar indicator chain.
+
+The loops follow backtrader's arithmetic step for step, including the exactly
+rounded window sums of its averages, so crossover and RSI values match it bit
+for bit. The Bollinger Bands can differ in the last digit, since backtrader
+squares and takes roots through the platform's pow().
+"""
+
+import math
+from array import array
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+import backtrader as bt
+
+
+def _rolling_mean_loop(values, period):
+    """
+    Moving average over exact window sums, NaN until the first full window.
+    
+    Each window is summed with Shewchuk's algorithm and rounded as
+    math.fsum does, so the averages equal backtrader's bit for bit.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    partials = np.empty(64)
+    for i in range(period - 1, n):
+        # Accumulate the window into non-overlapping partial sums
+        m = 0
+        for j in range(i - period + 1, i + 1):
+            x = values[j]
+            k = 0
+            for p in range(m):
+                y = partials[p]
+                if abs(x) < abs(y):
+                    x, y = y, x
+                hi = x + y
+                lo = y - (hi - x)
+                if lo != 0.0:
+                    partials[k] = lo
+                    k += 1
+                x = hi
+            partials[k] = x
+            m = k + 1
+        
+        # Round the partials to the nearest double, ties to even
+        m -= 1
+        hi = partials[m]
+        lo = 0.0
+        while m > 0:
+            x = hi
+            m -= 1
+            y = partials[m]
+            hi = x + y
+            lo = y - (hi - x)
+            if lo != 0.0:
+                break
+        if m > 0 and ((lo < 0.0 and partials[m - 1] < 0.0) or (lo > 0.0 and partials[m - 1] > 0.0)):
+            y = lo * 2.0
+            x = hi + y
+            if y == x - hi:
+                hi = x
+        out[i] = hi / period
+    return out
+
+
+def _sma_signal_loop(fast, slow, start):
+    """
+    Crossover of two moving averages: 1.0 when fast crosses above slow,
+    -1.0 when it crosses below, else 0.0. NaN before start.
+    
+    A cross is measured against the last non-zero difference, as in
+    backtrader's CrossOver, so touching without crossing is not a signal.
+    """
+    n = fast.shape[0]
+    out = np.full(n, np.nan)
+    if start > n:
+        return out
+    
+    # Seed the last non-zero difference on the first bar with both averages
+    last_diff = fast[start - 1] - slow[start - 1]
+    for i in range(start, n):
+        if last_diff < 0.0 and fast[i] > slow[i]:
+            out[i] = 1.0
+        elif last_diff > 0.0 and fast[i] < slow[i]:
+            out[i] = -1.0
+        else:
+            out[i] = 0.0
+        diff = fast[i] - slow[i]
+        if diff != 0.0:
+            last_diff = diff
+    return out
+
+
+def _rsi_loop(close, period, avg_up, avg_down):
+    """
+    Wilder's RSI from the seed averages of the first period moves, NaN
+    before bar period.
+    
+    Flat windows, where backtrader would divide by zero, read 50.0 with no
+    movement at all and 100.0 with only gains.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period
+    alpha1 = 1.0 - alpha
+    
+    for i in range(period, n):
+        if i > period:
+            move = close[i] - close[i - 1]
+            avg_up = avg_up * alpha1 + max(move, 0.0) * alpha
+            avg_down = avg_down * alpha1 + max(-move, 0.0) * alpha
+        if avg_down != 0.0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+        elif avg_up != 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 50.0
+    return out
+
+
+@lru_cache(maxsize=1)
+def _get_kernels():
+    """
+    Compile the signal loops with Numba on first use.
+    
+    Returns:
+        (rolling_mean, sma_signal, rsi) callables; the pure Python versions
+        if numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _rolling_mean_loop, _sma_signal_loop, _rsi_loop
+    return (
+        njit(cache=True)(_rolling_mean_loop),
+        njit(cache=True)(_sma_signal_loop),
+        njit(cache=True)(_rsi_loop)
+    )
+
+
+def sma_crossover(close: np.ndarray, short_period: int, long_period: int) -> np.ndarray:
+    """
+    Crossover signal of a short and a long simple moving average.
+    
+    Args:
+        close: Close prices
+        short_period: Short moving average period
+        long_period: Long moving average period
+    
+    Returns:
+        1.0 / -1.0 on upward / downward crosses, 0.0 otherwise, NaN until
+        both averages have a previous value
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    rolling_mean, sma_signal, _ = _get_kernels()
+    return sma_signal(
+        rolling_mean(close, short_period),
+        rolling_mean(close, long_period),
+        max(short_period, long_period)
+    )
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Relative Strength Index with Wilder's smoothing.
+    
+    Args:
+        close: Close prices
+        period: Smoothing period
+    
+    Returns:
+        RSI values between 0 and 100, NaN for the first period bars
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    if period + 1 > close.shape[0]:
+        return np.full(close.shape[0], np.nan)
+    
+    # Seed both averages with the plain mean of the first period moves
+    moves = np.diff(close[:period + 1])
+    avg_up = math.fsum(np.maximum(moves, 0.0)) / period
+    avg_down = math.fsum(np.maximum(-moves, 0.0)) / period
+    
+    _, _, rsi_kernel = _get_kernels()
+    return rsi_kernel(close, period, avg_up, avg_down)
+
+
+def bollinger_bands(close: np.ndarray, period: int = 20, devfactor: float = 2.0):
+    """
+    Bollinger Bands around a simple moving average.
+    
+    Args:
+        close: Close prices
+        period: Moving average and deviation period
+        devfactor: Number of standard deviations to the bands
+    
+    Returns:
+        (top, bot) arrays, NaN until the first full window
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    rolling_mean, _, _ = _get_kernels()
+    mid = rolling_mean(close, period)
+    
+    # Population deviation as mean of squares minus squared mean, as StdDev
+    with np.errstate(invalid='ignore'):
+        stddev = devfactor * (rolling_mean(close * close, period) - mid * mid) ** 0.5
+    return mid + stddev, mid - stddev
+
+
+def preloaded_closes(data) -> Optional[np.ndarray]:
+    """
+    All close prices of a backtrader data feed, if it has been preloaded.
+    
+    Args:
+        data: Backtrader data feed
+    
+    Returns:
+        Float64 copy of the close line, or None when the feed is loaded bar
+        by bar (live feeds, preload=False, exactbars)
+    """
+    closes = data.close.array
+    if not isinstance(closes, array) or not len(closes):
+        return None
+    return np.array(closes, dtype=np.float64)
+
+
+class PrecomputedLine(bt.Indicator):
+    """
+    Replays an array computed ahead of time over the preloaded data.
+    
+    The minimum period is taken from the leading NaNs, so the strategy's
+    next() starts on the same bar as with the equivalent indicator.
+    """
+    
+    lines = ('value',)
+    params = (('values', None),)
+    
+    def __init__(self):
+        valid = np.flatnonzero(~np.isnan(self.p.values))
+        self.addminperiod(int(valid[0]) + 1 if valid.size else len(self.p.values) + 1)
+    
+    def next(self):
+        self.lines.value[0] = self.p.values[len(self) - 1]
+    
+    def once(self, start, end):
+        self.lines.value.array[start:end] = array('d', self.p.values[start:end])
@@ -7,6 +7,7 @@ This module implements a Simple Moving Average crossover strategy.
 
 import backtrader as bt
 from .base import BaseStrategy
+from .signals import PrecomputedLine, preloaded_closes, sma_crossover
 
 
 class SimpleMovingAverageStrategy(BaseStrategy):
@@ -26,21 +27,33 @@ class SimpleMovingAverageStrategy(BaseStrategy):
     
     def __init__(self):
         super().__init__()
-        self.short_ma = bt.indicators.SimpleMovingAverage(
-            self.datas[0].close, period=self.params.short_period
-        )
-        self.long_ma = bt.indicators.SimpleMovingAverage(
-            self.datas[0].close, period=self.params.long_period
-        )
+        close = preloaded_closes(self.datas[0])
         
-        # Crossover signal
-        self.crossover = bt.indicators.CrossOver(self.short_ma, self.long_ma)
+        # Crossover signal, computed up front when the whole series is loaded
+        if close is not None:
+            self.crossover = PrecomputedLine(
+                values=sma_crossover(close, self.params.short_period, self.params.long_period)
+            )
+        else:
+            self.short_ma = bt.indicators.SimpleMovingAverage(
+                self.datas[0].close, period=self.params.short_period
+            )
+            self.long_ma = bt.indicators.SimpleMovingAverage(
+                self.datas[0].close, period=self.params.long_period
+            )
+            self.crossover = bt.indicators.CrossOver(self.short_ma, self.long_ma)
         
         # Order tracking
         self.order = None
         self.buy_price = None
         self.buy_comm = None
         
+        # Exit thresholds, fixed per entry in notify_order
+        self._stop_loss = self.params.stop_loss
+        self._take_profit = self.params.take_profit
+        self._sl_price = None
+        self._tp_price = None
+        
     def notify_order(self, order):
         """Handle order notifications."""
         if order.status in [order.Submitted, order.Accepted]:
@@ -49,6 +62,8 @@ class SimpleMovingAverageStrategy(BaseStrategy):
         if order.status in [order.Completed]:
             if order.isbuy():
                 self.buy_price = order.executed.price
+                self._sl_price = self.buy_price * (1 - self._stop_loss)
+                self._tp_price = self.buy_price * (1 + self._take_profit)
                 self.buy_comm = order.executed.comm
                 
         self.order = None
@@ -58,24 +73,24 @@ class SimpleMovingAverageStrategy(BaseStrategy):
         if self.order:
             return
             
+        current_price = self.data.close[0]
+        
         if not self.position:
             # Buy signal: short MA crosses above long MA
-            if self.crossover > 0:
-                size = int(self.broker.getvalue() * 0.95 / self.data.close[0])
+            if self.crossover[0] > 0:
+                size = int(self.broker.getvalue() * self._SIZE_FRAC / current_price)
                 self.order = self.buy(size=size)
                 
         else:
             # Sell signals
-            current_price = self.data.close[0]
-            
             # Stop loss
-            if current_price <= self.buy_price * (1 - self.params.stop_loss):
+            if current_price <= self._sl_price:
                 self.order = self.sell()
                 
             # Take profit
-            elif current_price >= self.buy_price * (1 + self.params.take_profit):
+            elif current_price >= self._tp_price:
                 self.order = self.sell()
                 
             # Exit signal: short MA crosses below long MA
-            elif self.crossover < 0:
+            elif self.crossover[0] < 0:
                 self.order = self.sell()
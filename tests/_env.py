@@ -0,0 +1,50 @@
+"""
+Shared .env loading for the test modules.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+# Set once the .env file has been loaded, so subprocess-spawned workers that
+# inherit the environment skip the file entirely
+_LOADED_SENTINEL = "_TESTS_ENV_LOADED"
+
+# Value shipped in the example .env file, not a usable key
+_PLACEHOLDER_API_KEY = "your-google-api-key-here"
+
+
+@functools.cache
+def ensure_env_loaded() -> bool:
+    """
+    Load the project's .env file at most once per process.
+    
+    Returns:
+        True if the .env file was loaded (here or by a parent process)
+    """
+    if os.environ.get(_LOADED_SENTINEL):
+        return True
+    
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False
+    
+    env_path = Path(__file__).parent.parent / '.env'
+    if not env_path.exists():
+        return False
+    
+    load_dotenv(env_path)
+    os.environ[_LOADED_SENTINEL] = "1"
+    return True
+
+
+def has_google_api_key() -> bool:
+    """
+    Check whether a usable GOOGLE_API_KEY is set.
+    
+    Returns:
+        True if the key is set and is not the example placeholder
+    """
+    api_key = os.environ.get("GOOGLE_API_KEY")
+    return bool(api_key) and api_key != _PLACEHOLDER_API_KEY
@@ -0,0 +1,26 @@
+"""
+Buffered console output for the manual test scripts.
+"""
+
+import contextlib
+import io
+import sys
+
+
+@contextlib.contextmanager
+def buffered_section():
+    """
+    Collect everything printed inside the block and write it out at once.
+    
+    Each print to an unbuffered terminal is its own write and flush; a test
+    section prints dozens of progress lines, so they are gathered in memory
+    and flushed once when the section ends (also when it raises). Works as
+    a decorator on synchronous functions too.
+    """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield buffer
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
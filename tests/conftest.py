@@ -6,13 +6,21 @@ This file contains shared pytest configuration and fixtures.
 """
 
 import pytest
-import sys
 import os
+import json
 
-# Add project root to path for all tests
-project_root = os.path.dirname(os.path.dirname(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+
+@pytest.fixture(autouse=True, scope="session")
+def _warm_imports():
+    """
+    Import the heavy src packages (backtrader and friends) once up front.
+    
+    Keeps that one-off cost out of whichever test happens to run first.
+    """
+    import src.strategies
+    import src.data
+    import src.backtesting
+    import src.database
 
 
 @pytest.fixture(scope="session")
@@ -21,7 +29,125 @@ def project_root_path():
     return os.path.dirname(os.path.dirname(__file__))
 
 
+@pytest.fixture(scope="session")
+def synthetic_ohlcv_df():
+    """
+    Fixture that provides one seeded synthetic OHLCV frame for the session.
+    
+    Generation is deterministic, so tests share it instead of regenerating
+    identical data. Tests that hand it to code which may modify it should
+    pass a copy. Twenty daily bars are enough for the longest indicator
+    period the tests use (15) while keeping each backtest short.
+    """
+    from src.data.generators import generate_synthetic_data
+    
+    return generate_synthetic_data(
+        start_date='2023-01-01',
+        end_date='2023-01-20',
+        initial_price=100,
+        seed=42
+    )
+
+
+@pytest.fixture(scope="session")
+def synthetic_feed(data_provider, synthetic_ohlcv_df):
+    """
+    Fixture that provides a read-only DataFeed over synthetic_ohlcv_df.
+    
+    Built by the shared data_provider; from_dataframe keeps no per-call state.
+    """
+    return data_provider.from_dataframe(synthetic_ohlcv_df.copy(deep=False), name="synthetic")
+
+
+@pytest.fixture(scope="session")
+def backtest_engine():
+    """
+    Fixture that provides one BacktestEngine shared by the whole session.
+    
+    run_backtest builds a fresh Cerebro per call, so the engine carries no
+    state between backtests.
+    """
+    from src.backtesting import BacktestEngine
+    
+    return BacktestEngine(initial_cash=10000)
+
+
 @pytest.fixture(scope="function")
 def temp_db_file(tmp_path):
     """Fixture that provides a temporary database file path."""
     return tmp_path / "test_db.db"
+
+
+@pytest.fixture(scope="function")
+def memory_db():
+    """
+    Fixture that provides a fresh in-memory DatabaseManager per test.
+    
+    Function scoped on purpose: a shared database would leak rows between tests.
+    """
+    from src.database import DatabaseManager
+    
+    db = DatabaseManager(":memory:")
+    yield db
+    db.close()
+
+
+BINANCE_FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'binance')
+
+
+def _load_binance_fixture(name):
+    """Load a recorded Binance API response from tests/fixtures/binance."""
+    with open(os.path.join(BINANCE_FIXTURE_DIR, name)) as f:
+        return json.load(f)
+
+
+def _fake_binance_request(endpoint, params=None, signed=False):
+    """
+    Serve BinanceLoader requests from the recorded snapshots.
+    
+    Klines for any interval come from the daily snapshot of the symbol,
+    trimmed to the requested limit.
+    """
+    params = params or {}
+    if endpoint == '/api/v3/klines':
+        name = f"klines_{params['symbol'].lower()}_1d.json"
+        if not os.path.exists(os.path.join(BINANCE_FIXTURE_DIR, name)):
+            return []
+        return _load_binance_fixture(name)[-params.get('limit', 500):]
+    if endpoint == '/api/v3/ticker/price':
+        return _load_binance_fixture(f"ticker_price_{params['symbol'].lower()}.json")
+    if endpoint == '/api/v3/ticker/24hr':
+        return _load_binance_fixture(f"ticker_24hr_{params['symbol'].lower()}.json")
+    if endpoint == '/api/v3/exchangeInfo':
+        return _load_binance_fixture("exchange_info.json")
+    raise Exception(f"Binance API request failed: no fixture for {endpoint}")
+
+
+@pytest.fixture(scope="session")
+def data_provider(request):
+    """
+    Fixture that provides one DataProvider shared by the whole session.
+    
+    Its Binance loader answers from the recorded snapshots in
+    tests/fixtures/binance, unless the run selects the live API with
+    '-m network'. Only this provider's own loader is replaced, so other
+    tests are unaffected.
+    """
+    from src.data.providers import DataProvider
+    from src.data.loaders import BinanceLoader
+    
+    provider = DataProvider()
+    if 'network' not in (request.config.option.markexpr or ''):
+        loader = BinanceLoader()
+        loader._make_request = _fake_binance_request
+        provider.binance_loader = loader
+    return provider
+
+
+@pytest.fixture(scope="session")
+def btc_daily(data_provider):
+    """Fixture that downloads the last 100 BTC/USDT daily candles once per session."""
+    try:
+        return data_provider.load_binance('BTCUSDT', interval='1d', limit=100, name='BTC_daily')
+    except Exception as e:
+        pytest.skip(f"Binance data unavailable: {e}")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Record Binance API snapshots used by the offline Binance tests.
+
+Run from the project root with network access:
+
+    python -m tests.record_fixtures
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.loaders import BinanceLoader
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'binance')
+SYMBOLS = ('BTCUSDT', 'ETHUSDT')
+
+
+def _dump(name, payload):
+    """Write one snapshot file."""
+    path = os.path.join(FIXTURE_DIR, name)
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=1)
+        f.write('\n')
+    print(f"✓ {path}")
+
+
+def main():
+    """Fetch and store the responses the tests request."""
+    loader = BinanceLoader()
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    
+    for symbol in SYMBOLS:
+        klines = loader._make_request('/api/v3/klines', {'symbol': symbol, 'interval': '1d', 'limit': 100})
+        _dump(f"klines_{symbol.lower()}_1d.json", klines)
+    
+    _dump("ticker_price_btcusdt.json", loader._make_request('/api/v3/ticker/price', {'symbol': 'BTCUSDT'}))
+    _dump("ticker_24hr_btcusdt.json", loader._make_request('/api/v3/ticker/24hr', {'symbol': 'BTCUSDT'}))
+    
+    # The full exchange info lists every market; keep only the symbols used
+    exchange_info = loader._make_request('/api/v3/exchangeInfo')
+    exchange_info['symbols'] = [s for s in exchange_info['symbols'] if s['symbol'] in SYMBOLS]
+    _dump("exchange_info.json", exchange_info)
+
+
+if __name__ == "__main__":
+    main()
@@ -30,7 +30,7 @@ def run_comprehensive_test():
     print("=" * 50)
     
     result = subprocess.run([
-        sys.executable, "tests/test_comprehensive_agent.py"
+        sys.executable, "-m", "tests.test_comprehensive_agent"
     ], cwd=Path(__file__).parent.parent)
     
     return result.returncode == 0
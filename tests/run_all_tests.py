@@ -8,6 +8,7 @@ This script runs all tests in the tests directory using pytest.
 import sys
 import os
 import subprocess
+from importlib.util import find_spec
 
 
 def main():
@@ -27,13 +28,19 @@ def main():
         print("Running pytest on tests/ directory...")
         print()
         
-        result = subprocess.run([
+        command = [
             sys.executable, "-m", "pytest", 
             "tests/", 
             "-v",  # verbose output
             "--tb=short",  # short traceback format
             "-x"  # stop on first failure
-        ], text=True)
+        ]
+        
+        # Spread the test modules over all cores when pytest-xdist is installed
+        if find_spec("xdist") is not None:
+            command += ["-n", "auto", "--dist=loadscope"]
+        
+        result = subprocess.run(command, text=True)
         
         print()
         print("="*60)
@@ -8,20 +8,19 @@ A simple test to verify the ADK chat functionality works correctly.
 
 import sys
 import os
-from pathlib import Path
+import pytest
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Load environment variables
-try:
-    from dotenv import load_dotenv
-    env_path = Path(__file__).parent.parent / '.env'  # Go up one more level since we're in tests/
-    if env_path.exists():
-        load_dotenv(env_path)
-        print("✅ Environment variables loaded from .env file")
-except ImportError:
-    pass
+from tests._env import ensure_env_loaded, has_google_api_key
+if ensure_env_loaded():
+    print("✅ Environment variables loaded from .env file")
+
+# Skip before the heavy ADK imports when ADK or the API key is missing
+pytest.importorskip("google.adk.agents")
+pytestmark = pytest.mark.skipif(not has_google_api_key(), reason="requires GOOGLE_API_KEY")
 
 import asyncio
 from google.adk.agents import Agent
@@ -29,15 +28,14 @@ from google.adk.sessions import InMemorySessionService
 from google.adk.runners import Runner
 
 
+# Streamed events handled per batch in test_simple_chat
+_EVENT_BATCH_SIZE = 16
+
+
 async def test_simple_chat():
     """Test basic ADK chat functionality."""
     
-    # Check API key
-    api_key = os.environ.get("GOOGLE_API_KEY")
-    if not api_key:
-        print("❌ No API key found")
-        return
-    
+    api_key = os.environ["GOOGLE_API_KEY"]
     print(f"✅ Using API key: {api_key[:10]}...{api_key[-4:]}")
     
     # Create a simple agent
@@ -76,26 +74,32 @@ async def test_simple_chat():
         
         print("🤖 Agent: ", end="")
         events = []
+        pending = []
+        write = sys.stdout.write
+        
+        def _handle(event):
+            event_content = getattr(event, 'content', None)
+            if event_content is not None:
+                write(f"Content: {event_content}\n")
+        
         async for event in runner.run_async(
             user_id="test_user",
             session_id="test_session",
             new_message=content
         ):
             events.append(event)
-            print(f"Event type: {type(event)}, attributes: {dir(event)}")
+            pending.append(event)
+            final = event.is_final_response()
             
-            if hasattr(event, 'content') and event.content:
-                print(f"Content: {event.content}")
-            if hasattr(event, 'message') and event.message:
-                print(f"Message: {event.message}")
-            if hasattr(event, 'response') and event.response:
-                print(f"Response: {event.response}")
+            # Handle streamed events in batches; flush only once the final response arrives
+            if final or len(pending) >= _EVENT_BATCH_SIZE:
+                for pending_event in pending:
+                    _handle(pending_event)
+                pending.clear()
                 
-            if event.is_final_response():
-                print(f"Final response event: {event}")
-                # Try different ways to extract text
-                if hasattr(event, 'content'):
-                    print(f"Final content: {event.content}")
+            if final:
+                write(f"Final response event: {event}\n")
+                sys.stdout.flush()
                 break
                 
     except Exception as e:
@@ -104,4 +108,14 @@ async def test_simple_chat():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_simple_chat())
+    if not has_google_api_key():
+        print("❌ No API key found")
+        sys.exit(1)
+    
+    # uvloop's libuv loop speeds up ADK event streaming where available
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(test_simple_chat())
+    else:
+        uvloop.run(test_simple_chat())
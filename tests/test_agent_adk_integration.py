@@ -5,50 +5,44 @@ import os
 import sys
 import asyncio
 import pytest
-from pathlib import Path
+import pytest_asyncio
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Load environment variables
-try:
-    from dotenv import load_dotenv
-    env_path = Path(__file__).parent.parent / '.env'
-    if env_path.exists():
-        load_dotenv(env_path)
-except ImportError:
-    pass
+from tests._env import ensure_env_loaded, has_google_api_key
+from tests._report import buffered_section
+ensure_env_loaded()
+
+# Skip the module before importing the agent when ADK is not installed
+pytest.importorskip("google.adk.agents")
 
 from src.agents.trading_agent import TradingAgent
 
+requires_api_key = pytest.mark.skipif(not has_google_api_key(), reason="requires GOOGLE_API_KEY")
+
 
 class TestADKIntegration:
     """Test class for ADK agent integration."""
     
-    @pytest.fixture(scope="class")
-    def api_key(self):
-        """Check if API key is available."""
-        api_key = os.environ.get("GOOGLE_API_KEY")
-        if not api_key or api_key == "your-google-api-key-here":
-            pytest.skip("No valid GOOGLE_API_KEY found in environment")
-        return api_key
-    
-    @pytest.fixture
+    @pytest_asyncio.fixture(scope="session")
     async def trading_agent(self):
-        """Create a trading agent for testing."""
-        agent = TradingAgent(name="test_agent", initial_cash=100000.0)
-        yield agent
+        """Create one trading agent shared by the whole session."""
+        return TradingAgent(name="test_agent", initial_cash=100000.0)
     
+    @requires_api_key
     @pytest.mark.asyncio
-    async def test_agent_creation(self, api_key):
+    async def test_agent_creation(self):
         """Test that the trading agent can be created successfully."""
         agent = TradingAgent(name="test_agent", initial_cash=100000.0)
         assert agent is not None
         assert agent.name == "test_agent"
         assert agent.initial_cash == 100000.0
     
+    @requires_api_key
     @pytest.mark.asyncio
-    async def test_session_setup(self, trading_agent, api_key):
+    async def test_session_setup(self, trading_agent):
         """Test that a session can be set up successfully."""
         session_id = await trading_agent.setup_session()
         assert session_id is not None
@@ -56,51 +50,38 @@ class TestADKIntegration:
         assert hasattr(trading_agent, 'session_service')
         assert hasattr(trading_agent, 'runner')
     
-    def test_simple_backtest_function(self, trading_agent):
-        """Test the run_simple_backtest function directly."""
+    @pytest.mark.parametrize("strategy,params,expect_ok", [
+        ("sma", None, True),
+        ("sma", '{"short_period": 5, "long_period": 20}', True),
+        ("invalid_strategy", None, False),
+    ])
+    def test_simple_backtest(self, trading_agent, strategy, params, expect_ok):
+        """Test the run_simple_backtest function with and without parameters."""
+        kwargs = {} if params is None else {"strategy_params": params}
         result = trading_agent.run_simple_backtest(
-            strategy_name="sma",
+            strategy_name=strategy,
             start_date="2023-01-01",
-            end_date="2023-06-30"
+            end_date="2023-06-30",
+            **kwargs
         )
         
         assert isinstance(result, dict)
+        if not expect_ok:
+            # Should handle invalid strategy gracefully
+            assert 'error' in result or 'success' in result
+            return
+        
         assert 'success' in result
         assert 'final_value' in result
         assert 'total_return' in result
-        assert 'strategy' in result
-        assert result['strategy'] == 'sma'
-    
-    def test_simple_backtest_with_params(self, trading_agent):
-        """Test the run_simple_backtest function with strategy parameters."""
-        strategy_params = '{"short_period": 5, "long_period": 20}'
-        
-        result = trading_agent.run_simple_backtest(
-            strategy_name="sma",
-            start_date="2023-01-01",
-            end_date="2023-06-30",
-            strategy_params=strategy_params
-        )
-        
-        assert isinstance(result, dict)
-        assert 'success' in result
-        assert result['parameters']['short_period'] == 5
-        assert result['parameters']['long_period'] == 20
-    
-    def test_simple_backtest_invalid_strategy(self, trading_agent):
-        """Test the run_simple_backtest function with invalid strategy."""
-        result = trading_agent.run_simple_backtest(
-            strategy_name="invalid_strategy",
-            start_date="2023-01-01",
-            end_date="2023-06-30"
-        )
-        
-        assert isinstance(result, dict)
-        assert 'error' in result or 'success' in result
-        # Should handle invalid strategy gracefully
+        assert result['strategy'] == strategy
+        if params is not None:
+            assert result['parameters']['short_period'] == 5
+            assert result['parameters']['long_period'] == 20
     
+    @requires_api_key
     @pytest.mark.asyncio
-    async def test_agent_tools_registration(self, trading_agent, api_key):
+    async def test_agent_tools_registration(self, trading_agent):
         """Test that agent tools are properly registered."""
         # Check that the agent has the required tools
         assert hasattr(trading_agent, 'run_simple_backtest')
@@ -114,17 +95,13 @@ class TestADKIntegration:
         assert len(trading_agent.agent.tools) >= 4
 
 
+@requires_api_key
 async def test_agent_functionality():
     """Test the agent's basic functionality."""
     print("🧪 Testing ADK Agent Functionality")
     print("=" * 50)
     
-    # Check API key
-    api_key = os.environ.get("GOOGLE_API_KEY")
-    if not api_key or api_key == "your-google-api-key-here":
-        print("❌ No valid GOOGLE_API_KEY found")
-        return False
-    
+    api_key = os.environ["GOOGLE_API_KEY"]
     print(f"✅ API Key found: {api_key[:10]}...{api_key[-4:]}")
     
     try:
@@ -136,13 +113,14 @@ async def test_agent_functionality():
         session_id = await agent.setup_session()
         print(f"✅ Session created: {session_id}")
         
-        # Test simple backtest tool directly
-        print("\n📊 Testing run_simple_backtest function...")
-        result = agent.run_simple_backtest(
-            strategy_name="sma",
+        # Run all strategies as one batch on shared market data
+        print("\n📊 Testing run_backtests function...")
+        results = agent.run_backtests(
+            ['sma', 'rsi', 'bollinger'],
             start_date="2023-01-01",
             end_date="2023-06-30"
         )
+        result = results['sma']
         print(f"✅ Direct function call successful")
         print(f"   Strategy: {result.get('strategy', 'N/A')}")
         print(f"   Success: {result.get('success', False)}")
@@ -150,18 +128,13 @@ async def test_agent_functionality():
         print(f"   Return: {result.get('total_return', 0):.2%}")
         
         # Test with different strategies
-        strategies = ['rsi', 'bollinger']
-        for strategy in strategies:
+        for strategy in ['rsi', 'bollinger']:
             print(f"\n📈 Testing {strategy.upper()} strategy...")
-            try:
-                result = agent.run_simple_backtest(
-                    strategy_name=strategy,
-                    start_date="2023-01-01",
-                    end_date="2023-06-30"
-                )
+            result = results[strategy]
+            if result.get('success'):
                 print(f"   ✅ {strategy.upper()}: Return {result.get('total_return', 0):.2%}")
-            except Exception as e:
-                print(f"   ⚠️ {strategy.upper()}: {e}")
+            else:
+                print(f"   ⚠️ {strategy.upper()}: {result.get('error')}")
         
         # Test other tools
         print("\n🔍 Testing other agent tools...")
@@ -208,9 +181,10 @@ async def test_agent_functionality():
         return True
         
     except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ Test failed: {type(e).__name__}: {e}")
+        if os.environ.get("TEST_DEBUG"):
+            import traceback
+            traceback.print_exc()
         return False
 
 
@@ -267,10 +241,16 @@ if __name__ == "__main__":
         print("=" * 60)
         
         # Test basic agent functionality
-        agent_test_passed = await test_agent_functionality()
+        if has_google_api_key():
+            with buffered_section():
+                agent_test_passed = await test_agent_functionality()
+        else:
+            print("❌ No valid GOOGLE_API_KEY found")
+            agent_test_passed = False
         
         # Test Binance integration
-        binance_test_passed = test_binance_integration()
+        with buffered_section():
+            binance_test_passed = test_binance_integration()
         
         # Summary
         print("\n" + "=" * 60)
@@ -284,4 +264,10 @@ if __name__ == "__main__":
         else:
             print("\n⚠️ Some tests failed. Check the output above for details.")
     
-    asyncio.run(run_all_tests())
+    # uvloop's libuv loop speeds up ADK event streaming where available
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_all_tests())
+    else:
+        uvloop.run(run_all_tests())
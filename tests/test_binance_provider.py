@@ -6,41 +6,97 @@ Tests loading BTC/USDT data for backtesting and agent use.
 
 import os
 import sys
+import asyncio
+import pytest
 import pandas as pd
 from datetime import datetime, timedelta
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+# Add src and the project root (for the tests helpers) to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+bt = pytest.importorskip("backtrader")
+
+# Served from tests/fixtures/binance by default; '-m network' uses the live API
+pytestmark = pytest.mark.network
 
 from data.providers import DataProvider
-from data.loaders import BinanceLoader
+from tests._report import buffered_section
+
+
+class _MomentumTestStrategy(bt.Strategy):
+    """Buy after an up close, sell after a down close."""
+    
+    def __init__(self):
+        self.dataclose = self.datas[0].close
+        self.order = None
+        
+    def next(self):
+        if not self.position:
+            if self.dataclose[0] > self.dataclose[-1]:
+                self.order = self.buy()
+        else:
+            if self.dataclose[0] < self.dataclose[-1]:
+                self.order = self.sell()
 
 
-def test_binance_loader():
+async def _fetch_all(loader, intervals, symbol='BTCUSDT', limit=10):
+    """
+    Load klines for several intervals concurrently.
+    
+    Each blocking loader.load call runs in a worker thread so the HTTP
+    round-trips overlap instead of running back to back.
+    
+    Returns:
+        List of DataFrames or exceptions, in the order of intervals
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(loader.load, symbol, interval=interval, limit=limit)
+          for interval in intervals),
+        return_exceptions=True
+    )
+
+
+async def _fetch_symbol_overview(loader, symbol='BTCUSDT'):
+    """
+    Fetch the current price, 24hr ticker and symbol info concurrently.
+    
+    Returns:
+        (price, ticker, symbol_info) tuple
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(loader.get_price, symbol),
+        asyncio.to_thread(loader.get_24hr_ticker, symbol),
+        asyncio.to_thread(loader.get_symbol_info, symbol)
+    )
+
+
+@buffered_section()
+def test_binance_loader(data_provider, btc_daily):
     """Test the BinanceLoader directly."""
     print("=" * 60)
     print("Testing BinanceLoader")
     print("=" * 60)
     
     try:
-        # Initialize Binance loader (no API keys needed for public data)
-        loader = BinanceLoader()
+        # Reuse the provider's loader (no API keys needed for public data)
+        loader = data_provider.binance_loader
         print("✓ BinanceLoader initialized successfully")
         
+        # Fetch price, ticker and symbol info in one concurrent batch
+        current_price, ticker, symbol_info = asyncio.run(_fetch_symbol_overview(loader))
+        
         # Test getting current price
         print("\n1. Testing current price...")
-        current_price = loader.get_price('BTCUSDT')
         print(f"✓ Current BTC/USDT price: ${current_price:,.2f}")
         
         # Test getting 24hr ticker
         print("\n2. Testing 24hr ticker...")
-        ticker = loader.get_24hr_ticker('BTCUSDT')
         print(f"✓ 24hr change: {ticker['priceChangePercent']}%")
         print(f"✓ 24hr volume: {float(ticker['volume']):,.2f} BTC")
         
         # Test getting symbol info
         print("\n3. Testing symbol info...")
-        symbol_info = loader.get_symbol_info('BTCUSDT')
         print(f"✓ Symbol status: {symbol_info['status']}")
         print(f"✓ Base asset: {symbol_info['baseAsset']}")
         print(f"✓ Quote asset: {symbol_info['quoteAsset']}")
@@ -48,26 +104,27 @@ def test_binance_loader():
         # Test loading kline data - recent data (last 100 days)
         print("\n4. Testing kline data loading...")
         
-        # Load daily data
-        daily_data = loader.load('BTCUSDT', interval='1d', limit=100)
+        # Daily data is downloaded once by the btc_daily fixture
+        daily_data = btc_daily.data
         print(f"✓ Loaded {len(daily_data)} daily candles")
         print(f"✓ Date range: {daily_data['date'].min()} to {daily_data['date'].max()}")
         print(f"✓ Data shape: {daily_data.shape}")
-        print(f"✓ Columns: {list(daily_data.columns)}")
+        print(f"✓ Columns: {daily_data.columns.tolist()}")
         
         # Display sample data
         print("\nSample data (last 5 rows):")
-        print(daily_data.tail().to_string(index=False))
+        daily_data[['date', 'open', 'high', 'low', 'close', 'volume']].tail().to_csv(
+            sys.stdout, index=False, lineterminator='\n'
+        )
         
         # Test different intervals
         print("\n5. Testing different intervals...")
         intervals = ['1h', '4h', '1d', '1w']
-        for interval in intervals:
-            try:
-                data = loader.load('BTCUSDT', interval=interval, limit=10)
+        for interval, data in zip(intervals, asyncio.run(_fetch_all(loader, intervals))):
+            if isinstance(data, Exception):
+                print(f"✗ {interval}: Failed - {data}")
+            else:
                 print(f"✓ {interval}: {len(data)} candles loaded")
-            except Exception as e:
-                print(f"✗ {interval}: Failed - {e}")
         
         # Test with date range
         print("\n6. Testing with date range...")
@@ -89,25 +146,20 @@ def test_binance_loader():
         return None
 
 
-def test_data_provider():
+@buffered_section()
+def test_data_provider(data_provider, btc_daily):
     """Test the DataProvider with Binance integration."""
     print("\n" + "=" * 60)
     print("Testing DataProvider with Binance")
     print("=" * 60)
     
     try:
-        # Initialize data provider
-        provider = DataProvider()
+        provider = data_provider
         print("✓ DataProvider initialized successfully")
         
         # Test loading BTC/USDT data
         print("\n1. Loading BTC/USDT daily data...")
-        btc_feed = provider.load_binance(
-            symbol='BTCUSDT',
-            interval='1d',
-            limit=100,
-            name='BTC_daily'
-        )
+        btc_feed = btc_daily
         print(f"✓ Created data feed: {btc_feed.name}")
         print(f"✓ Data shape: {btc_feed.data.shape}")
         print(f"✓ Metadata: {btc_feed.metadata}")
@@ -158,39 +210,20 @@ def test_data_provider():
         return None
 
 
-def test_integration_with_backtrader():
+@buffered_section()
+def test_integration_with_backtrader(btc_daily):
     """Test integration with backtrader."""
     print("\n" + "=" * 60)
     print("Testing Backtrader Integration")
     print("=" * 60)
     
     try:
-        import backtrader as bt
-        
-        # Get data
-        provider = DataProvider()
-        btc_feed = provider.load_binance('BTCUSDT', interval='1d', limit=100)
-        
         # Convert to backtrader feed
-        bt_data = btc_feed.to_backtrader_feed()
-        
-        # Create a simple strategy for testing
-        class TestStrategy(bt.Strategy):
-            def __init__(self):
-                self.dataclose = self.datas[0].close
-                self.order = None
-                
-            def next(self):
-                if not self.position:
-                    if self.dataclose[0] > self.dataclose[-1]:
-                        self.order = self.buy()
-                else:
-                    if self.dataclose[0] < self.dataclose[-1]:
-                        self.order = self.sell()
+        bt_data = btc_daily.to_backtrader_feed()
         
         # Create cerebro instance
         cerebro = bt.Cerebro()
-        cerebro.addstrategy(TestStrategy)
+        cerebro.addstrategy(_MomentumTestStrategy)
         cerebro.adddata(bt_data)
         cerebro.broker.setcash(10000.0)
         
@@ -226,14 +259,22 @@ def main():
     print("🚀 Starting Binance Data Provider Tests")
     print("=" * 60)
     
+    # Download the daily candles once and share them across the tests
+    provider = DataProvider()
+    try:
+        btc_daily = provider.load_binance('BTCUSDT', interval='1d', limit=100, name='BTC_daily')
+    except Exception as e:
+        print(f"✗ Could not load BTC/USDT daily data: {e}")
+        return
+    
     # Test 1: BinanceLoader
-    daily_data = test_binance_loader()
+    daily_data = test_binance_loader(provider, btc_daily)
     
     # Test 2: DataProvider
-    feed = test_data_provider()
+    feed = test_data_provider(provider, btc_daily)
     
     # Test 3: Backtrader integration
-    test_integration_with_backtrader()
+    test_integration_with_backtrader(btc_daily)
     
     # Save sample data
     if daily_data is not None:
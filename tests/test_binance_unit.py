@@ -7,25 +7,49 @@ This module contains comprehensive tests for the Binance data provider implement
 """
 
 import unittest
-import sys
 import os
+import json
+import numpy as np
 import pandas as pd
+import backtrader as bt
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
-
-from data.loaders import BinanceLoader
-from data.providers import DataProvider, DataFeed
+from src.data.loaders import BinanceLoader
+from src.data.providers import DataProvider, DataFeed
 
 
 class TestBinanceLoader(unittest.TestCase):
     """Test cases for BinanceLoader."""
     
+    # Mock kline payload, built once and shared by every test
+    _MOCK_KLINES = (
+        (
+            1640995200000,  # Open time
+            "50000.00",     # Open
+            "51000.00",     # High
+            "49000.00",     # Low
+            "50500.00",     # Close
+            "100.5",        # Volume
+            1641081599999,  # Close time
+            "5050000.00",   # Quote asset volume
+            1000,           # Number of trades
+            "50.25",        # Taker buy base asset volume
+            "2525000.00",   # Taker buy quote asset volume
+            "0"             # Unused field
+        ),
+    )
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up one loader shared by the read-only tests."""
+        cls.loader = BinanceLoader()
+    
     def setUp(self):
-        """Set up test cases."""
-        self.loader = BinanceLoader()
+        """Patch requests.get once per test so nothing reaches the network."""
+        patcher = patch('requests.get')
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
     
     def test_initialization(self):
         """Test BinanceLoader initialization."""
@@ -44,50 +68,81 @@ class TestBinanceLoader(unittest.TestCase):
         """Test interval validation."""
         valid_intervals = ['1m', '3m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w', '1M']
         
-        for interval in valid_intervals:
-            # This should not raise an error
-            try:
-                # We'll mock the API call to avoid making real requests in tests
-                with patch.object(self.loader, '_make_request') as mock_request:
-                    mock_request.return_value = self._create_mock_kline_data()
+        # We'll mock the API call to avoid making real requests in tests
+        with patch.object(self.loader, '_make_request') as mock_request:
+            mock_request.return_value = self._create_mock_kline_data()
+            
+            for interval in valid_intervals:
+                with self.subTest(interval=interval):
+                    # This should not raise an error
                     result = self.loader.load('BTCUSDT', interval=interval, limit=10)
                     self.assertIsInstance(result, pd.DataFrame)
-            except ValueError:
-                self.fail(f"Valid interval {interval} raised ValueError")
-        
-        # Test invalid interval
-        with self.assertRaises(ValueError):
-            with patch.object(self.loader, '_make_request') as mock_request:
-                mock_request.return_value = self._create_mock_kline_data()
+            
+            # Test invalid interval
+            with self.assertRaises(ValueError):
                 self.loader.load('BTCUSDT', interval='invalid')
     
+    def test_kline_cache(self):
+        """Test closed historical ranges are cached on disk and open ranges are not."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            loader = BinanceLoader(cache_dir=cache_dir)
+            with patch.object(loader, '_make_request') as mock_request:
+                mock_request.return_value = self._create_mock_kline_data()
+
+                first = loader.load('BTCUSDT', start_time='2022-01-01', end_time='2022-01-31')
+                second = loader.load('BTCUSDT', start_time='2022-01-01', end_time='2022-01-31')
+                self.assertEqual(mock_request.call_count, 1)
+                pd.testing.assert_frame_equal(first, second)
+
+                loader.load('BTCUSDT', limit=10)
+                loader.load('BTCUSDT', limit=10)
+                self.assertEqual(mock_request.call_count, 3)
+
+                with patch.dict(os.environ, {'BINANCE_NO_CACHE': '1'}):
+                    loader.load('BTCUSDT', start_time='2022-01-01', end_time='2022-01-31')
+                self.assertEqual(mock_request.call_count, 4)
+
+    def test_response_cache(self):
+        """Test unsigned responses are reused from disk within the TTL."""
+        import tempfile
+
+        self.mock_get.return_value = self._mock_response({"symbol": "BTCUSDT", "price": "50000.00"})
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            loader = BinanceLoader(cache_dir=cache_dir, cache_ttl=60)
+            self.assertEqual(loader.get_price('BTCUSDT'), 50000.00)
+            self.assertEqual(loader.get_price('BTCUSDT'), 50000.00)
+            self.assertEqual(self.mock_get.call_count, 1)
+
+            loader.get_price('ETHUSDT')
+            self.assertEqual(self.mock_get.call_count, 2)
+
+            loader.cache_ttl = 0
+            loader.get_price('BTCUSDT')
+            self.assertEqual(self.mock_get.call_count, 3)
+
+            BinanceLoader(cache_dir=cache_dir).get_price('BTCUSDT')
+            self.assertEqual(self.mock_get.call_count, 4)
+
+    @staticmethod
+    def _mock_response(payload):
+        """Create a mock successful requests response carrying a JSON payload."""
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = payload
+        mock_response.content = json.dumps(payload).encode()
+        return mock_response
+    
     def _create_mock_kline_data(self):
-        """Create mock kline data for testing."""
-        return [
-            [
-                1640995200000,  # Open time
-                "50000.00",     # Open
-                "51000.00",     # High
-                "49000.00",     # Low
-                "50500.00",     # Close
-                "100.5",        # Volume
-                1641081599999,  # Close time
-                "5050000.00",   # Quote asset volume
-                1000,           # Number of trades
-                "50.25",        # Taker buy base asset volume
-                "2525000.00",   # Taker buy quote asset volume
-                "0"             # Unused field
-            ]
-        ]
+        """Return the mock kline payload (shared; load() does not mutate it)."""
+        return self._MOCK_KLINES
     
-    @patch('requests.get')
-    def test_load_method(self, mock_get):
+    def test_load_method(self):
         """Test the load method with mocked API response."""
         # Mock successful API response
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = self._create_mock_kline_data()
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = self._mock_response(self._create_mock_kline_data())
         
         # Test loading data
         result = self.loader.load('BTCUSDT', interval='1d', limit=1)
@@ -104,27 +159,20 @@ class TestBinanceLoader(unittest.TestCase):
         for col in ['open', 'high', 'low', 'close', 'volume']:
             self.assertTrue(pd.api.types.is_numeric_dtype(result[col]))
     
-    @patch('requests.get')
-    def test_get_price_method(self, mock_get):
+    def test_get_price_method(self):
         """Test the get_price method."""
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {"symbol": "BTCUSDT", "price": "50000.00"}
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = self._mock_response({"symbol": "BTCUSDT", "price": "50000.00"})
         
         price = self.loader.get_price('BTCUSDT')
         
         self.assertEqual(price, 50000.00)
         self.assertIsInstance(price, float)
     
-    @patch('requests.get')
-    def test_get_symbol_info_method(self, mock_get):
+    def test_get_symbol_info_method(self):
         """Test the get_symbol_info method."""
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = {
+        self.mock_get.return_value = self._mock_response({
             "symbols": [
                 {
                     "symbol": "BTCUSDT",
@@ -133,8 +181,7 @@ class TestBinanceLoader(unittest.TestCase):
                     "quoteAsset": "USDT"
                 }
             ]
-        }
-        mock_get.return_value = mock_response
+        })
         
         symbol_info = self.loader.get_symbol_info('BTCUSDT')
         
@@ -178,22 +225,125 @@ class TestBinanceLoader(unittest.TestCase):
 class TestDataProvider(unittest.TestCase):
     """Test cases for DataProvider with Binance integration."""
     
-    def setUp(self):
-        """Set up test cases."""
-        self.provider = DataProvider()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one provider shared by the read-only tests."""
+        cls.provider = DataProvider()
     
     def test_initialization(self):
         """Test DataProvider initialization."""
         # Test without API keys
-        provider = DataProvider()
-        self.assertIsNotNone(provider.binance_loader)
-        self.assertIsNone(provider.binance_loader.api_key)
+        self.assertIsNotNone(self.provider.binance_loader)
+        self.assertIsNone(self.provider.binance_loader.api_key)
         
         # Test with API keys
         provider_with_keys = DataProvider("test_key", "test_secret")
         self.assertEqual(provider_with_keys.binance_loader.api_key, "test_key")
         self.assertEqual(provider_with_keys.binance_loader.api_secret, "test_secret")
-    
+
+    def test_feed_cache_eviction(self):
+        """Test the feed cache evicts least recently used feeds over budget."""
+        feeds = {
+            name: self.provider.generate_synthetic(
+                start_date='2023-01-01', end_date='2023-01-10', seed=i, name=name
+            )
+            for i, name in enumerate(['a', 'b', 'c'])
+        }
+        feed_bytes = int(feeds['a'].data.memory_usage(deep=False).sum())
+        provider = DataProvider(cache_max_bytes=2 * feed_bytes)
+
+        provider.cache_feed('a', feeds['a'])
+        provider.cache_feed('b', feeds['b'])
+        provider.get_cached_feed('a')  # 'b' becomes least recently used
+        provider.cache_feed('c', feeds['c'])
+
+        self.assertListEqual(provider.list_cached_feeds(), ['a', 'c'])
+        self.assertIsNone(provider.get_cached_feed('b'))
+
+    def test_synthetic_seed_is_local(self):
+        """Test seeded synthetic data is reproducible and leaves the global RNG alone."""
+        np.random.seed(0)
+        expected_draw = np.random.random()
+
+        np.random.seed(0)
+        first = self.provider.generate_synthetic('2023-01-01', '2023-03-31', seed=7).data
+        second = self.provider.generate_synthetic('2023-01-01', '2023-03-31', seed=7).data
+
+        self.assertEqual(np.random.random(), expected_draw)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_fallback_feeds_batch(self):
+        """Test synthetic fallback feeds are generated reproducibly in one batch."""
+        pairs = ['BTCUSDT', 'ETHUSDT']
+        first = self.provider._generate_fallback_feeds(pairs, '2023-01-01', '2023-03-31')
+        second = self.provider._generate_fallback_feeds(pairs, '2023-01-01', '2023-03-31')
+
+        self.assertListEqual(list(first), pairs)
+        for pair in pairs:
+            self.assertEqual(first[pair].name, f"synthetic_{pair}")
+            self.assertEqual(len(first[pair].data), 90)
+            pd.testing.assert_frame_equal(first[pair].data, second[pair].data)
+        self.assertFalse(first['BTCUSDT'].data['close'].equals(first['ETHUSDT'].data['close']))
+
+    def test_load_binance_pairs_async_fallback(self):
+        """Test the async pair loader keeps order and falls back per failed pair."""
+        import asyncio
+        data = self.provider.generate_synthetic('2023-01-01', '2023-01-10', seed=1).data
+
+        def fake_load(symbol, **kwargs):
+            if symbol == 'ETHUSDT':
+                raise ValueError("unavailable")
+            return data
+
+        with patch.object(self.provider, 'binance_loader', MagicMock(load=fake_load)):
+            feeds = asyncio.run(self.provider.load_binance_pairs_async(
+                pairs=['BTCUSDT', 'ETHUSDT'], start_time='2023-01-01', end_time='2023-01-31'
+            ))
+
+        self.assertListEqual(list(feeds), ['BTCUSDT', 'ETHUSDT'])
+        self.assertEqual(feeds['BTCUSDT'].name, 'binance_BTCUSDT_1d')
+        self.assertEqual(feeds['ETHUSDT'].name, 'synthetic_ETHUSDT')
+
+    def test_load_multiple_mixed_sources(self):
+        """Test remote and local sources load together in configuration order."""
+        data = self.provider.generate_synthetic('2023-01-01', '2023-01-10', seed=1).data
+        loader = MagicMock(load=lambda symbol, **kwargs: data)
+
+        with patch.object(self.provider, 'binance_loader', loader):
+            feeds = self.provider.load_multiple({
+                'BTC': {'type': 'binance', 'symbol': 'BTCUSDT'},
+                'SYN': {'type': 'synthetic', 'start_date': '2023-01-01', 'end_date': '2023-01-10', 'seed': 1},
+                'ETH': {'type': 'binance', 'symbol': 'ETHUSDT'},
+            })
+
+        self.assertListEqual(list(feeds), ['BTC', 'SYN', 'ETH'])
+        self.assertEqual(feeds['ETH'].metadata['symbol'], 'ETHUSDT')
+        pd.testing.assert_frame_equal(feeds['SYN'].data, data)
+
+    def test_load_multiple_async(self):
+        """Test the async multi-source loader matches the sync one."""
+        import asyncio
+        data = self.provider.generate_synthetic('2023-01-01', '2023-01-10', seed=1).data
+        loader = MagicMock(load=lambda symbol, **kwargs: data)
+
+        def sources():
+            return {
+                'BTC': {'type': 'binance', 'symbol': 'BTCUSDT'},
+                'SYN': {'type': 'synthetic', 'start_date': '2023-01-01', 'end_date': '2023-01-10', 'seed': 1},
+                'ETH': {'type': 'binance', 'symbol': 'ETHUSDT'},
+            }
+
+        with patch.object(self.provider, 'binance_loader', loader):
+            feeds = asyncio.run(self.provider.load_multiple_async(sources()))
+            expected = self.provider.load_multiple(sources())
+
+        self.assertListEqual(list(feeds), list(expected))
+        for name in expected:
+            self.assertEqual(feeds[name].metadata, expected[name].metadata)
+            pd.testing.assert_frame_equal(feeds[name].data, expected[name].data)
+        with self.assertRaises(ValueError):
+            asyncio.run(self.provider.load_multiple_async({'X': {'type': 'ftp'}}))
+
     @patch('src.data.loaders.BinanceLoader.load')
     def test_load_binance_method(self, mock_load):
         """Test the load_binance method."""
@@ -257,16 +407,21 @@ class TestDataProvider(unittest.TestCase):
 class TestDataFeed(unittest.TestCase):
     """Test cases for DataFeed functionality with Binance data."""
     
-    def setUp(self):
-        """Set up test cases."""
-        self.sample_data = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only sample data once."""
+        i = np.arange(10)
+        cls.sample_data = pd.DataFrame({
             'date': pd.date_range('2022-01-01', periods=10),
-            'open': [50000 + i*100 for i in range(10)],
-            'high': [50500 + i*100 for i in range(10)],
-            'low': [49500 + i*100 for i in range(10)],
-            'close': [50200 + i*100 for i in range(10)],
-            'volume': [100 + i*10 for i in range(10)]
+            'open': 50000 + i*100,
+            'high': 50500 + i*100,
+            'low': 49500 + i*100,
+            'close': 50200 + i*100,
+            'volume': 100 + i*10
         })
+    
+    def setUp(self):
+        """Set up a fresh feed, as some tests replace its data."""
         self.feed = DataFeed(self.sample_data, "test_feed")
     
     def test_data_feed_creation(self):
@@ -279,7 +434,18 @@ class TestDataFeed(unittest.TestCase):
         """Test conversion to backtrader feed."""
         bt_feed = self.feed.to_backtrader_feed()
         self.assertIsNotNone(bt_feed)
-        # Note: We can't easily test backtrader internals without more setup
+
+        # Bars must match what backtrader's own PandasData feed produces
+        reference = bt.feeds.PandasData(dataname=self.sample_data.set_index('date'))
+        cerebro = bt.Cerebro(stdstats=False)
+        cerebro.adddata(bt_feed)
+        cerebro.adddata(reference)
+        cerebro.run()
+        for line in ('datetime', 'open', 'high', 'low', 'close', 'volume'):
+            self.assertEqual(
+                list(getattr(bt_feed.lines, line).get(size=10)),
+                list(getattr(reference.lines, line).get(size=10))
+            )
     
     def test_statistics(self):
         """Test statistics calculation."""
@@ -294,17 +460,40 @@ class TestDataFeed(unittest.TestCase):
         # Verify some values
         self.assertEqual(stats['data_info']['rows'], 10)
         self.assertGreater(stats['price_stats']['price_change_pct'], 0)  # Upward trend in test data
-    
+
+    def test_statistics_to_dict(self):
+        """Test statistics records expose attributes and convert to plain dicts."""
+        stats = self.feed.get_statistics()
+        as_dict = stats.to_dict()
+
+        self.assertIsInstance(as_dict['price_stats'], dict)
+        self.assertEqual(stats.data_info.rows, as_dict['data_info']['rows'])
+        self.assertEqual(stats.return_stats.sharpe_ratio, as_dict['return_stats']['sharpe_ratio'])
+        with self.assertRaises(KeyError):
+            stats['missing']
+
+    def test_statistics_cached(self):
+        """Test statistics are cached until invalidated or the data changes."""
+        stats = self.feed.get_statistics()
+        self.assertIs(self.feed.get_statistics(), stats)
+
+        self.feed.invalidate_stats()
+        self.assertIsNot(self.feed.get_statistics(), stats)
+
+        self.feed.data = self.sample_data.iloc[:5]
+        self.assertEqual(self.feed.get_statistics()['data_info']['rows'], 5)
+
     def test_resampling(self):
         """Test data resampling."""
         # Create data with more granular timestamps
+        i = np.arange(30)
         detailed_data = pd.DataFrame({
             'date': pd.date_range('2022-01-01', periods=30, freq='1h'),
-            'open': [50000 + i*10 for i in range(30)],
-            'high': [50050 + i*10 for i in range(30)],
-            'low': [49950 + i*10 for i in range(30)],
-            'close': [50020 + i*10 for i in range(30)],
-            'volume': [100 + i for i in range(30)]
+            'open': 50000 + i*10,
+            'high': 50050 + i*10,
+            'low': 49950 + i*10,
+            'close': 50020 + i*10,
+            'volume': 100 + i
         })
         
         detailed_feed = DataFeed(detailed_data, "detailed_test")
@@ -314,6 +503,53 @@ class TestDataFeed(unittest.TestCase):
         self.assertLess(len(resampled_feed.data), len(detailed_feed.data))
         self.assertEqual(resampled_feed.name, "detailed_test_1D")
 
+    def test_resampling_matches_pandas(self):
+        """Test fixed-length resampling agrees with pandas' resampler."""
+        i = np.arange(30)
+        detailed_data = pd.DataFrame({
+            'date': pd.date_range('2022-01-01 05:00', periods=30, freq='1h'),
+            'open': 50000 + i*10,
+            'high': 50050 + i*10,
+            'low': 49950 + i*10,
+            'close': 50020 + i*10,
+            'volume': 100 + i
+        }).drop(index=[6, 7, 8, 9])
+
+        resampled = DataFeed(detailed_data, "detailed_test").resample('4h').data
+
+        expected = detailed_data.set_index('date').resample('4h').agg({
+            'open': 'first',
+            'high': 'max',
+            'low': 'min',
+            'close': 'last',
+            'volume': 'sum'
+        }).dropna().reset_index()
+        pd.testing.assert_frame_equal(resampled, expected, check_dtype=False)
+
+    def test_weekly_resampling_matches_pandas(self):
+        """Test anchored weekly resampling agrees with pandas' resampler."""
+        i = np.arange(60)
+        detailed_data = pd.DataFrame({
+            'date': pd.date_range('2022-01-01 05:00', periods=60, freq='7h'),
+            'open': 50000 + i*10,
+            'high': 50050 + i*10,
+            'low': 49950 + i*10,
+            'close': 50020 + i*10,
+            'volume': 100 + i
+        }).drop(index=list(range(20, 45)))
+
+        for timeframe in ('1W', 'W-WED'):
+            resampled = DataFeed(detailed_data, "detailed_test").resample(timeframe).data
+
+            expected = detailed_data.set_index('date').resample(timeframe).agg({
+                'open': 'first',
+                'high': 'max',
+                'low': 'min',
+                'close': 'last',
+                'volume': 'sum'
+            }).dropna().reset_index()
+            pd.testing.assert_frame_equal(resampled, expected, check_dtype=False)
+
 
 def run_tests():
     """Run all tests."""
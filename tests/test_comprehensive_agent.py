@@ -8,13 +8,19 @@ it's fully compatible with the ADK framework.
 """
 
 import sys
-import os
-import inspect
-from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+EXPECTED_TOOLS = frozenset({
+    'create_strategy_backtest',
+    'compare_strategies',
+    'optimize_strategy_parameters',
+    'get_available_strategies'
+})
+
+
+def _is_optional(annotation: str) -> bool:
+    """Whether a manifest annotation admits None (Optional[X], X | None, ...)."""
+    return annotation.startswith(('Optional[', 'Union[')) or 'None' in annotation.split(' | ')
+
 
 def test_comprehensive_agent():
     """Perform comprehensive ADK agent tests."""
@@ -41,28 +47,20 @@ def test_comprehensive_agent():
         
         # Test 3: Tool signature validation
         print("3. Testing tool signatures for ADK compatibility...")
-        tool_names = []
-        for tool in root_agent.tools:
-            tool_names.append(tool.__name__)
-            sig = inspect.signature(tool)
-            
-            # Check for problematic type annotations
-            for param_name, param in sig.parameters.items():
-                if param.default is None and param.annotation != inspect.Parameter.empty:
-                    annotation_str = str(param.annotation)
-                    if 'Optional' not in annotation_str and 'Union' not in annotation_str:
-                        if not annotation_str.startswith('<class'):
-                            print(f"   ⚠️  Potential issue: {tool.__name__}.{param_name}")
+        from src.adk_agents.tool_manifest import build_tool_manifest, load_tool_manifest, manifest_digest
+        manifest = load_tool_manifest()
+        current = build_tool_manifest(root_agent)
+        assert manifest_digest(current) == manifest_digest(manifest), (
+            "Tool signatures changed; regenerate with `python -m src.adk_agents.tool_manifest`"
+        )
         
-        expected_tools = [
-            'create_strategy_backtest',
-            'compare_strategies',
-            'optimize_strategy_parameters',
-            'get_available_strategies'
-        ]
+        # A parameter defaulting to None should be annotated as Optional
+        for tool_name, signature in manifest.items():
+            for param_name, annotation, default_is_none in signature['params']:
+                if default_is_none and annotation and not _is_optional(annotation):
+                    print(f"   ⚠️  Potential issue: {tool_name}.{param_name}")
         
-        for expected in expected_tools:
-            assert expected in tool_names, f"Missing tool: {expected}"
+        assert manifest.keys() >= EXPECTED_TOOLS, f"Missing tools: {sorted(EXPECTED_TOOLS - manifest.keys())}"
         
         print("   ✅ All tool signatures are ADK-compatible")
         
@@ -6,24 +6,32 @@ This test specifically validates the modular architecture and ensures
 all components work correctly in isolation and together.
 """
 
-import sys
-import os
 import pytest
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from src.analyzers import PerformanceAnalyzer, TradeAnalyzer
+from src.backtesting import BacktestEngine, print_performance_summary
+from src.data.generators import generate_synthetic_data
+from src.data.loaders import load_csv_data
+from src.data.validators import validate_ohlcv_data
+from src.database import DatabaseManager
+from src.strategies import (
+    BaseStrategy,
+    SimpleMovingAverageStrategy,
+    RSIStrategy,
+    BollingerBandsStrategy,
+    BuyAndHoldStrategy,
+    MeanReversionStrategy,
+    MomentumStrategy
+)
+
+# Strategies and parameters shared by the backtest-running tests
+STRATEGY_CASES = [
+    pytest.param(SimpleMovingAverageStrategy, {'short_period': 5, 'long_period': 10}, id='sma'),
+    pytest.param(RSIStrategy, {'rsi_period': 10, 'rsi_oversold': 35, 'rsi_overbought': 65}, id='rsi')
+]
 
 def test_strategy_modules():
     """Test that all strategy modules can be imported and instantiated."""
-    from src.strategies import (
-        BaseStrategy,
-        SimpleMovingAverageStrategy,
-        RSIStrategy,
-        BollingerBandsStrategy,
-        BuyAndHoldStrategy,
-        MeanReversionStrategy,
-        MomentumStrategy
-    )
-    
     strategies = [
         SimpleMovingAverageStrategy,
         RSIStrategy,
@@ -40,23 +48,14 @@ def test_strategy_modules():
         assert issubclass(strategy_class, BaseStrategy), \
             f"{strategy_class.__name__} doesn't inherit from BaseStrategy"
 
-def test_data_modules():
+def test_data_modules(data_provider, synthetic_feed):
     """Test that all data modules work correctly."""
-    from src.data import DataProvider
-    from src.data.validators import validate_ohlcv_data
-    from src.data.generators import generate_synthetic_data
-    from src.data.loaders import load_csv_data
-    
     # Test data provider
-    provider = DataProvider()
+    provider = data_provider
     assert provider is not None
     
     # Test synthetic data generation
-    data_feed = provider.generate_synthetic(
-        start_date='2023-01-01',
-        end_date='2023-01-15',
-        seed=42
-    )
+    data_feed = synthetic_feed
     assert data_feed.name is not None
     assert len(data_feed.data) > 0
     
@@ -67,41 +66,21 @@ def test_data_modules():
     # Test validation
     validate_ohlcv_data(data_feed.data)  # Should not raise
 
-def test_backtesting_module():
+@pytest.mark.parametrize("strategy_class,params", STRATEGY_CASES)
+def test_backtesting_module(synthetic_feed, backtest_engine, strategy_class, params):
     """Test the backtesting engine module."""
-    from src.backtesting import BacktestEngine, print_performance_summary
-    from src.data import DataProvider
-    from src.strategies import SimpleMovingAverageStrategy
-    
-    # Create components
-    provider = DataProvider()
-    engine = BacktestEngine(initial_cash=10000)
-    
-    assert engine is not None
-    
-    # Generate test data
-    data_feed = provider.generate_synthetic(
-        start_date='2023-01-01',
-        end_date='2023-02-01',
-        seed=42
+    results = backtest_engine.run_backtest(
+        data_feed=synthetic_feed,
+        strategy_class=strategy_class,
+        strategy_params=params
     )
     
-    # Run backtest
-    results = engine.run_backtest(
-        data_feed=data_feed,
-        strategy_class=SimpleMovingAverageStrategy,
-        strategy_params={'short_period': 5, 'long_period': 10}
-    )
-    
-    assert 'strategy_name' in results
-    assert results['strategy_name'] is not None
+    assert results['strategy_name'] == strategy_class.__name__
 
 def test_database_module():
     """Test the database module."""
-    from src.database import DatabaseManager
-    
     # Create test database
-    db = DatabaseManager("test_modular.db")
+    db = DatabaseManager(":memory:")
     assert db is not None
     
     # Test saving results
@@ -129,51 +108,40 @@ def test_database_module():
     recent_results = db.get_backtest_results(limit=1)
     assert len(recent_results) >= 0
     
+    # Test saving a batch in one insert
+    batch = [
+        {**test_results, 'strategy_name': f'ModularTest{i}', 'final_cash': 10000 + i}
+        for i in range(100)
+    ]
+    backtest_ids = db.save_batch(batch)
+    assert len(backtest_ids) == 100
+    assert backtest_ids == list(range(backtest_id + 1, backtest_id + 101))
+    assert len(db.get_backtest_results(limit=200)) == 101
+    
     # Clean up
-    os.remove("test_modular.db")
+    db.close()
 
 def test_analyzers_module():
     """Test the analyzers module."""
-    from src.analyzers import PerformanceAnalyzer, TradeAnalyzer
-    
     # These are backtrader analyzers, so we can't easily test them
     # without a full backtrader setup, but we can at least verify import
     assert PerformanceAnalyzer is not None
     assert TradeAnalyzer is not None
 
-def test_integration():
+@pytest.mark.parametrize("strategy_class,params", STRATEGY_CASES)
+def test_integration(synthetic_feed, backtest_engine, memory_db, strategy_class, params):
     """Test that all modules work together."""
-    from src.data import DataProvider
-    from src.backtesting import BacktestEngine
-    from src.strategies import RSIStrategy
-    from src.database import DatabaseManager
-    
-    # Complete workflow test
-    provider = DataProvider()
-    engine = BacktestEngine(initial_cash=10000)
-    db = DatabaseManager("test_integration.db")
-    
-    # Generate data
-    data_feed = provider.generate_synthetic(
-        start_date='2023-01-01',
-        end_date='2023-01-31',
-        seed=42
-    )
-    
     # Run backtest
-    results = engine.run_backtest(
-        data_feed=data_feed,
-        strategy_class=RSIStrategy,
-        strategy_params={'rsi_period': 10, 'rsi_oversold': 35, 'rsi_overbought': 65}
+    results = backtest_engine.run_backtest(
+        data_feed=synthetic_feed,
+        strategy_class=strategy_class,
+        strategy_params=params
     )
     
     # Save results
-    backtest_id = engine.save_results(results, db)
+    backtest_id = backtest_engine.save_results(results, memory_db)
     
     assert backtest_id is not None
-    
-    # Clean up
-    os.remove("test_integration.db")
 
 
 if __name__ == "__main__":
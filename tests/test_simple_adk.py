@@ -21,7 +21,10 @@ try:
 except ImportError:
     print("Warning: python-dotenv not installed")
 
-from google.adk.agents import Agent
+import pytest
+
+# Skip collection cleanly when google-adk is not installed
+Agent = pytest.importorskip("google.adk.agents").Agent
 
 
 def simple_market_info() -> dict:
@@ -76,11 +79,12 @@ def get_trading_help() -> dict:
     }
 
 
-# Create a simple test agent
-simple_trading_agent = Agent(
-    name="simple_trading_helper",
-    description="Basic trading system helper and information provider",
-    instruction="""You are a helpful trading system assistant. 
+def _build_simple_agent():
+    """Create the simple test agent; deferred so collection skips ADK setup."""
+    return Agent(
+        name="simple_trading_helper",
+        description="Basic trading system helper and information provider",
+        instruction="""You are a helpful trading system assistant. 
 
 You can provide information about:
 - Available trading strategies and assets
@@ -89,15 +93,21 @@ You can provide information about:
 - Help with getting started
 
 When users ask for help, provide clear, actionable guidance about using the trading agents and their capabilities.""",
-    
-    tools=[
-        simple_market_info,
-        get_trading_help
-    ]
-)
+        
+        tools=[
+            simple_market_info,
+            get_trading_help
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def simple_trading_agent():
+    """Fixture that builds the simple test agent once per module."""
+    return _build_simple_agent()
 
 
-def test_simple_agent():
+def test_simple_agent(simple_trading_agent):
     """Test the simple agent setup."""
     print("🧪 Testing Simple ADK Agent Setup")
     print("=" * 40)
@@ -131,5 +141,5 @@ def test_simple_agent():
 
 
 if __name__ == "__main__":
-    success = test_simple_agent()
+    success = test_simple_agent(_build_simple_agent())
     sys.exit(0 if success else 1)
@@ -0,0 +1,63 @@
+"""
+Tests for the precomputed strategy signals.
+"""
+
+import numpy as np
+import backtrader as bt
+import pytest
+
+from src.strategies import BollingerBandsStrategy, RSIStrategy, SimpleMovingAverageStrategy
+from src.strategies.signals import bollinger_bands, rsi, sma_crossover
+
+
+class _IndicatorProbe(bt.Strategy):
+    """Records backtrader's own indicators for comparison."""
+
+    def __init__(self):
+        close = self.data.close
+        self.crossover = bt.indicators.CrossOver(
+            bt.indicators.SMA(close, period=5), bt.indicators.SMA(close, period=15)
+        )
+        self.rsi = bt.indicators.RSI(close, period=14)
+        self.bbands = bt.indicators.BollingerBands(close, period=20, devfactor=2.0)
+
+    def next(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def long_feed(data_provider):
+    return data_provider.generate_synthetic(
+        start_date='2020-01-01', end_date='2022-12-31', seed=3, volatility=0.03
+    )
+
+
+def test_signals_match_backtrader_indicators(long_feed):
+    """Test the compiled signals reproduce backtrader's indicator values."""
+    cerebro = bt.Cerebro()
+    cerebro.adddata(long_feed.to_backtrader_feed())
+    cerebro.addstrategy(_IndicatorProbe)
+    probe = cerebro.run()[0]
+    close = np.array(probe.data.close.array)
+
+    np.testing.assert_array_equal(sma_crossover(close, 5, 15), np.array(probe.crossover.array))
+    np.testing.assert_array_equal(rsi(close, 14), np.array(probe.rsi.array))
+    top, bot = bollinger_bands(close, 20, 2.0)
+    np.testing.assert_allclose(top, np.array(probe.bbands.top.array), rtol=1e-12)
+    np.testing.assert_allclose(bot, np.array(probe.bbands.bot.array), rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "strategy_class", [SimpleMovingAverageStrategy, RSIStrategy, BollingerBandsStrategy]
+)
+def test_strategies_same_without_preload(long_feed, strategy_class):
+    """Test the indicator fallback used without preloading trades the same."""
+    outcomes = []
+    for preload in (True, False):
+        cerebro = bt.Cerebro(preload=preload)
+        cerebro.adddata(long_feed.to_backtrader_feed())
+        cerebro.addstrategy(strategy_class)
+        strategy = cerebro.run()[0]
+        outcomes.append((cerebro.broker.getvalue(), strategy.trade_count))
+
+    assert outcomes[0] == outcomes[1]
@@ -5,12 +5,8 @@ Comprehensive Test Suite for Trading Backtesting System
 This test suite validates all aspects of the trading backtesting system using pytest.
 """
 
-import sys
 import os
 import pytest
-import tempfile
-
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 
 def test_basic_imports():
@@ -46,6 +42,19 @@ def test_data_utils():
     assert all(col in df.columns for col in required_columns), "Missing required columns"
 
 
+def test_generate_random_walk():
+    """Test the random walk is seeded, valid and never drops below the floor."""
+    from data_utils import generate_random_walk
+    
+    df = generate_random_walk(start_date='2023-01-01', end_date='2023-12-31', initial_price=1.0, step_size=5.0, seed=7)
+    
+    assert len(df) == 365
+    assert df['close'].iloc[0] == 1.0
+    assert df['close'].min() >= 0.01
+    assert ((df['open'] >= df['low']) & (df['open'] <= df['high'])).all()
+    assert df.equals(generate_random_walk(start_date='2023-01-01', end_date='2023-12-31', initial_price=1.0, step_size=5.0, seed=7))
+
+
 def test_strategy_imports():
     """Test strategy classes."""
     from trading_backtest import (
@@ -60,47 +69,319 @@ def test_strategy_imports():
     assert BollingerBandsStrategy is not None
 
 
-def test_database_functionality():
+def test_database_functionality(memory_db):
     """Test database functionality."""
-    from trading_backtest import DatabaseManager
-    
-    # Create database manager with temporary file
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
+    # Test data
+    test_results = {
+        'strategy_name': 'TestStrategy',
+        'start_date': '2023-01-01',
+        'end_date': '2023-01-31',
+        'initial_cash': 100000,
+        'final_cash': 105000,
+        'total_return': 5000,
+        'total_return_pct': 5.0,
+        'sharpe_ratio': 1.5,
+        'max_drawdown': -2000,
+        'max_drawdown_pct': -2.0,
+        'total_trades': 10,
+        'winning_trades': 6,
+        'losing_trades': 4,
+        'win_rate': 60.0,
+        'avg_trade_return': 500.0,
+        'strategy_params': {'test_param': 'test_value'},
+        'data_info': {'rows': 31}
+    }
     
-    try:
-        db = DatabaseManager(db_path)
-        
-        # Test data
-        test_results = {
-            'strategy_name': 'TestStrategy',
+    # Save to database
+    backtest_id = memory_db.save_backtest_result(test_results)
+    assert backtest_id is not None
+
+
+def test_database_rollback_on_error(memory_db):
+    """Test a failed save leaves no partial backtest or trade rows."""
+    db = memory_db
+
+    test_results = {
+        'strategy_name': 'TestStrategy',
+        'start_date': '2023-01-01',
+        'end_date': '2023-01-31',
+        'initial_cash': 100000,
+        'final_cash': 105000,
+        'total_return': 5000,
+        'total_return_pct': 5.0,
+        'trades': [{'entry_date': '2023-01-02'}]  # Missing trade fields
+    }
+
+    with pytest.raises(KeyError):
+        db.save_backtest_result(test_results)
+
+    assert db.get_backtest_results() == []
+
+
+def test_database_large_trade_batch(memory_db):
+    """Test trade lists spanning several multi-row inserts are saved in order."""
+    db = memory_db
+
+    trades = [
+        {
+            'entry_date': f'2023-01-01 00:{i // 60:02d}:{i % 60:02d}',
+            'exit_date': '2023-01-02',
+            'entry_price': 100.0 + i,
+            'exit_price': 101.0 + i,
+            'size': 1.0,
+            'pnl': 1.0,
+            'pnl_pct': 1.0,
+            'trade_duration': i
+        }
+        for i in range(250)
+    ]
+    backtest_id = db.save_backtest_result({
+        'strategy_name': 'TestStrategy',
+        'start_date': '2023-01-01',
+        'end_date': '2023-01-31',
+        'initial_cash': 100000,
+        'final_cash': 100250,
+        'total_return': 250,
+        'total_return_pct': 0.25,
+        'trades': trades
+    })
+
+    saved = db.get_trades(backtest_id)
+    assert len(saved) == 250
+    assert [t['trade_duration'] for t in saved] == list(range(250))
+
+
+def test_database_save_batch(memory_db):
+    """Test several results are saved in one call with their own trades."""
+    db = memory_db
+
+    results_list = [
+        {
+            'strategy_name': f'Strategy{i}',
+            'start_date': '2023-01-01',
+            'end_date': '2023-01-31',
+            'initial_cash': 100000,
+            'final_cash': 100000 + i,
+            'total_return': i,
+            'total_return_pct': i / 1000,
+            'trades': [
+                {
+                    'entry_date': '2023-01-02',
+                    'exit_date': '2023-01-03',
+                    'entry_price': 100.0,
+                    'exit_price': 101.0,
+                    'size': 1.0,
+                    'pnl': 1.0,
+                    'pnl_pct': 1.0,
+                    'trade_duration': 1
+                }
+            ] * i
+        }
+        for i in range(3)
+    ]
+
+    backtest_ids = db.save_batch(results_list)
+
+    assert len(backtest_ids) == 3
+    assert [len(db.get_trades(backtest_id)) for backtest_id in backtest_ids] == [0, 1, 2]
+
+
+def test_database_batch_writer(memory_db, synthetic_ohlcv_df):
+    """Test buffered results are saved in groups and flushed on exit."""
+    from trading_backtest import run_backtest, SimpleMovingAverageStrategy
+
+    results = {
+        'strategy_name': 'TestStrategy',
+        'start_date': '2023-01-01',
+        'end_date': '2023-01-31',
+        'initial_cash': 100000,
+        'final_cash': 105000,
+        'total_return': 5000,
+        'total_return_pct': 5.0,
+    }
+
+    with memory_db.batch_writer(size=2) as writer:
+        for _ in range(4):
+            writer.append(results)
+        assert len(writer.backtest_ids) == 4
+        assert writer.pending == []
+
+        run_backtest(
+            synthetic_ohlcv_df.copy(),
+            SimpleMovingAverageStrategy,
+            strategy_params={'short_period': 5, 'long_period': 15},
+            results_buffer=writer
+        )
+        assert len(writer.pending) == 1
+
+    assert len(writer.backtest_ids) == 5
+    saved = memory_db.get_backtest_results(limit=10)
+    assert len(saved) == 5
+    assert {row['strategy_name'] for row in saved} == {'TestStrategy', 'SimpleMovingAverageStrategy'}
+
+
+def test_run_backtest_vectorized(synthetic_ohlcv_df):
+    """Test the vectorized path prices trades from signals and is used when opted in."""
+    import numpy as np
+    from trading_backtest import run_backtest, run_backtest_vectorized, BuyAndHoldStrategy
+
+    close = synthetic_ohlcv_df['close'].to_numpy()
+
+    class FastBuyAndHold(BuyAndHoldStrategy):
+        __vectorizable__ = True
+
+    results = run_backtest(synthetic_ohlcv_df, FastBuyAndHold, commission=0.0, save_to_db=False)
+    assert results['strategy_name'] == 'FastBuyAndHold'
+    assert results['total_trades'] == 0
+    assert results['final_cash'] == pytest.approx(100000 * 0.05 + 100000 * 0.95 * close[-1] / close[0])
+
+    def round_trips(prices):
+        signals = np.zeros(len(prices))
+        signals[[2, 10]] = 1.0
+        signals[[6, 15]] = -1.0
+        return signals
+
+    results = run_backtest_vectorized(synthetic_ohlcv_df, round_trips, initial_cash=10000)
+    assert results['total_trades'] == 2
+    assert [t['entry_price'] for t in results['trades']] == [close[2], close[10]]
+    assert sum(t['pnl'] for t in results['trades']) == pytest.approx(results['total_return'])
+
+
+def test_run_backtests_parallel(synthetic_ohlcv_df):
+    """Test the process pool sweep matches sequential runs, in order."""
+    from trading_backtest import (
+        run_backtest,
+        run_backtests_parallel,
+        SimpleMovingAverageStrategy,
+        RSIStrategy
+    )
+
+    results = run_backtests_parallel(
+        synthetic_ohlcv_df,
+        [SimpleMovingAverageStrategy, RSIStrategy],
+        [{'short_period': [3, 5], 'long_period': [10]}, {}],
+        max_workers=2,
+        save_to_db=False
+    )
+
+    assert [r['strategy_name'] for r in results] == [
+        'SimpleMovingAverageStrategy', 'SimpleMovingAverageStrategy', 'RSIStrategy'
+    ]
+    expected = run_backtest(
+        synthetic_ohlcv_df.copy(),
+        SimpleMovingAverageStrategy,
+        strategy_params={'short_period': 5, 'long_period': 10},
+        save_to_db=False
+    )
+    assert results[1]['total_return_pct'] == expected['total_return_pct']
+    assert results[1]['total_trades'] == expected['total_trades']
+
+
+async def test_database_save_async(temp_db_file):
+    """Test concurrent async saves are serialized and all stored."""
+    import asyncio
+    from trading_backtest import DatabaseManager
+
+    db = DatabaseManager(str(temp_db_file))
+
+    results_list = [
+        {
+            'strategy_name': f'Strategy{i}',
             'start_date': '2023-01-01',
             'end_date': '2023-01-31',
             'initial_cash': 100000,
-            'final_cash': 105000,
-            'total_return': 5000,
-            'total_return_pct': 5.0,
-            'sharpe_ratio': 1.5,
-            'max_drawdown': -2000,
-            'max_drawdown_pct': -2.0,
-            'total_trades': 10,
-            'winning_trades': 6,
-            'losing_trades': 4,
-            'win_rate': 60.0,
-            'avg_trade_return': 500.0,
-            'strategy_params': {'test_param': 'test_value'},
-            'data_info': {'rows': 31}
+            'final_cash': 100000 + i,
+            'total_return': i,
+            'total_return_pct': i / 1000,
         }
-        
-        # Save to database
-        backtest_id = db.save_backtest_result(test_results)
-        assert backtest_id is not None
-        
-    finally:
-        # Clean up test database
-        if os.path.exists(db_path):
-            os.remove(db_path)
+        for i in range(5)
+    ]
+
+    backtest_ids = await asyncio.gather(
+        *(db.save_backtest_result_async(results) for results in results_list)
+    )
+
+    assert len(set(backtest_ids)) == 5
+    assert len(db.get_backtest_results(limit=10)) == 5
+    await db.close_async()
+
+
+async def test_database_in_memory():
+    """Test in-memory databases work for sync and async saves and can be shared by URI."""
+    from trading_backtest import DatabaseManager
+
+    results = {
+        'strategy_name': 'TestStrategy',
+        'start_date': '2023-01-01',
+        'end_date': '2023-01-31',
+        'initial_cash': 100000,
+        'final_cash': 105000,
+        'total_return': 5000,
+        'total_return_pct': 5.0,
+    }
+
+    db = DatabaseManager(":memory:")
+    db.save_backtest_result(results)
+    await db.save_backtest_result_async(results)
+    assert len(db.get_backtest_results()) == 2
+    await db.close_async()
+
+    uri = "file:test_database_in_memory?mode=memory&cache=shared"
+    writer = DatabaseManager(uri)
+    reader = DatabaseManager(uri)
+    await writer.save_backtest_result_async(results)
+    assert len(reader.get_backtest_results()) == 1
+    reader.close()
+    await writer.close_async()
+
+
+def test_database_fast_mode(temp_db_file):
+    """Test fast_mode skips WAL and fsyncs but still stores results."""
+    from trading_backtest import DatabaseManager
+
+    db = DatabaseManager(str(temp_db_file), fast_mode=True)
+    assert db._conn.execute('PRAGMA synchronous').fetchone()[0] == 0
+    assert db._conn.execute('PRAGMA journal_mode').fetchone()[0] == 'memory'
+
+    db.save_backtest_result({
+        'strategy_name': 'TestStrategy',
+        'start_date': '2023-01-01',
+        'end_date': '2023-01-31',
+        'initial_cash': 100000,
+        'final_cash': 105000,
+        'total_return': 5000,
+        'total_return_pct': 5.0,
+    })
+    db.close()
+
+    db = DatabaseManager(str(temp_db_file))
+    assert db._conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    assert len(db.get_backtest_results()) == 1
+    db.close()
+
+
+def test_database_init_cached_per_path(temp_db_file, monkeypatch):
+    """Test the schema setup runs once per file unless the file is recreated."""
+    from trading_backtest import DatabaseManager
+
+    db_path = str(temp_db_file)
+    DatabaseManager(db_path).close()
+
+    calls = []
+    original_init = DatabaseManager.init_database
+    monkeypatch.setattr(
+        DatabaseManager, 'init_database',
+        lambda self: (calls.append(self.db_path), original_init(self))
+    )
 
+    DatabaseManager(db_path).close()
+    assert calls == []
+
+    os.remove(db_path)
+    db = DatabaseManager(db_path)
+    assert calls == [db_path]
+    assert db.get_backtest_results() == []
+    db.close()
 
 def test_modular_structure():
     """Test that the new modular structure works."""
@@ -125,58 +406,29 @@ def test_backward_compatibility():
     assert generate_synthetic_data is not None
 
 
-def test_full_backtest_integration():
-    """Test complete backtesting workflow with both new and old APIs."""
-    # Test new modular API
-    from src.data import DataProvider
-    from src.backtesting import BacktestEngine
+def test_full_backtest_integration(synthetic_feed, synthetic_ohlcv_df, backtest_engine):
+    """Test the new and backward compatible APIs run the same backtest."""
     from src.strategies import SimpleMovingAverageStrategy
-    
-    provider = DataProvider()
-    data_feed = provider.generate_synthetic(
-        start_date='2023-01-01',
-        end_date='2023-03-31',
-        initial_price=100,
-        seed=42
-    )
-    
-    engine = BacktestEngine(initial_cash=10000)
-    results = engine.run_backtest(
-        data_feed=data_feed,
-        strategy_class=SimpleMovingAverageStrategy,
-        strategy_params={'short_period': 5, 'long_period': 15}
-    )
-    
-    # Validate new API results
-    assert 'strategy_name' in results
-    assert 'total_return_pct' in results
-    assert 'total_trades' in results
-    assert isinstance(results['total_return_pct'], (int, float))
-    
-    # Test backward compatibility API
     from trading_backtest import run_backtest
-    from data_utils import generate_synthetic_data
     
-    data = generate_synthetic_data(
-        start_date='2023-01-01',
-        end_date='2023-03-31',
-        initial_price=100,
-        seed=42
+    params = {'short_period': 5, 'long_period': 15}
+    results = backtest_engine.run_backtest(
+        data_feed=synthetic_feed,
+        strategy_class=SimpleMovingAverageStrategy,
+        strategy_params=params
     )
-    
     compat_results = run_backtest(
-        data=data,
+        data=synthetic_ohlcv_df.copy(),
         strategy_class=SimpleMovingAverageStrategy,
-        initial_cash=10000,
-        strategy_params={'short_period': 5, 'long_period': 15},
+        initial_cash=backtest_engine.initial_cash,
+        strategy_params=params,
         save_to_db=False
     )
     
-    # Validate backward compatibility results
-    assert 'strategy_name' in compat_results
-    assert 'total_return_pct' in compat_results
-    assert 'total_trades' in compat_results
-    assert isinstance(compat_results['total_return_pct'], (int, float))
+    for key in ('strategy_name', 'total_return_pct', 'total_trades'):
+        assert key in results
+        assert compat_results[key] == results[key]
+    assert isinstance(results['total_return_pct'], (int, float))
 
 
 if __name__ == "__main__":
@@ -71,6 +71,24 @@ class TestTradingAgent:
             assert 'total_return' in result
             assert 'strategy' in result
             
+    def test_run_backtests_shares_data(self):
+        """Test a strategy batch loads market data once for all strategies."""
+        agent = TradingAgent()
+        
+        with patch.object(agent, '_load_data', wraps=agent._load_data) as load_data:
+            results = agent.run_backtests(
+                ['sma', 'rsi', 'invalid_strategy'],
+                start_date="2022-01-01",
+                end_date="2022-06-30",
+                strategy_params={'sma': {"short_period": 5, "long_period": 20}}
+            )
+        
+        load_data.assert_called_once_with("2022-01-01", "2022-06-30")
+        assert list(results) == ['sma', 'rsi', 'invalid_strategy']
+        assert results['sma']['parameters'] == {"short_period": 5, "long_period": 20}
+        assert results['rsi']['success'] is True
+        assert 'error' in results['invalid_strategy']
+            
     def test_analyze_performance_no_results(self):
         """Test performance analysis without results."""
         agent = TradingAgent()
@@ -0,0 +1,63 @@
+"""
+Tests for the vectorized backtest kernels.
+"""
+
+import numpy as np
+import pytest
+
+from src.backtesting.vectorized import (
+    TRADE_DTYPE,
+    run_bollinger,
+    run_mean_reversion,
+    run_momentum,
+    run_signals,
+    sweep_mean_reversion,
+)
+
+
+@pytest.fixture
+def close():
+    rng = np.random.default_rng(7)
+    return 100 * np.cumprod(1 + rng.normal(0, 0.02, 750))
+
+
+def test_run_signals_stop_take_profit_and_exit():
+    """Test stop-loss, take-profit and signal exits in priority order."""
+    close = np.array([100.0, 94.0, 100.0, 111.0, 100.0, 101.0, 102.0])
+    entry = np.array([True, False, True, False, True, False, False])
+    exit_ = np.array([False, False, False, False, False, False, True])
+
+    trades = run_signals(close, entry, exit_, stop_loss=0.05, take_profit=0.10)
+
+    assert trades.dtype == TRADE_DTYPE
+    assert trades['entry_i'].tolist() == [0, 2, 4]
+    assert trades['exit_i'].tolist() == [1, 3, 6]
+    np.testing.assert_allclose(trades['pnl'], [-0.06, 0.11, 0.02])
+
+
+def test_strategies_produce_trades(close):
+    """Test each vectorized strategy runs and trades are ordered."""
+    for trades in (run_mean_reversion(close), run_momentum(close), run_bollinger(close)):
+        assert len(trades) > 0
+        assert np.all(trades['entry_i'] < trades['exit_i'])
+        assert np.all(trades['exit_i'][:-1] < trades['entry_i'][1:])
+
+
+def test_sweep_matches_single_runs(close):
+    """Test the parallel sweep agrees with individual runs."""
+    periods = [10, 20, 30]
+    thresholds = [0.01, 0.02, 0.04]
+
+    grid = sweep_mean_reversion(close, periods, thresholds)
+
+    assert grid.shape == (3, 3)
+    for i, period in enumerate(periods):
+        for j, threshold in enumerate(thresholds):
+            trades = run_mean_reversion(close, period=period, threshold=threshold)
+            assert grid[i, j] == pytest.approx(trades['pnl'].sum())
+
+
+def test_sweep_rejects_bad_periods(close):
+    """Test periods outside the data length are rejected."""
+    with pytest.raises(ValueError):
+        sweep_mean_reversion(close, [0], [0.02])
@@ -5,9 +5,12 @@ Backward Compatibility Layer
 This module provides backward compatibility for the old API while using the new modular structure.
 """
 
+import numpy as np
 import pandas as pd
 import backtrader as bt
-from typing import Dict, Any, Optional, Type
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Type
+import itertools
 import sys
 import os
 
@@ -38,18 +41,21 @@ def create_data_feed(df: pd.DataFrame) -> bt.feeds.PandasData:
     Create a backtrader data feed from a pandas DataFrame.
     
     Args:
-        df: DataFrame with columns ['date', 'open', 'high', 'low', 'close', 'volume']
+        df: DataFrame with columns ['date', 'open', 'high', 'low', 'close', 'volume'],
+            or the OHLCV columns indexed by date
         
     Returns:
         Backtrader data feed object
     """
-    # Ensure date column is datetime and set as index
-    df = df.copy()
-    df['date'] = pd.to_datetime(df['date'])
-    df.set_index('date', inplace=True)
+    # Index by date without copying the columns; the caller's frame is not
+    # modified. A frame already indexed by sorted dates is used as-is.
+    if 'date' in df.columns:
+        index = pd.DatetimeIndex(pd.to_datetime(df['date']), name='date')
+        df = df.drop(columns='date').set_axis(index, axis=0)
     
     # Sort by date
-    df.sort_index(inplace=True)
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
     
     # Create data feed
     data = bt.feeds.PandasData(
@@ -72,7 +78,9 @@ def run_backtest(
     initial_cash: float = 100000.0,
     commission: float = 0.001,
     strategy_params: Optional[Dict[str, Any]] = None,
-    save_to_db: bool = True
+    save_to_db: bool = True,
+    results_buffer: Optional[Any] = None,
+    vectorized: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Run a backtest with the specified parameters (backward compatibility function).
@@ -84,38 +92,254 @@ def run_backtest(
         commission: Commission rate (default 0.1%)
         strategy_params: Parameters to pass to strategy
         save_to_db: Whether to save results to database
+        results_buffer: Optional list or DatabaseManager.batch_writer() to
+            append the results to instead of saving them right away; for
+            sweeps that store many backtests in a few transactions
+        vectorized: Run the strategy's signals() through run_backtest_vectorized
+            instead of backtrader; defaults to the class's __vectorizable__ flag
         
     Returns:
         Dictionary containing backtest results
     """
     if not IMPORTS_SUCCESSFUL:
         raise ImportError("Required modules could not be imported. Please check your installation.")
+    
+    if vectorized is None:
+        vectorized = getattr(strategy_class, '__vectorizable__', False)
+    
+    if vectorized:
+        params = strategy_params or {}
+        results = run_backtest_vectorized(
+            data,
+            lambda close: strategy_class.signals(close, **params),
+            initial_cash=initial_cash,
+            commission=commission,
+            # Same share of the portfolio the event-driven strategy commits
+            exposure=getattr(strategy_class, '_SIZE_FRAC', 1.0),
+            strategy_name=strategy_class.__name__,
+            strategy_params=strategy_params
+        )
+    else:
+        # Create data provider and convert DataFrame to DataFeed
+        data_provider = DataProvider()
+        data_feed = data_provider.from_dataframe(data)
         
-    # Create data provider and convert DataFrame to DataFeed
-    data_provider = DataProvider()
-    data_feed = data_provider.from_dataframe(data)
-    
-    # Create and run backtest
-    engine = BacktestEngine(initial_cash=initial_cash, commission=commission)
-    results = engine.run_backtest(
-        data_feed=data_feed,
-        strategy_class=strategy_class,
-        strategy_params=strategy_params
-    )
+        # Create and run backtest
+        engine = BacktestEngine(initial_cash=initial_cash, commission=commission)
+        results = engine.run_backtest(
+            data_feed=data_feed,
+            strategy_class=strategy_class,
+            strategy_params=strategy_params
+        )
     
     # Save to database if requested
-    if save_to_db:
-        db_manager = DatabaseManager()
-        backtest_id = engine.save_results(results, db_manager)
+    if save_to_db and results_buffer is not None:
+        results_buffer.append(results)
+    elif save_to_db:
+        with DatabaseManager() as db_manager:
+            backtest_id = db_manager.save_backtest_result(results)
         results['backtest_id'] = backtest_id
         print(f"Results saved to database with ID: {backtest_id}")
     
     return results
 
 
+def run_backtest_vectorized(
+    data: pd.DataFrame,
+    signal_fn: Callable[[np.ndarray], np.ndarray],
+    initial_cash: float = 100000.0,
+    commission: float = 0.001,
+    exposure: float = 1.0,
+    strategy_name: str = 'VectorizedStrategy',
+    strategy_params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run a long-only backtest from a signal array, without backtrader's event loop.
+    
+    signal_fn maps the close prices to one value per bar: positive to buy at
+    that bar's close, negative to sell, zero to keep the current position.
+    Orders fill at the signal bar's close rather than the next open and no
+    stops are simulated, so results approximate the event-driven run_backtest.
+    
+    Args:
+        data: DataFrame with OHLCV data
+        signal_fn: Function from the close prices to the signal array
+        initial_cash: Starting cash amount
+        commission: Commission rate (default 0.1%)
+        exposure: Fraction of the portfolio held while in a position
+        strategy_name: Name recorded in the results
+        strategy_params: Parameters recorded in the results
+        
+    Returns:
+        Dictionary containing backtest results, with the keys of run_backtest
+    """
+    if not IMPORTS_SUCCESSFUL:
+        raise ImportError("Required modules could not be imported. Please check your installation.")
+    
+    data_feed = DataProvider().from_dataframe(data)
+    close = data_feed.data['close'].to_numpy(dtype=np.float64)
+    signals = np.asarray(signal_fn(close), dtype=np.float64)
+    n = close.shape[0]
+    
+    # Hold the direction of the last non-zero signal: long after a buy,
+    # flat after a sell or before the first signal
+    last = np.maximum.accumulate(np.where(signals != 0, np.arange(n), -1))
+    in_position = (last >= 0) & (signals[np.maximum(last, 0)] > 0)
+    changes = np.diff(in_position.astype(np.int8), prepend=np.int8(0))
+    entries = np.flatnonzero(changes == 1)
+    exits = np.flatnonzero(changes == -1)
+    
+    # Each trade buys exposure of the portfolio in shares at the entry close
+    # and sells them at the exit close, paying commission on both legs
+    closed = exits.shape[0]
+    factors = 1.0 + exposure * ((1.0 - commission) * close[exits] / close[entries[:closed]] - 1.0 - commission)
+    trade_values = initial_cash * np.concatenate(([1.0], np.cumprod(factors)))
+    
+    # Flat bars keep the value after the last exit; held bars mark the
+    # shares to the close
+    equity = trade_values[np.cumsum(changes == -1)]
+    held = np.flatnonzero(in_position)
+    trade_no = np.cumsum(changes == 1)[held] - 1
+    equity[held] = trade_values[trade_no] * (
+        1.0 - exposure * (1.0 + commission) + exposure * close[held] / close[entries[trade_no]]
+    )
+    
+    pnl = np.diff(trade_values)
+    sizes = exposure * trade_values[:closed] / close[entries[:closed]]
+    dates = pd.DatetimeIndex(data_feed.data['date'])
+    trades = [
+        {
+            'entry_date': dates[entry].strftime('%Y-%m-%d'),
+            'exit_date': dates[exit_].strftime('%Y-%m-%d'),
+            'entry_price': float(close[entry]),
+            'exit_price': float(close[exit_]),
+            'size': float(size),
+            'pnl': float(trade_pnl),
+            'pnl_pct': float(trade_pnl / (size * close[entry]) * 100),
+            'trade_duration': (dates[exit_] - dates[entry]).days
+        }
+        for entry, exit_, size, trade_pnl in zip(entries, exits, sizes, pnl)
+    ]
+    
+    peak = np.maximum.accumulate(equity)
+    final_value = float(equity[-1])
+    total_trades = len(trades)
+    winning_trades = int(np.count_nonzero(pnl > 0))
+    data_stats = data_feed.get_statistics()
+    
+    return {
+        'strategy_name': strategy_name,
+        'data_feed_name': data_feed.name,
+        'start_date': data_stats.data_info.start_date,
+        'end_date': data_stats.data_info.end_date,
+        'initial_cash': initial_cash,
+        'final_cash': final_value,
+        'total_return': final_value - initial_cash,
+        'total_return_pct': (final_value / initial_cash - 1) * 100,
+        'sharpe_ratio': None,
+        'max_drawdown': float((peak - equity).max()),
+        'max_drawdown_pct': float(((peak - equity) / peak).max() * 100),
+        'total_trades': total_trades,
+        'winning_trades': winning_trades,
+        'losing_trades': int(np.count_nonzero(pnl < 0)),
+        'win_rate': (winning_trades / total_trades * 100) if total_trades > 0 else 0,
+        'avg_trade_return': float(pnl.mean()) if total_trades > 0 else 0,
+        'strategy_params': strategy_params or {},
+        'data_info': data_stats.data_info.to_dict(),
+        'data_metadata': data_feed.metadata,
+        'trades': trades,
+        'commission': commission
+    }
+
+
+# DataFrame shared by the worker processes of run_backtests_parallel; set once
+# per worker by the pool initializer so jobs only carry their parameters.
+_worker_data: Optional[pd.DataFrame] = None
+
+
+def _init_worker(data: pd.DataFrame) -> None:
+    """Store the backtest data in a worker process."""
+    global _worker_data
+    _worker_data = data
+
+
+def _run_worker_backtest(job: tuple) -> Dict[str, Any]:
+    """Run one (strategy_class, strategy_params, initial_cash, commission) job."""
+    strategy_class, strategy_params, initial_cash, commission = job
+    return run_backtest(
+        data=_worker_data,
+        strategy_class=strategy_class,
+        initial_cash=initial_cash,
+        commission=commission,
+        strategy_params=strategy_params,
+        save_to_db=False
+    )
+
+
+def run_backtests_parallel(
+    data: pd.DataFrame,
+    strategy_classes: List[Type[bt.Strategy]],
+    param_grids: Optional[List[Dict[str, list]]] = None,
+    max_workers: Optional[int] = None,
+    initial_cash: float = 100000.0,
+    commission: float = 0.001,
+    save_to_db: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Run every strategy over its parameter grid in a pool of worker processes.
+    
+    The data is sent to each worker once, when the worker starts, rather than
+    with every job. Workers never touch the database; the parent saves all
+    results in a single transaction once the sweep has finished.
+    
+    Args:
+        data: DataFrame with OHLCV data
+        strategy_classes: Strategy classes to run
+        param_grids: One dictionary of parameter ranges per strategy class,
+            expanded to all combinations; None runs each class with its defaults
+        max_workers: Number of worker processes (default: CPU count)
+        initial_cash: Starting cash amount
+        commission: Commission rate (default 0.1%)
+        save_to_db: Whether to save results to database
+        
+    Returns:
+        List of backtest results, in strategy and parameter order
+    """
+    if not IMPORTS_SUCCESSFUL:
+        raise ImportError("Required modules could not be imported. Please check your installation.")
+    
+    if param_grids is None:
+        param_grids = [{}] * len(strategy_classes)
+    if len(param_grids) != len(strategy_classes):
+        raise ValueError("param_grids must have one entry per strategy class")
+    
+    jobs = []
+    for strategy_class, param_grid in zip(strategy_classes, param_grids):
+        keys = list(param_grid)
+        for values in itertools.product(*param_grid.values()):
+            params = dict(zip(keys, values)) or None
+            jobs.append((strategy_class, params, initial_cash, commission))
+    
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(data,)
+    ) as executor:
+        results_list = list(executor.map(_run_worker_backtest, jobs))
+    
+    if save_to_db and results_list:
+        with DatabaseManager() as db_manager:
+            backtest_ids = db_manager.save_batch(results_list)
+        for results, backtest_id in zip(results_list, backtest_ids):
+            results['backtest_id'] = backtest_id
+        print(f"Saved {len(backtest_ids)} results to database")
+    
+    return results_list
+
+
 if IMPORTS_SUCCESSFUL:
     __all__ = [
         'run_backtest',
+        'run_backtest_vectorized',
+        'run_backtests_parallel',
         'create_data_feed',
         'print_performance_summary',
         'DatabaseManager',
@@ -129,5 +353,7 @@ if IMPORTS_SUCCESSFUL:
 else:
     __all__ = [
         'run_backtest',
+        'run_backtest_vectorized',
+        'run_backtests_parallel',
         'create_data_feed'
     ]